@@ -2,7 +2,7 @@ from .disc import Disc
 from .discs import Discs
 from .environment import Environment
 from .equations_of_motion import EOM
-from .model import Model
+from .model import FrozenModel, Model
 from .throw_data import ThrowData
 
 __author__ = "Tom McClintock thmsmcclintock@gmail.com"
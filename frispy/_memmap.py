@@ -0,0 +1,68 @@
+"""
+Saving and memory mapping the large arrays of gridded inputs, shared by
+:class:`frispy.wind.GridWind` and :class:`frispy.terrain.Terrain`.
+"""
+
+import json
+from typing import Dict, Optional, Type, TypeVar
+
+import numpy as np
+
+T = TypeVar("T", bound="MemoryMapped")
+
+
+class MemoryMapped:
+    """
+    Mixin for a class built from one large array, held in the attribute
+    named by `_array`, and a few geometry values that are the other
+    arguments of its constructor.
+
+    :meth:`save` writes the array to an `.npy` file and the geometry next
+    to it, and :meth:`load` memory maps the array. A loaded instance is
+    pickled without its array and maps the file again when unpickled, so a
+    process pool shares the file through the page cache instead of copying
+    it to every worker.
+    """
+
+    # name of the attribute holding the array
+    _array: str
+    # the file the array is mapped from, if any
+    _path: Optional[str] = None
+
+    def _geometry(self) -> Dict:
+        """
+        Keyword arguments of the constructor other than the array, as JSON.
+        """
+        raise NotImplementedError
+
+    def save(self, path: str) -> None:
+        """
+        Write the array to `path`, an `.npy` file, and the geometry to
+        `path.json`.
+        """
+        np.save(path, np.asarray(getattr(self, self._array)))
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(self._geometry(), f)
+
+    @classmethod
+    def load(cls: Type[T], path: str) -> T:
+        """
+        Memory map an array written by :meth:`save`.
+        """
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            geometry = json.load(f)
+        instance = cls(np.load(path, mmap_mode="r"), **geometry)
+        instance._path = path
+        return instance
+
+    def __getstate__(self) -> Dict:
+        state = dict(self.__dict__)
+        if self._path is not None:
+            # workers map the file again rather than receiving a copy
+            state[self._array] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        if getattr(self, self._array) is None:
+            setattr(self, self._array, np.load(self._path, mmap_mode="r"))
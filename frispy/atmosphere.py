@@ -0,0 +1,102 @@
+"""
+Air density from the elevation, temperature and humidity of a course, as a
+function of the height of the disc.
+"""
+
+import functools
+import math
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+# International Standard Atmosphere
+SEA_LEVEL_PRESSURE = 101325.0  # Pa
+SEA_LEVEL_TEMPERATURE = 288.15  # K
+LAPSE_RATE = 0.0065  # K/m
+G = 9.80665  # m/s^2
+R = 8.314462618  # J/(mol K)
+MOLAR_MASS_DRY = 0.0289652  # kg/mol
+MOLAR_MASS_VAPOR = 0.018016  # kg/mol
+
+
+def saturation_vapor_pressure(temperature: float) -> float:
+    """
+    Saturation vapor pressure of water in Pa at a temperature in Celsius,
+    with the Magnus-Tetens formula.
+    """
+    return 610.78 * 10 ** (7.5 * temperature / (temperature + 237.3))
+
+
+@dataclass(frozen=True)
+class Atmosphere:
+    """
+    The air at a course. Temperature falls with height at the standard
+    lapse rate and the relative humidity is the same at every height.
+
+    Args:
+        elevation (float): height of the ground above sea level in m
+        temperature (float): air temperature at the ground in Celsius
+        humidity (float): relative humidity from 0 to 1
+        sea_level_pressure (float): Pa, the pressure at the ground follows
+            from it and the elevation
+    """
+
+    elevation: float = 0.0
+    temperature: float = 15.0
+    humidity: float = 0.0
+    sea_level_pressure: float = SEA_LEVEL_PRESSURE
+
+    def pressure(self, z: float) -> float:
+        """
+        Pressure in Pa at `z` meters above the ground.
+        """
+        exponent = G * MOLAR_MASS_DRY / (R * LAPSE_RATE)
+        ground = self.sea_level_pressure * (
+            1 - LAPSE_RATE * self.elevation / SEA_LEVEL_TEMPERATURE
+        ) ** exponent
+        kelvin = self.temperature + 273.15
+        return ground * (1 - LAPSE_RATE * z / kelvin) ** exponent
+
+    def density(self, z: float = 0.0) -> float:
+        """
+        Density of the humid air in kg/m^3 at `z` meters above the ground.
+        """
+        celsius = self.temperature - LAPSE_RATE * z
+        vapor = self.humidity * saturation_vapor_pressure(celsius)
+        dry = self.pressure(z) - vapor
+        return (dry * MOLAR_MASS_DRY + vapor * MOLAR_MASS_VAPOR) / (R * (celsius + 273.15))
+
+
+class DensityTable:
+    """
+    Air density sampled every `step` meters from `bottom` to `top` above the
+    ground and interpolated linearly in between, clamped outside.
+    """
+
+    def __init__(self, atmosphere: Atmosphere, bottom: float = -100.0, top: float = 400.0, step: float = 1.0):
+        self.heights = np.arange(bottom, top + step / 2, step)
+        self.densities = np.array([atmosphere.density(z) for z in self.heights])
+        self._bottom = bottom
+        self._step = step
+        self._last = len(self.heights) - 2
+        self._list: List[float] = self.densities.tolist()
+
+    def __call__(self, z: float) -> float:
+        x = (z - self._bottom) / self._step
+        i = min(max(int(math.floor(x)), 0), self._last)
+        f = min(max(x - i, 0.0), 1.0)
+        low = self._list[i]
+        return low + (self._list[i + 1] - low) * f
+
+    def array(self, z: np.ndarray) -> np.ndarray:
+        return np.interp(z, self.heights, self.densities)
+
+
+@functools.lru_cache(maxsize=256)
+def density_table(atmosphere: Atmosphere) -> DensityTable:
+    """
+    The density table of an atmosphere, shared by every flight in the same
+    conditions.
+    """
+    return DensityTable(atmosphere)
@@ -0,0 +1,135 @@
+"""
+How far the reduced model of :mod:`frispy.reduced` lands from the full
+equations of motion, for a typical disc of each class.
+"""
+
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from frispy.discs import Discs
+from frispy.integrators import Integrator
+from frispy.model import Model
+from frispy.reduced import REDUCED
+from frispy.throw import Throw
+
+# Flight numbers of a typical disc of each class, for :func:`calibrate`
+DISC_CLASSES: Dict[str, Dict[str, float]] = {
+    "putter": {"speed": 2, "glide": 3, "turn": 0, "fade": 1},
+    "midrange": {"speed": 5, "glide": 5, "turn": -1, "fade": 1},
+    "fairway": {"speed": 7, "glide": 5, "turn": -1, "fade": 2},
+    "driver": {"speed": 12, "glide": 5, "turn": -1, "fade": 3},
+}
+
+
+@dataclass
+class Calibration:
+    """
+    Error of the reduced model against the full model over a set of throws
+    of one disc class, as distances in m between the landing points.
+
+    Args:
+        throws (int): number of throws compared
+        mean_error (float): mean error of the throws without wobble
+        max_error (float): largest error of the throws without wobble
+        wobble_mean_error (float): mean error of the throws with wobble
+        wobble_max_error (float): largest error of the throws with wobble
+        speedup (float): wall time of the full model over the reduced one
+    """
+
+    throws: int
+    mean_error: float
+    max_error: float
+    wobble_mean_error: float
+    wobble_max_error: float
+    speedup: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def calibration_throws(speed: float) -> List[Throw]:
+    """
+    Throws for calibrating a disc of a speed rating: flat, hyzer and anhyzer
+    releases at the speed the disc is made for and a slower one, each
+    without wobble and with a wobble of 3% of the spin.
+    """
+    v = 12 + 1.5 * speed
+    throws = []
+    for velocity in (v, 0.75 * v):
+        spin = -velocity / 0.21 * 0.9
+        for hyzer, nose_up in ((0, 0), (15, -1), (-15, 1)):
+            for wobble in (0.0, 0.03):
+                throws.append(Throw(
+                    v=velocity, spin=spin, hyzer=hyzer, nose_up=nose_up, uphill=8,
+                    wx=spin * wobble, wy=-spin * wobble,
+                ))
+    return throws
+
+
+def _errors(errors: List[float]) -> Tuple[float, float]:
+    if not errors:
+        return math.nan, math.nan
+    return float(np.mean(errors)), float(np.max(errors))
+
+
+def calibrate(
+    models: Optional[Dict[str, Model]] = None,
+    throws: Optional[Callable[[Model], Sequence[Throw]]] = None,
+    integrator: Integrator = REDUCED,
+    reference: Union[Integrator, str] = "auto",
+    reference_options: Optional[Dict] = None,
+) -> Dict[str, Calibration]:
+    """
+    Compare the landing points of the reduced model with those of the full
+    model, for each disc class.
+
+    Args:
+        models (Dict[str, Model], optional): disc of each class, by default
+            the discs of :data:`DISC_CLASSES`
+        throws (Callable[[Model], Sequence[Throw]], optional): throws of a
+            disc, by default :func:`calibration_throws` of the speed of its
+            class, or of a fairway driver
+        integrator (Integrator): the reduced backend, :data:`REDUCED` or
+            :data:`WOBBLE_AVERAGED`
+        reference (Union[Integrator, str]): backend of the full model, by
+            default the one picked for each throw by
+            :func:`frispy.integrators.select_integrator`
+        reference_options (Dict, optional): solver options of `reference`
+
+    Returns:
+        (Dict[str, Calibration]) the errors of each class
+    """
+    if models is None:
+        models = {name: Discs.from_flight_numbers(numbers) for name, numbers in DISC_CLASSES.items()}
+    report = {}
+    for name, model in models.items():
+        if throws is not None:
+            flights = list(throws(model))
+        else:
+            flights = calibration_throws(DISC_CLASSES.get(name, DISC_CLASSES["fairway"])["speed"])
+        errors: Dict[bool, List[float]] = {False: [], True: []}
+        full_time = reduced_time = 0.0
+        for throw in flights:
+            disc = throw.disc(model)
+            start = time.perf_counter()
+            full = disc.compute_landing(integrator=reference, **(reference_options or {}))
+            full_time += time.perf_counter() - start
+            start = time.perf_counter()
+            fast = disc.compute_landing(integrator=integrator)
+            reduced_time += time.perf_counter() - start
+            errors[bool(throw.wx or throw.wy)].append(math.hypot(full.x - fast.x, full.y - fast.y))
+        mean_error, max_error = _errors(errors[False])
+        wobble_mean_error, wobble_max_error = _errors(errors[True])
+        report[name] = Calibration(
+            throws=len(flights),
+            mean_error=mean_error,
+            max_error=max_error,
+            wobble_mean_error=wobble_mean_error,
+            wobble_max_error=wobble_max_error,
+            speedup=full_time / reduced_time,
+        )
+    return report
@@ -1,14 +1,23 @@
 import math
 import logging
 import numpy as np
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
 
-from scipy.integrate import solve_ivp
 from scipy.spatial.transform import Rotation
 
 from frispy.environment import Environment
 from frispy.equations_of_motion import EOM
+from frispy.integrators import Integrator, ScipyIntegrator, select_integrator
 from frispy.model import Model
+from frispy.quality import quality_options
+from frispy.rollout import Ground, Rollout, compute_rollout
+from frispy.sensitivity import (
+    LandingSensitivity,
+    compute_landing_sensitivity,
+    initial_condition_sensitivity,
+)
+from frispy.terrain import hit_ground_event
 
 
 class FrisPyResults:
@@ -38,6 +47,7 @@ class FrisPyResults:
         "times",
         "v", # velocity vector [vx, vy, vz]
         "aoa",  # angle of attack
+        "obstacle",  # the obstacle the flight ended on, or None
     ]
 
     def __str__(self):
@@ -46,6 +56,23 @@ class FrisPyResults:
 
 
 
+@dataclass
+class Landing:
+    """
+    Where and when a flight ends, the full state of the disc then, the
+    highest point of the flight and the obstacle it hit, if any. `apex` is
+    the position (x, y, z) at the highest point.
+    """
+
+    x: float
+    y: float
+    time: float
+    state: np.ndarray
+    max_height: float = math.nan
+    obstacle: Optional[object] = None
+    apex: Optional[np.ndarray] = None
+
+
 class Disc:
     """Flying spinning disc object. The disc object contains only physical
     parameters of the disc and environment that it exists (e.g. gravitational
@@ -80,7 +107,13 @@ class Disc:
         self.set_default_initial_conditions(initial_conditions)
         self.reset_initial_conditions()
 
-    def compute_trajectory(self, flight_time: float = None, **solver_kwargs) -> FrisPyResults:
+    def compute_trajectory(
+        self,
+        flight_time: float = None,
+        integrator: Optional[Union[Integrator, str]] = None,
+        quality: Optional[str] = None,
+        **solver_kwargs,
+    ) -> FrisPyResults:
         """Call the differential equation solver to compute
         the trajectory. The kinematic variables and timesteps are saved
         as the `current_trajectory` attribute, which is a dictionary,
@@ -101,74 +134,231 @@ class Disc:
         Args:
           flight_time (float, optional): time in seconds that the simulation
             will run over. Default is 3 seconds.
+          integrator (Union[Integrator, str], optional): backend from
+            :mod:`frispy.integrators` used to solve the differential
+            equation, or `"auto"` to pick the backend and tolerances for
+            this throw with :func:`frispy.integrators.select_integrator`.
+            Default is :meth:`scipy.integrate.solver_ivp`.
+          quality (str, optional): `preview`, `standard` or `reference`, a
+            preset of :data:`frispy.quality.QUALITY_PRESETS` in place of
+            `integrator`; `solver_args` take precedence over its options
           solver_args (Dict[str, Any]): extra arguments to pass
-            to the :meth:`scipy.integrate.solver_ivp` method used to solve
-            the differential equation.
+            to the integrator, for the default these are the arguments of
+            :meth:`scipy.integrate.solver_ivp`. For the implicit methods
+            :meth:`EOM.jacobian` is passed as `jac` unless one is given.
         """
-        if "t_span" in solver_kwargs:
-            assert (
-                flight_time is None
-            ), "cannot have t_span in solver_kwargs if flight_time is not None"
-            t_span = solver_kwargs.pop("t_span")
-        else:
-            t_span = (0, flight_time or 15.0)
-
-        def hit_ground(t, y): return y[2]
-        hit_ground.terminal = True
-        result = solve_ivp(
-            fun=self.eom.compute_derivatives,
-            t_span=t_span,
-            y0=self.initial_conditions_as_ordered_list,
-            events=hit_ground,
-            **solver_kwargs,
-        )
+        if quality is not None:
+            assert integrator is None, "cannot have both an integrator and a quality"
+            integrator, options = quality_options(quality, self.initial_conditions)
+            options.update(solver_kwargs)
+            solver_kwargs = options
+        result = self._integrate(flight_time, integrator, solver_kwargs)
 
         try:
             # Create the results object
             fpr = FrisPyResults()
             fpr.times = result.t
+            fpr.obstacle = self._obstacle_hit(result)
             for i, key in enumerate(self.ordered_coordinate_names):
                 setattr(fpr, key, result.y[i])
-            n = len(result.t)
-            pos = [None] * n
-            rot = [None] * n
-            phi = [None] * n
-            theta = [None] * n
-            gamma = [None] * n
-            v = [None] * n
-            aoa = [None] * n
-            fpr.pos = pos
-            fpr.rot = rot
-            fpr.gamma = gamma
-            fpr.phi = phi
-            fpr.theta = theta
-            fpr.v = v
-            fpr.aoa = aoa
-            gamma_sum = 0
-            last_t = 0
-            for i, t in enumerate(result.t):
-                gamma_sum += fpr.dgamma[i] * (t - last_t)
-                last_t = t
-                gamma[i] = gamma_sum
-                r: Rotation = Rotation.from_quat([fpr.qx[i], fpr.qy[i], fpr.qz[i], fpr.qw[i]])
-                gamma_rot = Rotation.from_euler('Z', gamma_sum)
-                r = r * gamma_rot
-                rot[i] = r
-                euler = r.as_euler('zyx')
-                phi[i] = euler[2]
-                theta[i] = euler[1]
-                velocity = np.array([fpr.vx[i], fpr.vy[i], fpr.vz[i]])
-                position = [fpr.x[i], fpr.y[i], fpr.z[i]]
-                v[i] = velocity
-                pos[i] = position
-                angles = EOM.calculate_intermediate_quantities(r, velocity, [0, 0])
-                aoa[i] = angles["angle_of_attack"]
+            # gamma is integrated from the spin with one sided sums, from t = 0
+            gamma = np.cumsum(fpr.dgamma * np.diff(result.t, prepend=0.0))
+            quat = result.y[6:10].T
+            rotations = Rotation.from_quat(quat) * Rotation.from_euler("Z", gamma[:, None])
+            euler = rotations.as_euler("zyx")
+            velocity = result.y[3:6].T
+            # angle of attack as in EOM.calculate_intermediate_quantities
+            zhat = rotations.apply([0.0, 0.0, 1.0])
+            v_dot_zhat = np.einsum("ij,ij->i", velocity, zhat)
+            in_plane = np.linalg.norm(velocity - zhat * v_dot_zhat[:, None], axis=1)
+            planar = in_plane > math.ulp(1.0)
+            aoa = np.zeros(len(result.t))
+            aoa[planar] = -np.arctan(v_dot_zhat[planar] / in_plane[planar])
+            fpr.gamma = gamma.tolist()
+            fpr.rot = [rotations[i] for i in range(len(result.t))]
+            fpr.phi = euler[:, 2].tolist()
+            fpr.theta = euler[:, 1].tolist()
+            fpr.v = list(velocity)
+            fpr.pos = result.y[0:3].T.tolist()
+            fpr.aoa = aoa.tolist()
 
             return fpr
         except Exception as e:
             logging.error("failed to parse results of ivp e: %s result: %s", e, result)
             raise
 
+    def compute_landing(
+        self,
+        flight_time: float = None,
+        integrator: Optional[Union[Integrator, str]] = None,
+        **solver_kwargs,
+    ) -> "Landing":
+        """
+        Compute only where and when the disc lands. This skips building
+        the per time step results of :meth:`compute_trajectory`, which is
+        a large part of the cost of a flight when many flights are needed.
+
+        Args:
+          flight_time (float, optional): maximum time in seconds that the
+            simulation will run over. Default is 15 seconds.
+          integrator (Union[Integrator, str], optional): see
+            :meth:`compute_trajectory`
+          solver_args (Dict[str, Any]): extra arguments to pass
+            to the integrator
+
+        Returns:
+          (Landing) the final state of the disc
+        """
+        def apex(t, y): return y[5]
+        apex.direction = -1
+        result = self._integrate(flight_time, integrator, solver_kwargs, events=[apex])
+        state = result.y[:, -1]
+        apexes = np.vstack([result.y[:3, 0], np.reshape(result.y_events[1], (-1, len(state)))[:, :3]])
+        apex = apexes[np.argmax(apexes[:, 2])]
+        return Landing(
+            x=state[0],
+            y=state[1],
+            time=result.t[-1],
+            state=state,
+            max_height=float(apex[2]),
+            obstacle=self._obstacle_hit(result),
+            apex=apex,
+        )
+
+    def compute_rest(
+        self,
+        ground: Ground = Ground(),
+        flight_time: float = None,
+        integrator: Optional[Union[Integrator, str]] = None,
+        **solver_kwargs,
+    ) -> Rollout:
+        """
+        Compute where the disc comes to rest after it skips, slides or
+        rolls from its landing, see :func:`frispy.rollout.compute_rollout`.
+        The ground phase is closed form and costs far less than the flight.
+
+        Args:
+          ground (Ground): contact properties of the ground
+          flight_time (float, optional): see :meth:`compute_landing`
+          integrator (Union[Integrator, str], optional): see
+            :meth:`compute_trajectory`
+          solver_args (Dict[str, Any]): extra arguments to pass
+            to the integrator
+
+        Returns:
+          (Rollout) the rest position and the landing
+        """
+        landing = self.compute_landing(flight_time, integrator, **solver_kwargs)
+        return compute_rollout(landing, self.model, ground, self.environment.g, self.environment.terrain)
+
+    def _integrate(
+        self,
+        flight_time: Optional[float],
+        integrator: Optional[Union[Integrator, str]],
+        solver_kwargs: Dict,
+        events: Sequence = (),
+    ):
+        if "t_span" in solver_kwargs:
+            assert (
+                flight_time is None
+            ), "cannot have t_span in solver_kwargs if flight_time is not None"
+            t_span = solver_kwargs.pop("t_span")
+        else:
+            t_span = (0, flight_time or 15.0)
+
+        if integrator == "auto":
+            integrator, solver_kwargs = select_integrator(self.initial_conditions, self.environment, solver_kwargs)
+        integrator = integrator or ScipyIntegrator()
+
+        hit_ground = hit_ground_event(self.environment.terrain)
+        events = [hit_ground, *events]
+        obstacles = self.environment.obstacles
+        if obstacles is not None:
+            # last, see _obstacle_hit
+            events.append(obstacles.collision_event(clearance=self.model.diameter / 2))
+        return integrator.integrate(
+            self.eom,
+            t_span,
+            self.initial_conditions_as_ordered_list,
+            events=events,
+            **solver_kwargs,
+        )
+
+    def _obstacle_hit(self, result):
+        """
+        The obstacle that ended the flight of an integration result, or
+        None if it ended on the ground or in the air.
+        """
+        obstacles = self.environment.obstacles
+        if obstacles is None or result.status != 1 or len(result.t_events[-1]) == 0:
+            return None
+        if result.t_events[-1][0] > result.t[-1] + 1e-9:
+            # located in the same step as the landing, but after it
+            return None
+        x, y, z = result.y[:3, -1]
+        return obstacles.nearest(x, y, z)
+
+    def compute_landing_sensitivity(
+        self,
+        parameters: Sequence[str],
+        flight_time: float = None,
+        relative_step: float = 1e-7,
+        **solver_kwargs,
+    ) -> LandingSensitivity:
+        """
+        Compute where and when the disc lands together with the derivatives
+        of the landing x, y and time with respect to `parameters`, in a
+        single solve of the equations of motion augmented with their
+        variational equations. See :mod:`frispy.sensitivity`.
+
+        Args:
+          parameters (Sequence[str]): names of initial conditions as given
+            to the constructor (e.g. `vx`, `dgamma`, `hyzer`, `nose_up`) or
+            of model coefficients (e.g. `PD0`, `PTy0`)
+          flight_time (float, optional): maximum time in seconds that the
+            simulation will run over. Default is 15 seconds.
+          relative_step (float): finite difference step for each parameter
+            relative to its magnitude
+          solver_args (Dict[str, Any]): extra arguments to pass
+            to the :meth:`scipy.integrate.solver_ivp` method
+
+        Returns:
+          (LandingSensitivity) landing point and its derivatives
+        """
+        release = self.release_conditions
+        names = self.ordered_coordinate_names
+
+        def to_state(conditions: Dict[str, float]) -> List[float]:
+            ics = Disc.initial_conditions_from_release(conditions)
+            return [ics[key] for key in names]
+
+        dy0 = np.zeros((len(names), len(parameters)))
+        eoms = []
+        steps = []
+        for k, name in enumerate(parameters):
+            if name in self.model.coefficients:
+                value = self.model.get_value(name)
+                step = relative_step * max(abs(value), 1.0)
+                model = self.model.with_coefficients(**{name: value + step})
+                eoms.append(EOM(model=model, environment=self.environment))
+            else:
+                assert name in names or name in ("hyzer", "nose_up"), f"invalid parameter name {name}"
+                step = relative_step * max(abs(release.get(name, 0)), 1.0)
+                dy0[:, k] = initial_condition_sensitivity(to_state, release, name, step)
+                eoms.append(self.eom)
+            steps.append(step)
+
+        return compute_landing_sensitivity(
+            self.eom,
+            np.array(self.initial_conditions_as_ordered_list, dtype=float),
+            dy0,
+            eoms,
+            steps,
+            parameters,
+            (0, flight_time or 15.0),
+            **solver_kwargs,
+        )
+
     def reset_initial_conditions(self) -> None:
         """
         Set the initial_conditions of the disc to the default and
@@ -184,6 +374,17 @@ class Disc:
     def set_default_initial_conditions(
         self, initial_conditions: Optional[Dict[str, float]]
     ) -> None:
+        self._release_conditions = dict(initial_conditions or {})
+        self._default_initial_conditions = Disc.initial_conditions_from_release(initial_conditions)
+
+    @staticmethod
+    def initial_conditions_from_release(
+        initial_conditions: Optional[Dict[str, float]]
+    ) -> Dict[str, float]:
+        """
+        Convert the conditions a disc is constructed with, which may include
+        `hyzer` and `nose_up` in degrees, to values for all coordinates.
+        """
         base_ICs = {
             "x": 0,
             "y": 0,
@@ -222,7 +423,7 @@ class Disc:
         base_ICs["qy"] = quat[1]
         base_ICs["qz"] = quat[2]
         base_ICs["qw"] = quat[3]
-        self._default_initial_conditions = base_ICs
+        return base_ICs
 
     @property
     def ordered_coordinate_names(self) -> List[str]:
@@ -246,6 +447,13 @@ class Disc:
     def default_initial_conditions(self) -> Dict[str, float]:
         return self._default_initial_conditions
 
+    @property
+    def release_conditions(self) -> Dict[str, float]:
+        """
+        The initial conditions the disc was constructed with.
+        """
+        return self._release_conditions
+
     @property
     def initial_conditions_as_ordered_list(self) -> List:
         return [
@@ -1,39 +1,43 @@
 #  Copyright (c) 2021 John Carrino
 
+import functools
+import json
+import logging
 import math
-from typing import Optional, TypedDict
+import os
+import threading
+from typing import Dict, List, Optional, TypedDict
 
-from frispy.model import Model
+from frispy.model import FrozenModel, Model
+from frispy.tabulated import TabulatedModel
 
 MAX_GLIDE = 5
 
 # constants come from wind tunnel testing done by
 # check out "DYNAMICS AND PERFORMANCE OF FLYING DISCS" page 111
-class Discs:
+class _Registry(type):
+    """
+    Resolves `Discs.<mold>` attributes, e.g. `Discs.wraith`, through the
+    registry.
+    """
+
+    def __getattr__(cls, name: str) -> Model:
+        if not name.startswith("_"):
+            model = cls.get(name)
+            if model is not None:
+                return model
+        raise AttributeError(f"type object 'Discs' has no attribute or mold '{name}'")
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(cls.names()))
+
+
+class Discs(metaclass=_Registry):
     @staticmethod
     def from_string(name: str) -> Optional[Model]:
-        if name == "wraith":
-            return Discs.wraith
-        elif name == "ultrastar":
-            return Discs.ultrastar
-        elif name == "roc":
-            return Discs.roc
-        elif name == "flick":
-            return Discs.flick
-        elif name == "stable_wraith":
-            return Discs.stable_wraith
-        elif name == "flippy_destroyer":
-            return Discs.flippy_destroyer
-        elif name == "destroyer":
-            return Discs.destroyer
-        elif name == "stable_destroyer":
-            return Discs.stable_destroyer
-        elif name == "beefy_destroyer":
-            return Discs.beefy_destroyer
-        elif name == "xcal":
-            return Discs.xcal
-        else:
+        if not name:
             return None
+        return Discs.get(name)
 
     # drag based on speed. This is the minimum drag at 0 lift.  aka PD0
     @staticmethod
@@ -99,7 +103,11 @@ class Discs:
 
     @staticmethod
     # def from_flight_numbers(speed: float, glide: float, turn: float, fade: float, weight: float = 0.175) -> Model:
-    def from_flight_numbers(nums: FlightNumbers) -> Model:
+    def from_flight_numbers(nums: FlightNumbers) -> FrozenModel:
+        """
+        The model for a set of flight numbers. Models are cached by the
+        clamped numbers, so equal numbers return the same frozen instance.
+        """
         speed = float(nums["speed"])
         glide = float(nums["glide"])
         turn = float(nums["turn"])
@@ -116,6 +124,11 @@ class Discs:
         glide = min(6, glide)
         glide = max(0, glide)
 
+        return Discs._model_from_flight_numbers(speed, glide, turn, weight, fade)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _model_from_flight_numbers(speed: float, glide: float, turn: float, weight: float, fade) -> FrozenModel:
         cl0 = Discs.cl0FromGlide(glide)
         drag = Discs.drag_from_speed(speed)
         pitch0 = Discs.cm0_from_turn(turn)
@@ -124,7 +137,7 @@ class Discs:
         pitch = 0.3 # this value is not used in model.py
         rim_depth = 0.012
         rim_width = Model.rim_width_from_speed(speed)
-        return Model(**{
+        return FrozenModel(**{
             "PL0": cl0,  # lift factor at 0 AoA (depends on glide)
             "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
             "PD0": drag,  # drag at min lift
@@ -162,244 +175,110 @@ class Discs:
     # This corresponds to the rotational spindown
     # accel.x is a sine wave +/- 5 m/s^2  This is equal to the drag on the disc
 
+    # Molds live in data/molds.json, each with either "coefficients" for
+    # Model, "flight_numbers" for from_flight_numbers, or "polars", a CSV
+    # file of measured polars, and "coefficients" for TabulatedModel.
+    # Notes on the coefficients of the measured molds:
+    # PL0: lift factor at 0 AoA (depends on glide)
+    #   roc 0.053 glide 4, buzzz .1 glide 4, wraith .143 glide 5, aviar .152 glide 3
+    # PLa: lift factor linear with AoA (0.04 deg -> 2.29 rad) (mostly constant)
+    # CD0: drag at 0 AoA, PD0: drag at min lift (based on disc speed)
+    #   (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
+    #   destroyer PD0 0.035: keep dropping drag until destroyer can go 520ft at 70 mph
+    # PDa: quadratic with AoA from zero lift point (constant)
+    # PTy0: pitching moment from disc stability at 0 AoA (based on turn of disc,
+    #   also based on cavity of disc)
+    #   -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
+    # PTya: pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad)
+    #   (based on fade of disc) fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008
+    #   (per degree not per rad)
+    # PTxwx: dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
+    # PTzwz: spin down (constant) at 58mph spindown is about 24m/s^2
+    #   (3.5% (118.5 -> 114.5) over .82s)
+    # I_xx is much closer to 1/2 I_zz on the destroyer than the condor, height
+    #   is 2.2 vs 1.4. frequency of wobble for destroyer is .98 the rate of
+    #   rotation, this means that I_xx is about 1.01 * I_zz / 2
+    catalog_path: str = os.path.join(os.path.dirname(__file__), "data", "molds.json")
+    _molds: Optional[Dict[str, Dict]] = None
+    _models: Dict[str, Model] = {}
+    _mtime: Optional[float] = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def get(cls, name: str) -> Optional[Model]:
+        """
+        The model of a mold, built on first use and cached until the
+        catalog is reloaded. None if there is no such mold.
+        """
+        with cls._lock:
+            model = cls._models.get(name)
+            if model is None:
+                mold = cls._catalog().get(name)
+                if mold is None:
+                    return None
+                if "flight_numbers" in mold:
+                    model = Discs.from_flight_numbers(mold["flight_numbers"])
+                elif "polars" in mold:
+                    # CSV file relative to the catalog, see TabulatedModel.from_csv
+                    path = os.path.join(os.path.dirname(cls.catalog_path), mold["polars"])
+                    model = TabulatedModel.from_csv(path, **mold.get("coefficients", {}))
+                else:
+                    model = Model(**mold.get("coefficients", {}))
+                cls._models[name] = model
+            return model
+
+    @classmethod
+    def names(cls) -> List[str]:
+        with cls._lock:
+            return list(cls._catalog())
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> None:
+        """
+        Replace the catalog with the molds in a JSON file, by default
+        :attr:`catalog_path`. Models handed out before keep working.
+        """
+        path = path or cls.catalog_path
+        with open(path, "r", encoding="utf-8") as f:
+            molds = json.load(f)
+        with cls._lock:
+            cls.catalog_path = path
+            cls._molds = molds
+            cls._models = {}
+            cls._mtime = os.path.getmtime(path)
+
+    @classmethod
+    def reload(cls) -> None:
+        cls.load(cls.catalog_path)
+
+    @classmethod
+    def reload_if_changed(cls) -> bool:
+        """
+        Reload the catalog if its file changed since it was loaded. A file
+        that cannot be read, e.g. one saved half way, is logged and skipped
+        until it changes again, and the molds loaded before are kept.
+
+        Returns:
+            (bool) whether the catalog was replaced
+        """
+        with cls._lock:
+            try:
+                mtime = os.path.getmtime(cls.catalog_path)
+            except OSError as e:
+                logging.error("keeping the mold catalog, cannot stat %s: %s", cls.catalog_path, e)
+                return False
+            if cls._molds is not None and mtime == cls._mtime:
+                return False
+            try:
+                cls.reload()
+            except (OSError, ValueError) as e:
+                logging.error("keeping the mold catalog, failed to load %s: %s", cls.catalog_path, e)
+                cls._mtime = mtime
+                return False
+            return True
 
-    ultrastar: Model = Model()
-    #"PL0": 0.13,  # lift factor at 0 AoA
-    #"PLa": 2.7,  # lift factor linear with AoA
-    #"PD0": 0.08,  # drag at 0 lift
-    #"PDa": 1.9,  # quadratic with AoA from zero lift point
-    ## "PDa": 1.67, # golf discs have less drag per angle of attack;
-    #"PTy0": -0.02,  # pitching moment from disc stability at 0 AoA
-    #"PTya": 0.13,  # pitching moment from disc stability linear in AoA
-    #"PTxwx": -1.08e-3,  # dampening factor for roll
-    #"PTzwz": -3.4e-5,  # spin down
-    #"PTxwz": 0,  # rolling moment related to spin precession?
-    #"I_zz": 0.002352,
-    #"I_xx": 0.001219,
-    #"mass": 0.175,
-    #"diameter": 0.27,
-    #"rim_depth": 0.02,
-    #"rim_width": 0.007,
-    #"height": 0.032,
-
-    wraith: Model = Model(**{
-        "PL0": 0.143,  # lift factor at 0 AoA (depends on glide)
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "CD0": 0.055,  # drag at 0 AoA  (based on disc speed)
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.02,
-        # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.343,
-        # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTywy": -1.3e-2,  # dampening factor for pitch (constant)
-        "PTxwx": -1.3e-2,  # dampening factor for roll (constant)
-        "PTzwz": -3.4e-5,  # spin down (constant)
-        "I_xx": 6.183E-04,
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0215,
-        "height": 0.014,
-    })
-
-    stable_wraith: Model = Model(**{
-        "PL0": 0.143,  # lift factor at 0 AoA (depends on glide)
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "CD0": 0.055,  # drag at 0 AoA  (based on disc speed)
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.01, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.3,
-        # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -1.3e-2,  # dampening factor for roll (constant)
-        "PTzwz": -3.4e-5,  # spin down (constant)
-        "I_xx": 6.183E-04,
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0215,
-        "height": 0.014,
-    })
-
-    # -3 turn
-    flippy_destroyer: Model = Model(**{
-        "PL0": 0.16,  # lift factor at 0 AoA (depends on glide) 2 deg Aoa at 58 mph lift was about 8m/s^2   0.8g
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "PD0": 0.035, # keep dropping drag until destroyer can go 520ft at 70 mph
-        #"CD0": 0.042,  # drag at 0 AoA  (based on disc speed)  2 deg AoA at 58mph was about 21m/s^2 with wobble, but only 5 after wobble subsides
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.015, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.3, # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -6.0e-4,  # dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
-        "PTzwz": -2.1e-5,  # spin down (constant) at 58mph spindown is about 24m/s^2 (3.5% (118.5 -> 114.5) over .82s)
-        "I_xx": 6.263E-04 * 165/175, # I_xx is much closer to 1/2 on the destroyer than the condor, height is 2.2 vs 1.4
-        # frequency of wobble for destroyer is .98 the rate of rotation.
-        # this means that I_xx is about 1.01 * I_zz / 2
-        "I_zz": 1.231E-03 * 165/175,
-        "mass": 0.165,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0229,
-        "height": 0.014,
-    })
-
-    # -2 turn
-    destroyer: Model = Model(**{
-        "PL0": 0.16,  # lift factor at 0 AoA (depends on glide) 2 deg Aoa at 58 mph lift was about 8m/s^2   0.8g
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "PD0": 0.035, # keep dropping drag until destroyer can go 520ft at 70 mph
-        #"CD0": 0.042,  # drag at 0 AoA  (based on disc speed)  2 deg AoA at 58mph was about 21m/s^2 with wobble, but only 5 after wobble subsides
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.01, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.3, # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -6.0e-4,  # dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
-        "PTzwz": -2.1e-5,  # spin down (constant) at 58mph spindown is about 24m/s^2 (3.5% (118.5 -> 114.5) over .82s)
-        "I_xx": 6.263E-04, # I_xx is much closer to 1/2 on the destroyer than the condor, height is 2.2 vs 1.4
-        # frequency of wobble for destroyer is .98 the rate of rotation.
-        # this means that I_xx is about 1.01 * I_zz / 2
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0229,
-        "height": 0.014,
-    })
-
-    # -0.68 turn
-    stable_destroyer: Model = Model(**{
-        "PL0": 0.16,  # lift factor at 0 AoA (depends on glide) 2 deg Aoa at 58 mph lift was about 8m/s^2   0.8g
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "PD0": 0.035, # keep dropping drag until destroyer can go 520ft at 70 mph
-        #"CD0": 0.042,  # drag at 0 AoA  (based on disc speed)  2 deg AoA at 58mph was about 21m/s^2 with wobble, but only 5 after wobble subsides
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.0034, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.3, # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -6.0e-4,  # dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
-        "PTzwz": -2.1e-5,  # spin down (constant) at 58mph spindown is about 24m/s^2 (3.5% (118.5 -> 114.5) over .82s)
-        "I_xx": 6.263E-04, # I_xx is much closer to 1/2 on the destroyer than the condor, height is 2.2 vs 1.4
-        # frequency of wobble for destroyer is .98 the rate of rotation.
-        # this means that I_xx is about 1.01 * I_zz / 2
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0229,
-        "height": 0.014,
-    })
-
-    # beefy has less turn and more fade
-    # 0 turn
-    beefy_destroyer: Model = Model(**{
-        "PL0": 0.16,  # lift factor at 0 AoA (depends on glide) 2 deg Aoa at 58 mph lift was about 8m/s^2   0.8g
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "PD0": 0.035, # keep dropping drag until destroyer can go 520ft at 70 mph
-        #"CD0": 0.042,  # drag at 0 AoA  (based on disc speed)  2 deg AoA at 58mph was about 21m/s^2 with wobble, but only 5 after wobble subsides
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": 0, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.3, # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -6.0e-4,  # dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
-        "PTzwz": -2.1e-5,  # spin down (constant) at 58mph spindown is about 24m/s^2 (3.5% (118.5 -> 114.5) over .82s)
-        "I_xx": 6.263E-04, # I_xx is much closer to 1/2 on the destroyer than the condor, height is 2.2 vs 1.4
-        # frequency of wobble for destroyer is .98 the rate of rotation.
-        # this means that I_xx is about 1.01 * I_zz / 2
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0229,
-        "height": 0.014,
-    })
-
-    xcal: Model = Model(**{
-        "PL0": 0.16,  # lift factor at 0 AoA (depends on glide) 2 deg Aoa at 58 mph lift was about 8m/s^2   0.8g
-        "PLa": 2.29,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (constant)
-        "PD0": 0.035, # keep dropping drag until destroyer can go 520ft at 70 mph
-        #"CD0": 0.042,  # drag at 0 AoA  (based on disc speed)  2 deg AoA at 58mph was about 21m/s^2 with wobble, but only 5 after wobble subsides
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": 0.002, # pitching moment from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.35, # pitching moment from disc stability linear in AoA (0.006 / deg -> 0.343 / rad) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "PTxwx": -6.0e-4,  # dampening factor for wobble (constant) 21.5 -> 3.3 over 1s
-        "PTzwz": -2.1e-5,  # spin down (constant) at 58mph spindown is about 24m/s^2 (3.5% (118.5 -> 114.5) over .82s)
-        "I_xx": 6.263E-04, # I_xx is much closer to 1/2 on the destroyer than the condor, height is 2.2 vs 1.4
-        # frequency of wobble for destroyer is .98 the rate of rotation.
-        # this means that I_xx is about 1.01 * I_zz / 2
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.0229,
-        "height": 0.014,
-    })
-
-    roc: Model = Model(**{
-        "PL0": 0.053,  # lift factor at 0 AoA (depends on glide)
-        # roc 0.053 glide 4, buzzz .1 glide 4, wraith .143 glide 5, aviar .152 glide 3, flick
-        "PLa": 2.35,  # lift factor linear with AoA (0.04 deg -> 2.29 rad) (mostly constant, maybe dependent on glide)
-        "CD0": 0.067,  # drag at 0 angle of attack  (based on disc speed)
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.01,  # pitching from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.172,
-        # pitching moment from disc stability linear in AoA (0.008 / deg -> 0.172) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "I_xx": 7.086E-04,
-        "I_zz": 1.408E-03,
-        "mass": 0.180,
-        "diameter": 0.217,
-        "rim_depth": 0.013,
-        "rim_width": 0.012,
-        "height": 0.020,
-    })
-
-    flick: Model = Model(**{
-        "PL0": 0.05,  # lift factor at 0 AoA (depends on glide)
-        # roc 0.053 glide 4, buzzz .1 glide 4, wraith .143 glide 5, aviar .152 glide 3, flick
-        "PLa": 2.18,  # lift factor linear with AoA (0.038 deg -> 2.18 rad) (mostly constant, maybe dependent on glide)
-        "PD0": 0.04,  # drag at 0 lift
-        # (.055 at speed 11, .061 speed 5, .067 speed 4, .083 speed 2)
-        "PDa": 1.67,  # quadratic with AoA from zero lift point (constant)
-        "PTxwz": 0,  # rolling moment related to spin precession?
-        "PTy0": -0.0017,  # pitching from disc stability at 0 AoA (based on turn of disc, also based on cavity of disc)
-        # -0.02 turn -1, -0.007 turn 1, -0.033 turn -2, -0.015 turn 0  (per degree not per rad)
-        "PTya": 0.458,
-        # pitching moment from disc stability linear in AoA (0.008 / deg -> 0.172) (based on fade of disc)
-        # fade 0 0.002, fade 1 0.004, fade 3  0.006, fade 5 0.008  (per degree not per rad)
-        "I_xx": 6.183E-04,
-        "I_zz": 1.231E-03,
-        "mass": 0.175,
-        "diameter": 0.211,
-        "rim_depth": 0.012,
-        "rim_width": 0.023,
-        "height": 0.013,
-    })
+    @classmethod
+    def _catalog(cls) -> Dict[str, Dict]:
+        if cls._molds is None:
+            cls.load()
+        return cls._molds
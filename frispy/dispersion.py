@@ -0,0 +1,705 @@
+"""
+Monte Carlo dispersion of the landing point under uncertainty in the
+release: "where will 90% of these throws land?".
+"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.ndimage import gaussian_filter
+from scipy.special import ndtri
+from scipy.stats import qmc
+from scipy.stats import t as student_t
+
+from frispy.atmosphere import Atmosphere
+from frispy.integrators import Integrator
+from frispy.model import Model
+from frispy.parallel import WorkerPool
+from frispy.throw import Throw
+
+
+class Distribution(ABC):
+    """
+    Abstract distribution of one release parameter, defined by its inverse
+    cumulative distribution function so that any source of uniform numbers
+    can drive it.
+    """
+
+    @abstractmethod
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        """
+        Values at the quantiles `u` in (0, 1).
+        """
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return self.ppf(rng.random(n))
+
+
+@dataclass(frozen=True)
+class Normal(Distribution):
+    mean: float
+    std: float
+
+    def ppf(self, u):
+        return self.mean + self.std * ndtri(u)
+
+
+@dataclass(frozen=True)
+class Uniform(Distribution):
+    low: float
+    high: float
+
+    def ppf(self, u):
+        return self.low + (self.high - self.low) * np.asarray(u)
+
+
+Release = Dict[str, Union[float, Distribution]]
+
+
+class P2Quantile:
+    """
+    Streaming estimate of the `p` quantile with the P-square algorithm of
+    Jain and Chlamtac. It keeps five markers no matter how many values are
+    added.
+    """
+
+    def __init__(self, p: float):
+        self.p = p
+        self._initial: List[float] = []
+        self._heights = np.zeros(5)
+        self._positions = np.arange(5, dtype=float)
+        self._desired = np.array([0, 2 * p, 4 * p, 2 + 2 * p, 4])
+        self._increments = np.array([0, p / 2, p, (1 + p) / 2, 1])
+
+    def add(self, x: float) -> None:
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._heights = np.sort(self._initial)
+            return
+
+        q = self._heights
+        n = self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = int(np.searchsorted(q, x, side="right")) - 1
+        n[k + 1:] += 1
+        self._desired += self._increments
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = math.copysign(1, d)
+                # piecewise parabolic prediction, linear if it is not monotone
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    j = i + int(d)
+                    q[i] = q[i] + d * (q[j] - q[i]) / (n[j] - n[i])
+                n[i] += d
+
+    def value(self) -> float:
+        if len(self._initial) < 5:
+            if not self._initial:
+                return math.nan
+            return float(np.percentile(self._initial, 100 * self.p))
+        return float(self._heights[2])
+
+
+class LandingStatistics:
+    """
+    Running statistics of landing points. Memory use does not depend on the
+    number of flights: the mean and covariance of `(x, y)` are merged chunk
+    by chunk, and percentiles of the distance from the release point are
+    tracked with :class:`P2Quantile`.
+
+    Args:
+        percentiles (Sequence[float]): distance percentiles to track, in
+            percent
+    """
+
+    def __init__(self, percentiles: Sequence[float] = (10, 50, 90)):
+        self.count = 0
+        self.mean = np.zeros(2)
+        self.mean_time = 0.0
+        self._m2 = np.zeros((2, 2))
+        self._distance = {p: P2Quantile(p / 100) for p in percentiles}
+
+    def update(self, landings: np.ndarray) -> None:
+        """
+        Add a chunk of landings, an array with one row of (x, y, time) per
+        flight.
+        """
+        n = len(landings)
+        if n == 0:
+            return
+        points = landings[:, :2]
+        chunk_mean = points.mean(axis=0)
+        centered = points - chunk_mean
+        chunk_m2 = centered.T @ centered
+
+        # Chan et al. pairwise merge of mean and co-moment
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self._m2 += chunk_m2 + np.outer(delta, delta) * self.count * n / total
+        self.mean = self.mean + delta * n / total
+        self.mean_time += float(landings[:, 2].mean() - self.mean_time) * n / total
+        self.count = total
+
+        for distance in np.hypot(points[:, 0], points[:, 1]):
+            for estimator in self._distance.values():
+                estimator.add(distance)
+
+    @property
+    def covariance(self) -> np.ndarray:
+        if self.count < 2:
+            return np.full((2, 2), math.nan)
+        return self._m2 / (self.count - 1)
+
+    @property
+    def distance_percentiles(self) -> Dict[float, float]:
+        return {p: estimator.value() for p, estimator in self._distance.items()}
+
+    def ellipse(self, probability: float = 0.9) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Ellipse expected to hold `probability` of the landings, assuming
+        they are normally distributed.
+
+        Returns:
+            the center, the semi-axes (major first) in meters and the angle
+            of the major axis from the x axis in radians
+        """
+        # for a 2D normal the squared Mahalanobis distance is chi-square
+        # with 2 degrees of freedom: P(r^2 < k^2) = 1 - exp(-k^2 / 2)
+        k = math.sqrt(-2 * math.log(1 - probability))
+        values, vectors = np.linalg.eigh(self.covariance)
+        order = np.argsort(values)[::-1]
+        axes = k * np.sqrt(np.maximum(values[order], 0))
+        major = vectors[:, order[0]]
+        return self.mean.copy(), axes, math.atan2(major[1], major[0])
+
+    def as_dict(self) -> Dict:
+        """
+        JSON ready statistics; the covariance and ellipse are `None` below
+        two landings, where they are not defined.
+        """
+        if self.count < 2:
+            covariance = ellipse = None
+        else:
+            center, axes, angle = self.ellipse(0.9)
+            covariance = self.covariance.tolist()
+            ellipse = {"center": center.tolist(), "axes": axes.tolist(), "angle": angle}
+        return {
+            "count": self.count,
+            "mean": self.mean.tolist(),
+            "mean_time": self.mean_time,
+            "covariance": covariance,
+            "distance_percentiles": self.distance_percentiles,
+            "ellipse_90": ellipse,
+        }
+
+
+def sample_throws(release: Release, u: np.ndarray) -> List[Throw]:
+    """
+    Throws for the rows of `u`, uniform numbers with one column for each
+    parameter of `release` that is a :class:`Distribution`, in order.
+    """
+    # keep the normal tails finite when a quasi-random point is exactly 0
+    u = np.clip(u, 1e-12, 1 - 1e-12)
+    columns = {}
+    j = 0
+    for name, value in release.items():
+        if isinstance(value, Distribution):
+            columns[name] = value.ppf(u[:, j])
+            j += 1
+    throws = []
+    for i in range(len(u)):
+        values = {
+            name: float(columns[name][i]) if name in columns else value
+            for name, value in release.items()
+        }
+        throws.append(Throw(**values))
+    return throws
+
+
+def random_dimensions(release: Release) -> int:
+    return sum(isinstance(v, Distribution) for v in release.values())
+
+
+SAMPLERS = ("random", "sobol", "halton")
+
+
+def uniform_source(sampler: str, dimensions: int, seed=None) -> Callable[[int], np.ndarray]:
+    """
+    Function returning the next `n` points in the unit cube. `sobol` and
+    `halton` are scrambled low-discrepancy sequences, so independently
+    seeded sources are independent randomized quasi-Monte Carlo replicates.
+    Sobol points keep their balance when `n` is a power of two.
+    """
+    rng = np.random.default_rng(seed)
+    if sampler == "random":
+        return lambda n: rng.random((n, dimensions))
+    if sampler == "sobol":
+        return qmc.Sobol(dimensions, scramble=True, seed=rng).random
+    if sampler == "halton":
+        return qmc.Halton(dimensions, scramble=True, seed=rng).random
+    raise ValueError(f"Unknown sampler {sampler}, use one of {SAMPLERS}")
+
+
+@dataclass
+class DispersionEstimate:
+    """
+    Landing statistics with confidence intervals, from
+    :meth:`DispersionEngine.estimate`.
+
+    Args:
+        values (Dict[str, float]): mean `x`, `y` and `distance`, and the
+            distance percentiles `p10`, `p50`, ... in meters
+        half_widths (Dict[str, float]): half width of the confidence
+            interval of each value
+        confidence (float): confidence level of the intervals
+        flights (int): flights with the full model
+        control_flights (int): flights with the control variate backend
+        converged (bool): whether every half width reached the target
+    """
+
+    values: Dict[str, float]
+    half_widths: Dict[str, float]
+    confidence: float
+    flights: int
+    control_flights: int
+    converged: bool
+
+    def interval(self, name: str) -> Tuple[float, float]:
+        return self.values[name] - self.half_widths[name], self.values[name] + self.half_widths[name]
+
+    @property
+    def precision(self) -> float:
+        """
+        The widest half width.
+        """
+        return max(self.half_widths.values())
+
+    def as_dict(self) -> Dict:
+        return {
+            "values": self.values,
+            "half_widths": self.half_widths,
+            "confidence": self.confidence,
+            "flights": self.flights,
+            "control_flights": self.control_flights,
+            "converged": self.converged,
+        }
+
+
+class _Replicate:
+    """
+    Running sums of one randomized replicate: the landing (x, y, distance)
+    of the full model `f` and of the control `g`, and distance percentiles.
+    """
+
+    def __init__(self, percentiles: Sequence[float]):
+        self.n = 0
+        self.f = np.zeros(3)
+        self.g = np.zeros(3)
+        self.fg = np.zeros(3)
+        self.gg = np.zeros(3)
+        self.statistics = LandingStatistics(percentiles)
+
+    def add(self, f: np.ndarray, g: np.ndarray) -> None:
+        self.n += len(f)
+        self.f += f.sum(axis=0)
+        self.g += g.sum(axis=0)
+        self.fg += (f * g).sum(axis=0)
+        self.gg += (g * g).sum(axis=0)
+
+
+def _landing_values(landings: np.ndarray) -> np.ndarray:
+    return np.column_stack([landings[:, 0], landings[:, 1], np.hypot(landings[:, 0], landings[:, 1])])
+
+
+_worker = None
+
+
+def _init_worker(model, release, air_density, integrator, solver_kwargs, control_variate=None) -> None:
+    global _worker
+    _worker = (model, release, air_density, integrator, solver_kwargs, control_variate)
+
+
+def _fly(throws: Sequence[Throw], control: bool = False) -> np.ndarray:
+    model, _, air_density, integrator, solver_kwargs, control_variate = _worker
+    if control:
+        integrator, solver_kwargs = control_variate, {}
+    return _landings(model, throws, air_density, integrator, solver_kwargs)
+
+
+def _landings(model, throws, air_density, integrator, solver_kwargs, atmosphere=None) -> np.ndarray:
+    landings = np.empty((len(throws), 3))
+    for i, throw in enumerate(throws):
+        landing = throw.disc(model, air_density, atmosphere).compute_landing(
+            integrator=integrator, **solver_kwargs
+        )
+        landings[i] = landing.x, landing.y, landing.time
+    return landings
+
+
+def _fly_task(task: Tuple) -> np.ndarray:
+    return _landings(*task)
+
+
+def _fly_random_chunk(task: Tuple[np.random.SeedSequence, int]) -> np.ndarray:
+    seed, n = task
+    release = _worker[1]
+    u = np.random.default_rng(seed).random((n, random_dimensions(release)))
+    return _fly(sample_throws(release, u))
+
+
+def _fly_points(task: Tuple[np.ndarray, bool]) -> np.ndarray:
+    u, control = task
+    return _fly(sample_throws(_worker[1], u), control)
+
+
+def fly_landings(
+    model: Model,
+    throws: Sequence[Throw],
+    air_density: float = 1.225,
+    integrator: Union[Integrator, str] = "auto",
+    solver_kwargs: Optional[Dict] = None,
+    pool: Optional[WorkerPool] = None,
+    chunk_size: int = 16,
+    atmosphere: Optional[Atmosphere] = None,
+) -> np.ndarray:
+    """
+    Landing (x, y, time) of every throw, one row per throw. The model
+    travels with each chunk, so `pool` can be a long lived
+    :class:`WorkerPool` without an initializer that serves any disc. An
+    `atmosphere` replaces `air_density` as in :meth:`Throw.disc`.
+    """
+    solver_kwargs = solver_kwargs or {}
+    tasks = [
+        (model, throws[start:start + chunk_size], air_density, integrator, solver_kwargs, atmosphere)
+        for start in range(0, len(throws), chunk_size)
+    ]
+    if not tasks:
+        return np.empty((0, 3))
+    chunks = pool.map(_fly_task, tasks) if pool is not None else map(_fly_task, tasks)
+    return np.vstack(list(chunks))
+
+
+@dataclass
+class LandingDensity:
+    """
+    Landing density on a regular grid, see :func:`landing_density`.
+
+    Args:
+        x (np.ndarray): cell centers along x in meters
+        y (np.ndarray): cell centers along y in meters
+        density (np.ndarray): probability per square meter, indexed
+            `[j, i]` for `y[j]` and `x[i]`
+        levels (Dict[float, float]): density of the contour that encloses
+            each probability, the highest density region
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    density: np.ndarray
+    levels: Dict[float, float]
+
+    def as_dict(self) -> Dict:
+        return {
+            "x": self.x.tolist(),
+            "y": self.y.tolist(),
+            "density": self.density.tolist(),
+            "levels": {f"{p:g}": level for p, level in self.levels.items()},
+        }
+
+
+def landing_density(
+    points: np.ndarray,
+    grid_size: int = 64,
+    probabilities: Sequence[float] = (0.5, 0.9),
+    smoothing: float = 1.0,
+    padding: float = 0.15,
+) -> LandingDensity:
+    """
+    Smoothed histogram of landing points and the density levels of the
+    contours that enclose the given probabilities.
+
+    Args:
+        points (np.ndarray): landing (x, y), one row per flight
+        grid_size (int): cells along each axis
+        probabilities (Sequence[float]): in (0, 1)
+        smoothing (float): standard deviation of the Gaussian smoothing in
+            cells
+        padding (float): margin around the points as a fraction of their
+            extent
+
+    Returns:
+        LandingDensity
+    """
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    # at least a meter across so identical landings still make a grid
+    margin = np.maximum(padding * (high - low), 0.5)
+    low, high = low - margin, high + margin
+    counts, x_edges, y_edges = np.histogram2d(
+        points[:, 0], points[:, 1], bins=grid_size, range=[[low[0], high[0]], [low[1], high[1]]]
+    )
+    counts = gaussian_filter(counts.T, smoothing, mode="constant")
+    cell_area = (x_edges[1] - x_edges[0]) * (y_edges[1] - y_edges[0])
+    density = counts / (counts.sum() * cell_area)
+
+    # highest density region: the level where the densest cells add up to p
+    ordered = np.sort(density.ravel())[::-1]
+    mass = np.cumsum(ordered) * cell_area
+    levels = {
+        p: float(ordered[min(np.searchsorted(mass, p), len(ordered) - 1)])
+        for p in probabilities
+    }
+    return LandingDensity(
+        (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, density, levels
+    )
+
+
+class DispersionEngine:
+    """
+    Fly many throws with random release parameters and stream running
+    statistics of where they land.
+
+    Samples are generated and flown in chunks in a process pool. Only the
+    landing point of each flight is computed, and each chunk is folded into
+    :class:`LandingStatistics` and dropped, so memory use stays constant
+    however many samples are requested.
+
+    Args:
+        model (Model): the disc
+        release (Dict[str, Union[float, Distribution]]): value or
+            distribution for each field of :class:`Throw` (`v`, `spin`,
+            `hyzer`, `nose_up`, `uphill`, `wx`, `wy`, `z`, `wind_speed`,
+            `wind_angle`); `v` and `spin` are required
+        air_density (float): kg/m^3
+        integrator (Union[Integrator, str]): backend for every flight, by
+            default picked per throw with
+            :func:`frispy.integrators.select_integrator`
+        solver_kwargs (Dict, optional): passed to :meth:`Disc.compute_landing`
+        max_workers (int, optional): size of the process pool
+        chunk_size (int): flights per task
+        percentiles (Sequence[float]): distance percentiles to track
+        control_variate (Integrator, optional): a cheaper, correlated
+            backend used as a control variate by :meth:`estimate`, e.g.
+            loose tolerances when `integrator` is a reference setting, or
+            the reduced model :data:`frispy.reduced.REDUCED`
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        release: Release,
+        air_density: float = 1.225,
+        integrator: Union[Integrator, str] = "auto",
+        solver_kwargs: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 32,
+        percentiles: Sequence[float] = (10, 50, 90),
+        control_variate: Optional[Integrator] = None,
+    ):
+        assert "v" in release and "spin" in release, "release needs v and spin"
+        self._release = dict(release)
+        self._chunk_size = chunk_size
+        self._percentiles = percentiles
+        self._control_variate = control_variate
+        self._pool = WorkerPool(
+            max_workers,
+            initializer=_init_worker,
+            initargs=(model, self._release, air_density, integrator, solver_kwargs or {}, control_variate),
+        )
+
+    @property
+    def release(self) -> Release:
+        return self._release
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> "DispersionEngine":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def stream(self, samples: int, seed: Optional[int] = None) -> Iterator[LandingStatistics]:
+        """
+        Fly `samples` random throws, yielding the statistics after every
+        chunk. The same :class:`LandingStatistics` object is updated in
+        place and yielded each time.
+        """
+        statistics = LandingStatistics(self._percentiles)
+        sizes = [self._chunk_size] * (samples // self._chunk_size)
+        if samples % self._chunk_size:
+            sizes.append(samples % self._chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = list(zip(seeds, sizes))
+        for landings in self._map_windowed(_fly_random_chunk, tasks):
+            statistics.update(landings)
+            yield statistics
+
+    def run(self, samples: int, seed: Optional[int] = None) -> LandingStatistics:
+        """
+        Fly `samples` random throws and return the final statistics.
+        """
+        statistics = LandingStatistics(self._percentiles)
+        for statistics in self.stream(samples, seed):
+            pass
+        return statistics
+
+    def estimate(
+        self,
+        target_precision: Optional[float] = None,
+        max_flights: int = 4096,
+        sampler: str = "sobol",
+        replicates: int = 8,
+        initial_samples: int = 16,
+        antithetic: bool = False,
+        control_ratio: int = 4,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+    ) -> DispersionEstimate:
+        """
+        Estimate the mean landing point and distance and the distance
+        percentiles with confidence intervals, stopping as soon as every
+        interval is narrower than `target_precision`.
+
+        The flights are split into `replicates` independently randomized
+        streams of `sampler` points. Each round doubles the points of every
+        stream and the intervals come from the spread between the streams,
+        which is valid for quasi-random points where the usual standard
+        error is not.
+
+        With `antithetic` every point `u` is flown together with `1 - u`
+        and the mean of the pair is one sample of the means. If the engine
+        has a `control_variate` backend, each point is also flown with it
+        and the means are corrected by the difference between its sample
+        mean and its mean over `control_ratio` times as many points of
+        their own. Percentiles use every full model flight and no control.
+
+        Args:
+            target_precision (float, optional): half width in meters at
+                which to stop; if not given `max_flights` are flown
+            max_flights (int): budget of full model flights, the first
+                round is always flown
+            sampler (str): `random`, `sobol` or `halton`
+            replicates (int): number of randomized streams, at least 2
+            initial_samples (int): points per stream in the first round
+            antithetic (bool): fly antithetic pairs
+            control_ratio (int): control flights per point for the mean of
+                the control variate
+            confidence (float): confidence level of the intervals
+            seed (int, optional): seed of the randomization
+
+        Returns:
+            DispersionEstimate
+        """
+        assert replicates >= 2, "confidence intervals need two replicates"
+        dimensions = random_dimensions(self._release)
+        control = self._control_variate is not None
+        seeds = np.random.SeedSequence(seed).spawn(2 * replicates)
+        sources = [uniform_source(sampler, dimensions, s) for s in seeds[:replicates]]
+        control_sources = [uniform_source(sampler, dimensions, s) for s in seeds[replicates:]]
+        streams = [_Replicate(self._percentiles) for _ in range(replicates)]
+        control_sums = np.zeros((replicates, 3))
+        control_count = 0
+        flights = control_flights = 0
+        pair = 2 if antithetic else 1
+        n = initial_samples
+        while True:
+            points = [source(n) for source in sources]
+            if antithetic:
+                points = [np.vstack([u, 1 - u]) for u in points]
+            full = self._fly_blocks(points, control=False)
+            flights += sum(map(len, points))
+            if control:
+                cheap = self._fly_blocks(points, control=True)
+                means = self._fly_blocks([source(control_ratio * n) for source in control_sources], control=True)
+                control_sums += [_landing_values(g).sum(axis=0) for g in means]
+                control_count += control_ratio * n
+                control_flights += sum(map(len, points)) + replicates * control_ratio * n
+            for r, stream in enumerate(streams):
+                stream.statistics.update(full[r])
+                f = _landing_values(full[r])
+                g = _landing_values(cheap[r]) if control else np.zeros_like(f)
+                # the mean of an antithetic pair is one sample
+                f = f.reshape(pair, n, 3).mean(axis=0)
+                g = g.reshape(pair, n, 3).mean(axis=0)
+                stream.add(f, g)
+
+            values, half_widths = self._confidence_intervals(
+                streams, control_sums / max(control_count, 1) if control else None, confidence
+            )
+            converged = target_precision is not None and max(half_widths.values()) <= target_precision
+            total = streams[0].n
+            if converged or flights + replicates * pair * total > max_flights:
+                return DispersionEstimate(values, half_widths, confidence, flights, control_flights, converged)
+            # doubling keeps Sobol streams at powers of two
+            n = total
+
+    def _confidence_intervals(
+        self, streams: List[_Replicate], control_means: Optional[np.ndarray], confidence: float
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        replicates = len(streams)
+        n = np.array([[s.n] for s in streams])
+        f = np.array([s.f for s in streams]) / n
+        extra_variance = 0
+        if control_means is not None:
+            g = np.array([s.g for s in streams]) / n
+            # pooled within stream regression coefficient of f on g
+            covariance = sum(s.fg for s in streams) - (n * f * g).sum(axis=0)
+            variance = sum(s.gg for s in streams) - (n * g * g).sum(axis=0)
+            beta = np.divide(covariance, variance, out=np.zeros(3), where=variance > 0)
+            control_mean = control_means.mean(axis=0)
+            f = f - beta * (g - control_mean)
+            extra_variance = beta ** 2 * control_means.var(axis=0, ddof=1) / replicates
+        t = student_t.ppf((1 + confidence) / 2, replicates - 1)
+        half_widths = t * np.sqrt(f.var(axis=0, ddof=1) / replicates + extra_variance)
+
+        values = dict(zip(("x", "y", "distance"), f.mean(axis=0).tolist()))
+        widths = dict(zip(("x", "y", "distance"), half_widths.tolist()))
+        for p in self._percentiles:
+            estimates = np.array([s.statistics.distance_percentiles[p] for s in streams])
+            name = f"p{p:g}"
+            values[name] = float(estimates.mean())
+            widths[name] = float(t * estimates.std(ddof=1) / math.sqrt(replicates))
+        return values, widths
+
+    def _fly_blocks(self, blocks: List[np.ndarray], control: bool) -> List[np.ndarray]:
+        """
+        Landings of several blocks of uniform points, flown as one batch of
+        chunks so that the whole pool is busy.
+        """
+        tasks = []
+        owners = []
+        for i, u in enumerate(blocks):
+            for start in range(0, len(u), self._chunk_size):
+                tasks.append((u[start:start + self._chunk_size], control))
+                owners.append(i)
+        landings = [[] for _ in blocks]
+        for i, chunk in zip(owners, self._map_windowed(_fly_points, tasks)):
+            landings[i].append(chunk)
+        return [np.vstack(chunks) for chunks in landings]
+
+    def _map_windowed(self, fn, tasks: List) -> Iterator[np.ndarray]:
+        # only a few chunks per worker are in flight at once, so finished
+        # results never pile up while the caller consumes them
+        window = 2 * self._pool.max_workers
+        for start in range(0, len(tasks), window):
+            yield from self._pool.map(fn, tasks[start:start + window])
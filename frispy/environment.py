@@ -6,6 +6,9 @@ from typing import Optional
 
 import numpy as np
 
+from frispy.atmosphere import Atmosphere, density_table
+from frispy.obstacles import ObstacleSet
+from frispy.terrain import Terrain
 from frispy.wind import Wind, NoWind
 
 class Environment:
@@ -25,6 +28,13 @@ class Environment:
         I_xx (float): default is 0.175 kg*m^2; x and y-axis moments of inertia
             (i.e. is the same as I_yy and the cross components I_xy)
         mass (float): defualt is 0.175 kg
+        atmosphere (Optional[Atmosphere]): if given, the air density varies
+            with the height of the disc and `air_density` is that at the
+            ground
+        terrain (Optional[Terrain]): the ground the disc lands on, by
+            default the plane `z = 0`
+        obstacles (Optional[ObstacleSet]): trees, walls, ceilings, ... that
+            end the flight when the disc hits them
     """
 
     def __init__(
@@ -35,16 +45,46 @@ class Environment:
         g: float = 9.80665,
         grav_vector: Optional[np.ndarray] = None,
         wind: Wind = NoWind(),
+        atmosphere: Optional[Atmosphere] = None,
+        terrain: Optional[Terrain] = None,
+        obstacles: Optional[ObstacleSet] = None,
     ):
         self._air_density = air_density
         self._g = g
         self._grav_vector = grav_vector or np.array([0.0, 0.0, -1.0])
         self._wind = wind
+        self._atmosphere = atmosphere
+        self._terrain = terrain
+        self._obstacles = obstacles
+        self._density_table = None
+        if atmosphere is not None:
+            self._density_table = density_table(atmosphere)
+            self._air_density = self._density_table(0.0)
 
     @property
     def air_density(self) -> float:
         return self._air_density
 
+    @property
+    def atmosphere(self) -> Optional[Atmosphere]:
+        return self._atmosphere
+
+    @property
+    def terrain(self) -> Optional[Terrain]:
+        return self._terrain
+
+    @property
+    def obstacles(self) -> Optional[ObstacleSet]:
+        return self._obstacles
+
+    def density_at(self, z: float) -> float:
+        """
+        Air density in kg/m^3 at height `z` in meters.
+        """
+        if self._density_table is None:
+            return self._air_density
+        return self._density_table(z)
+
     @property
     def g(self) -> float:
         return self._g
@@ -1,5 +1,5 @@
 import sys
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 import numpy as np
 import math
@@ -39,6 +39,7 @@ class EOM:
             rotation: Rotation,
             velocity: np.ndarray,
             ang_velocity: np.ndarray,
+            air_density: Optional[float] = None,
     ) -> Dict[str, Union[float, np.ndarray, Dict[str, np.ndarray]]]:
         """
         Compute the lift, drag, and gravitational forces on the disc.
@@ -46,6 +47,8 @@ class EOM:
         Args:
         TODO
         """
+        if air_density is None:
+            air_density = self.environment.air_density
         res = EOM.calculate_intermediate_quantities(rotation, velocity, ang_velocity)
         aoa = res["angle_of_attack"]
         v_norm = np.linalg.norm(velocity)
@@ -54,7 +57,7 @@ class EOM:
             vhat = velocity / v_norm
         force_amplitude = (
                 0.5
-                * self.environment.air_density
+                * air_density
                 * (velocity @ velocity)
                 * self.model.area
         )
@@ -86,12 +89,15 @@ class EOM:
             ang_velocity: np.ndarray,
             rotation: Rotation,
             res: Dict[str, Union[float, np.ndarray, Dict[str, np.ndarray]]],
+            air_density: Optional[float] = None,
     ) -> Dict[str, Union[float, np.ndarray, Dict[str, np.ndarray]]]:
+        if air_density is None:
+            air_density = self.environment.air_density
 
         aoa = res["angle_of_attack"]
         res["torque_amplitude"] = (
                 0.5
-                * self.environment.air_density
+                * air_density
                 * (velocity @ velocity)
                 * self.model.diameter
                 * self.model.area
@@ -193,8 +199,9 @@ class EOM:
 
         # angular velocity is defined relative to the disc
         ang_velocity = np.array([dphi, dtheta, dgamma])
-        result = self.compute_forces(rotation, velocity, ang_velocity)
-        result = self.compute_torques(velocity, ang_velocity, rotation, result)
+        air_density = self.environment.density_at(z)
+        result = self.compute_forces(rotation, velocity, ang_velocity, air_density)
+        result = self.compute_torques(velocity, ang_velocity, rotation, result, air_density)
         derivatives = np.array(
             [
                 vx,
@@ -214,6 +221,68 @@ class EOM:
         )
         return derivatives
 
+    def jacobian(
+            self, time: float, coordinates: np.ndarray
+    ) -> np.ndarray:
+        """
+        Jacobian of :meth:`compute_derivatives` with respect to the
+        coordinates, for the implicit solvers (`Radau`, `BDF`, `LSODA`) of
+        :meth:`scipy.integrate.solve_ivp` via its `jac` argument.
+
+        The blocks known in closed form are filled in directly and only the
+        rest is found by forward differences:
+
+        * position changes only through the velocity, so those rows are
+          an identity block
+        * position only enters through the wind and the air density, so
+          those columns are zero unless the wind varies in space; only the
+          height column is needed if the density varies with height
+        * the quaternion is normalized before it is used, so the derivatives
+          are zero along the quaternion itself and only three directions
+          tangent to it need to be probed
+
+        That is 10 evaluations of the right hand side, the value at the point
+        and 9 probes, for a uniform wind; one more with an atmosphere and
+        three more for a wind that varies in space. A forward difference of
+        every column takes 14.
+
+        Args:
+          time (float): instantanious time of the system
+          coordinates (np.ndarray): kinematic variables of the disc
+
+        Returns:
+          (np.ndarray) 13x13 matrix of partial derivatives
+        """
+        y = np.asarray(coordinates, dtype=float)
+        n = len(y)
+        jac = np.zeros((n, n))
+        jac[0:3, 3:6] = np.eye(3)
+        f0 = self.compute_derivatives(time, y)
+        step = np.sqrt(np.finfo(float).eps)
+
+        def probe(direction: np.ndarray, h: float) -> np.ndarray:
+            return (self.compute_derivatives(time, y + h * direction) - f0) / h
+
+        columns = [3, 4, 5, 10, 11, 12]
+        if not self.environment.wind.uniform:
+            columns = [0, 1, 2] + columns
+        elif self.environment.atmosphere is not None:
+            columns = [2] + columns
+        for j in columns:
+            direction = np.zeros(n)
+            direction[j] = 1
+            jac[3:, j] = probe(direction, step * max(abs(y[j]), 1.0))[3:]
+
+        q = y[6:10]
+        q_norm = np.linalg.norm(q)
+        # the last three columns of the complete basis are orthogonal to q
+        basis = np.linalg.svd(q.reshape(1, 4))[2][1:]
+        for tangent in basis:
+            direction = np.zeros(n)
+            direction[6:10] = tangent
+            jac[3:, 6:10] += np.outer(probe(direction, step * max(q_norm, 1.0))[3:], tangent)
+        return jac
+
     @staticmethod
     def expand_quaternion(qx: float, qy: float, qz: float, qw: float) -> Rotation:
         vector = np.array([qx, qy, qz, qw])
@@ -0,0 +1,259 @@
+"""
+Estimate ``Model`` coefficients or flight numbers from recorded flights.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.optimize import OptimizeResult, minimize
+
+from frispy.disc import Disc
+from frispy.discs import Discs
+from frispy.environment import Environment
+from frispy.model import Model
+from frispy.parallel import WorkerPool
+
+
+@dataclass
+class FlightObservation:
+    """
+    A recorded flight. `positions` has shape (len(times), 3) and holds the
+    measured x, y, z of the disc in meters at each time in seconds.
+    `initial_conditions` are passed to :class:`Disc` as is, so they may use
+    `hyzer` and `nose_up` in degrees.
+    """
+
+    times: np.ndarray
+    positions: np.ndarray
+    initial_conditions: Dict[str, float]
+    environment: Environment = field(default_factory=Environment)
+
+
+class _Problem:
+    """
+    Everything a worker needs to score a set of parameter values.
+    """
+
+    def __init__(
+        self,
+        observations: Sequence[FlightObservation],
+        parameters: Sequence[str],
+        base_model: Optional[Model],
+        flight_numbers: Optional[Dict[str, float]],
+        solver_kwargs: Dict,
+    ):
+        self.observations = list(observations)
+        self.parameters = list(parameters)
+        self.base_model = base_model
+        self.flight_numbers = flight_numbers
+        self.solver_kwargs = solver_kwargs
+
+    def build_model(self, x: Sequence[float]) -> Model:
+        values = dict(zip(self.parameters, x))
+        if self.flight_numbers is not None:
+            nums = dict(self.flight_numbers)
+            nums.update(values)
+            return Discs.from_flight_numbers(nums)
+
+        return self.base_model.with_coefficients(**values)
+
+    def error(self, x: Sequence[float]) -> float:
+        """
+        Mean squared distance in m^2 between the simulated and the observed
+        positions over all observed points.
+        """
+        model = self.build_model(x)
+        total = 0.0
+        count = 0
+        for obs in self.observations:
+            disc = Disc(model, dict(obs.initial_conditions), environment=obs.environment)
+            result = disc.compute_trajectory(
+                t_span=(obs.times[0], obs.times[-1]), **self.solver_kwargs
+            )
+            # the simulated disc may land before the recording ends
+            t = np.clip(obs.times, result.times[0], result.times[-1])
+            simulated = np.stack(
+                [np.interp(t, result.times, getattr(result, k)) for k in ("x", "y", "z")],
+                axis=1,
+            )
+            total += np.sum((simulated - obs.positions) ** 2)
+            count += len(t)
+        return total / count
+
+
+_problem: Optional[_Problem] = None
+
+
+def _init_worker(problem: _Problem) -> None:
+    global _problem
+    _problem = problem
+
+
+def _evaluate(x: Tuple[float, ...]) -> float:
+    return _problem.error(x)
+
+
+@dataclass
+class FitResult:
+    """
+    The outcome of :meth:`ModelFitter.fit`.
+    """
+
+    values: Dict[str, float]
+    error: float
+    model: Model
+    runs: List[OptimizeResult]
+    evaluations: int
+
+
+class ModelFitter:
+    """
+    Fit model coefficients (e.g. `PL0`, `PD0`, `PTy0`, `PTxwx`) or flight
+    numbers (`speed`, `glide`, `turn`, `weight`) to recorded flights by
+    least squares on the disc position.
+
+    The objective and all finite difference probes of the gradient are
+    evaluated concurrently in a process pool. Every evaluation is cached by
+    its parameter values, and the cache is shared by all starting points of
+    :meth:`fit`, so restarts that revisit a point do not fly it again.
+
+    Args:
+        observations (Sequence[FlightObservation]): recorded flights
+        parameters (Sequence[str]): names of the values to fit
+        base_model (Model, optional): coefficients that are not fitted come
+            from this model; defaults to :class:`Model`
+        flight_numbers (Dict[str, float], optional): fit flight numbers
+            instead of coefficients; values not in `parameters` are fixed
+            to the ones given here
+        max_workers (int, optional): size of the process pool
+        relative_step (float): finite difference step relative to the
+            magnitude of each parameter
+        solver_kwargs (Dict, optional): passed to
+            :meth:`Disc.compute_trajectory`
+    """
+
+    def __init__(
+        self,
+        observations: Sequence[FlightObservation],
+        parameters: Sequence[str],
+        base_model: Optional[Model] = None,
+        flight_numbers: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None,
+        relative_step: float = 1e-4,
+        solver_kwargs: Optional[Dict] = None,
+    ):
+        assert len(observations) > 0, "need at least one observed flight"
+        if flight_numbers is None:
+            base_model = base_model or Model()
+            for name in parameters:
+                assert name in base_model.coefficients, f"invalid coefficient name {name}"
+        self._problem = _Problem(
+            observations,
+            parameters,
+            base_model,
+            flight_numbers,
+            solver_kwargs if solver_kwargs is not None else {"max_step": 0.2},
+        )
+        self._relative_step = relative_step
+        self._cache: Dict[Tuple[float, ...], float] = {}
+        self._pool = WorkerPool(max_workers, initializer=_init_worker, initargs=(self._problem,))
+
+    @property
+    def parameters(self) -> List[str]:
+        return self._problem.parameters
+
+    @property
+    def evaluations(self) -> int:
+        """
+        Number of distinct parameter vectors that have been flown.
+        """
+        return len(self._cache)
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> "ModelFitter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def evaluate_many(self, points: Sequence[Sequence[float]]) -> np.ndarray:
+        """
+        Objective values for all `points`, flying the ones that are not
+        cached in parallel.
+        """
+        keys = [tuple(float(v) for v in p) for p in points]
+        missing = list(dict.fromkeys(k for k in keys if k not in self._cache))
+        for key, value in zip(missing, self._pool.map(_evaluate, missing)):
+            self._cache[key] = value
+        return np.array([self._cache[k] for k in keys])
+
+    def objective(self, x: Sequence[float]) -> float:
+        return float(self.evaluate_many([x])[0])
+
+    def objective_and_gradient(
+        self, x: Sequence[float], bounds: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Objective and its forward difference gradient. The base point and
+        the probes are flown together in one parallel batch.
+        """
+        x = np.asarray(x, dtype=float)
+        steps = self._relative_step * np.maximum(np.abs(x), 1.0)
+        if bounds is not None:
+            # step backwards where a forward step would leave the bounds
+            upper = np.array([np.inf if b[1] is None else b[1] for b in bounds])
+            steps = np.where(x + steps > upper, -steps, steps)
+        probes = [x]
+        for i, h in enumerate(steps):
+            probe = x.copy()
+            probe[i] += h
+            probes.append(probe)
+        values = self.evaluate_many(probes)
+        return values[0], (values[1:] - values[0]) / steps
+
+    def fit(
+        self,
+        starts: Sequence[Sequence[float]],
+        bounds: Optional[Sequence[Tuple[float, float]]] = None,
+        method: str = "L-BFGS-B",
+        **minimize_kwargs,
+    ) -> FitResult:
+        """
+        Minimize the position error from every starting point and return
+        the best fit.
+
+        Args:
+            starts (Sequence[Sequence[float]]): starting parameter vectors
+            bounds (Sequence[Tuple[float, float]], optional): bounds for each
+                parameter
+            method (str): a gradient based :func:`scipy.optimize.minimize`
+                method
+            minimize_kwargs: passed to :func:`scipy.optimize.minimize`
+
+        Returns:
+            the best :class:`FitResult` over all starts
+        """
+        runs = []
+        for x0 in starts:
+            runs.append(
+                minimize(
+                    self.objective_and_gradient,
+                    x0,
+                    args=(bounds,),
+                    jac=True,
+                    bounds=bounds,
+                    method=method,
+                    **minimize_kwargs,
+                )
+            )
+        best = min(runs, key=lambda r: r.fun)
+        return FitResult(
+            values=dict(zip(self.parameters, best.x)),
+            error=float(best.fun),
+            model=self._problem.build_model(best.x),
+            runs=runs,
+            evaluations=self.evaluations,
+        )
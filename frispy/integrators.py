@@ -0,0 +1,239 @@
+"""
+Integrator backends for :meth:`Disc.compute_trajectory`, and a selector
+that picks a backend and tolerances for a class of throw.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.optimize import OptimizeResult, brentq
+
+from frispy.environment import Environment
+from frispy.equations_of_motion import EOM
+from frispy.lie_group import RKMK45, HermiteDenseOutput
+
+# solve_ivp methods that use the Jacobian of the equations of motion
+IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+
+
+class Integrator(ABC):
+    """
+    Abstract integrator backend. Backends take the equations of motion, the
+    time span, the initial state and `solve_ivp` style event functions and
+    return an object with the same fields as the result of
+    :func:`scipy.integrate.solve_ivp` (`t`, `y`, `status`, `t_events`,
+    `y_events`, `nfev`).
+    """
+
+    @abstractmethod
+    def integrate(
+        self,
+        eom: EOM,
+        t_span: Tuple[float, float],
+        y0: Sequence[float],
+        events: Sequence[Callable] = (),
+        **options,
+    ) -> OptimizeResult:
+        """
+        Integrate `eom` over `t_span` starting from `y0`. `options` are the
+        caller's solver arguments and take precedence over the backend's
+        own settings.
+        """
+
+
+class ScipyIntegrator(Integrator):
+    """
+    :func:`scipy.integrate.solve_ivp` with a fixed `method`. For the
+    implicit methods :meth:`EOM.jacobian` is passed as `jac` unless one is
+    given.
+
+    Args:
+        method (Union[str, OdeSolver]): `RK45`, `DOP853`, `LSODA`, ... or a
+            solver class such as :class:`frispy.lie_group.RKMK45`
+        options: default options for `solve_ivp`, e.g. `rtol` and `atol`
+    """
+
+    def __init__(self, method: Union[str, type] = "RK45", **options):
+        self._method = method
+        self._options = options
+
+    @property
+    def method(self) -> Union[str, type]:
+        return self._method
+
+    @property
+    def options(self) -> Dict:
+        return self._options
+
+    def integrate(self, eom, t_span, y0, events=(), **options):
+        kwargs = dict(self._options)
+        kwargs.update(options)
+        kwargs.setdefault("method", self._method)
+        if kwargs["method"] in IMPLICIT_METHODS and "jac" not in kwargs:
+            kwargs["jac"] = eom.jacobian
+        return solve_ivp(
+            fun=eom.compute_derivatives,
+            t_span=t_span,
+            y0=y0,
+            events=list(events),
+            **kwargs,
+        )
+
+    def __repr__(self):
+        name = getattr(self._method, "__name__", self._method)
+        return f"ScipyIntegrator({name!r}, {self._options})"
+
+
+class FixedStepRK4(Integrator):
+    """
+    The classical fourth order Runge-Kutta method with a fixed step and no
+    error control. Per step it costs four evaluations of the equations of
+    motion and very little bookkeeping, which makes it the cheapest backend
+    for smooth flights when the step is chosen from the benchmark matrix.
+    Events are located by root finding on the cubic Hermite interpolant of
+    the step in which they change sign.
+
+    Without error control there is nothing for `rtol` and `atol` to act on,
+    so passing either raises a `ValueError` rather than being ignored; the
+    accuracy is set by the step alone.
+
+    Args:
+        step (float, optional): step in seconds; if not given the
+            `max_step` option is used
+    """
+
+    def __init__(self, step: Optional[float] = None):
+        self._step = step
+
+    def integrate(self, eom, t_span, y0, events=(), **options):
+        tolerances = sorted({"rtol", "atol"} & set(options))
+        if tolerances:
+            raise ValueError(f"FixedStepRK4 has no error control, choose a step instead of {', '.join(tolerances)}")
+        step = self._step or options.get("max_step")
+        assert step is not None and np.isfinite(step), "FixedStepRK4 needs a step or max_step"
+        fun = eom.compute_derivatives
+        t0, t_end = t_span
+        y = np.array(y0, dtype=float)
+        t = t0
+        f = fun(t, y)
+        nfev = 1
+        ts = [t]
+        ys = [y]
+        t_events: List[List[float]] = [[] for _ in events]
+        y_events: List[List[np.ndarray]] = [[] for _ in events]
+        g = [event(t, y) for event in events]
+        status = 0
+        while t < t_end:
+            h = min(step, t_end - t)
+            k1 = f
+            k2 = fun(t + h / 2, y + h / 2 * k1)
+            k3 = fun(t + h / 2, y + h / 2 * k2)
+            k4 = fun(t + h, y + h * k3)
+            y_new = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            t_new = t + h
+            f_new = fun(t_new, y_new)
+            nfev += 4
+
+            terminal_at = None
+            g_new = [event(t_new, y_new) for event in events]
+            if events:
+                dense = HermiteDenseOutput(t, t_new, y, y_new, f, f_new)
+                for i, event in enumerate(events):
+                    if not _crossed(event, g[i], g_new[i]):
+                        continue
+                    root = brentq(lambda s: event(s, dense(s)), t, t_new, xtol=1e-12)
+                    t_events[i].append(root)
+                    y_events[i].append(dense(root))
+                    if getattr(event, "terminal", False) and (terminal_at is None or root < terminal_at):
+                        terminal_at = root
+
+            if terminal_at is not None:
+                ts.append(terminal_at)
+                ys.append(dense(terminal_at))
+                status = 1
+                break
+            t, y, f, g = t_new, y_new, f_new, g_new
+            ts.append(t)
+            ys.append(y)
+
+        return OptimizeResult(
+            t=np.array(ts),
+            y=np.array(ys).T,
+            t_events=[np.array(e) for e in t_events],
+            y_events=[np.array(e) for e in y_events],
+            nfev=nfev,
+            status=status,
+            message="A termination event occurred." if status == 1 else "The solver successfully reached the end of the integration interval.",
+            success=True,
+        )
+
+    def __repr__(self):
+        return f"FixedStepRK4({self._step})"
+
+
+def _crossed(event: Callable, before: float, after: float) -> bool:
+    direction = getattr(event, "direction", 0)
+    if direction > 0:
+        return before < 0 <= after
+    if direction < 0:
+        return before > 0 >= after
+    return (before < 0 <= after) or (before > 0 >= after)
+
+
+RK45 = ScipyIntegrator("RK45")
+DOP853 = ScipyIntegrator("DOP853")
+LSODA = ScipyIntegrator("LSODA")
+LIE_GROUP = ScipyIntegrator(RKMK45)
+
+# Backend and tolerances for each class of throw: the cheapest setting in
+# the benchmark matrix (research/benchmark.py) whose landing point is within
+# 1 cm of the reference. Timings are the median wall time per flight.
+INTEGRATOR_TABLE: Dict[str, Tuple[Integrator, Dict]] = {
+    # 0.4 mm error, 4.4 ms (RK45 rtol=1e-3: 0.2 mm, 10.7 ms)
+    "putt": (FixedStepRK4(0.2), {}),
+    # 9.4 mm error, 34 ms (FixedStepRK4(0.1): 1.5 mm, 71 ms)
+    "drive": (RK45, {"rtol": 1e-3, "atol": 1e-6}),
+    # 0.3 mm error, 1.3 s (RK45 rtol=1e-4: 2.1 mm, 2.1 s)
+    "wobble": (DOP853, {"rtol": 1e-4, "atol": 1e-7}),
+    # 2.6 mm error, 30 ms (FixedStepRK4(0.1): 5.4 mm, 45 ms)
+    "windy": (RK45, {"rtol": 1e-3, "atol": 1e-6}),
+}
+
+
+def classify_throw(initial_conditions: Dict[str, float], environment: Environment) -> str:
+    """
+    The class of a throw in :data:`INTEGRATOR_TABLE`: `wobble` if the
+    wobble rate is more than 2% of the spin, `windy` if the wind varies in
+    space or is faster than 2 m/s, `putt` below 15 m/s and `drive`
+    otherwise.
+    """
+    wobble = np.hypot(initial_conditions["dphi"], initial_conditions["dtheta"])
+    if wobble > 0.02 * abs(initial_conditions["dgamma"]):
+        return "wobble"
+    wind = environment.wind
+    if not wind.uniform or np.linalg.norm(wind.get_wind_vector(0, None)) > 2:
+        return "windy"
+    speed = np.linalg.norm([initial_conditions[k] for k in ("vx", "vy", "vz")])
+    if speed < 15:
+        return "putt"
+    return "drive"
+
+
+def select_integrator(
+    initial_conditions: Dict[str, float],
+    environment: Environment,
+    solver_kwargs: Optional[Dict] = None,
+) -> Tuple[Integrator, Dict]:
+    """
+    Backend and solver options for a throw, see :func:`classify_throw`.
+    The caller's `solver_kwargs` take precedence over the options of the
+    table. Tolerances given for a class whose backend has no error control
+    select :data:`RK45` with them instead.
+    """
+    integrator, options = INTEGRATOR_TABLE[classify_throw(initial_conditions, environment)]
+    solver_kwargs = solver_kwargs or {}
+    if isinstance(integrator, FixedStepRK4) and {"rtol", "atol"} & set(solver_kwargs):
+        integrator, options = RK45, {}
+    return integrator, {**options, **solver_kwargs}
@@ -0,0 +1,236 @@
+"""
+A Runge-Kutta-Munthe-Kaas integrator that advances the orientation of the
+disc on the rotation group instead of integrating the quaternion as four
+free variables.
+"""
+
+import math
+
+import numpy as np
+from scipy.integrate import DenseOutput, OdeSolver
+
+# slice of the quaternion (qx, qy, qz, qw) in the state vector
+QUATERNION = slice(6, 10)
+
+# Dormand-Prince 5(4) tableau, the same one used by scipy's RK45
+C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+A = np.array([
+    [0, 0, 0, 0, 0],
+    [1 / 5, 0, 0, 0, 0],
+    [3 / 40, 9 / 40, 0, 0, 0],
+    [44 / 45, -56 / 15, 32 / 9, 0, 0],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+])
+B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+E = np.array([-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+ORDER = 4
+
+
+def quaternion_multiply(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Hamilton product of two quaternions in scalar last (x, y, z, w) order,
+    so that `quaternion_multiply(p, q)` is the rotation `q` followed by `p`.
+    """
+    px, py, pz, pw = p
+    qx, qy, qz, qw = q
+    return np.array([
+        pw * qx + qw * px + py * qz - pz * qy,
+        pw * qy + qw * py + pz * qx - px * qz,
+        pw * qz + qw * pz + px * qy - py * qx,
+        pw * qw - px * qx - py * qy - pz * qz,
+    ])
+
+
+def exp_map(u: np.ndarray) -> np.ndarray:
+    """
+    Unit quaternion of the rotation by the rotation vector `u`.
+    """
+    ux, uy, uz = u
+    angle = math.sqrt(ux * ux + uy * uy + uz * uz)
+    if angle < 1e-8:
+        # second order series of sin(angle / 2) / angle
+        s = 0.5 - angle * angle / 48
+    else:
+        s = math.sin(angle / 2) / angle
+    return np.array([ux * s, uy * s, uz * s, math.cos(angle / 2)])
+
+
+def dexp_inv(u: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    Inverse of the derivative of the exponential map on so(3): the rate of
+    change of `u` such that `exp(u) q0` rotates with angular velocity `w`.
+    """
+    ux, uy, uz = u
+    wx, wy, wz = w
+    angle_squared = ux * ux + uy * uy + uz * uz
+    if angle_squared < 1e-8:
+        factor = 1 / 12 + angle_squared / 720
+    else:
+        half = math.sqrt(angle_squared) / 2
+        factor = (1 - half / math.tan(half)) / angle_squared
+    # u x w and u x (u x w)
+    cx, cy, cz = uy * wz - uz * wy, uz * wx - ux * wz, ux * wy - uy * wx
+    ccx, ccy, ccz = uy * cz - uz * cy, uz * cx - ux * cz, ux * cy - uy * cx
+    return np.array([
+        wx - 0.5 * cx + factor * ccx,
+        wy - 0.5 * cy + factor * ccy,
+        wz - 0.5 * cz + factor * ccz,
+    ])
+
+
+def angular_velocity(dq: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    World frame angular velocity `w` of a unit quaternion with time
+    derivative `dq = 0.5 (w, 0) q`.
+    """
+    conjugate = np.array([-q[0], -q[1], -q[2], q[3]])
+    return 2 * quaternion_multiply(dq, conjugate)[:3]
+
+
+class RKMK45(OdeSolver):
+    """
+    Runge-Kutta-Munthe-Kaas method built on the Dormand-Prince 5(4) pair,
+    for use as the `method` of :func:`scipy.integrate.solve_ivp` with the
+    equations of motion in :class:`frispy.EOM`.
+
+    The translational, wobble and spin coordinates are advanced like
+    `RK45`. The orientation is advanced on the rotation group: every stage
+    converts the quaternion derivative to an angular velocity, the stages
+    are combined into a rotation vector through the exact inverse
+    derivative of the exponential map, and the quaternion is updated by
+    multiplying with the exponential of that vector. The quaternion
+    therefore stays a unit quaternion to round off for the whole flight
+    and the error control only sees the genuine rotation error.
+
+    The spin is not part of the quaternion, so the step size is limited by
+    the wobble rates `dphi` and `dtheta`, not by the orientation. In the
+    benchmark matrix (`research/benchmark.py`) this method needs the same
+    number of steps as `RK45` for the same landing error; its benefit is
+    an orientation free of norm drift, at about 1.2x the cost per step.
+
+    The options are the same as for the scipy solvers: `rtol`, `atol`,
+    `max_step` and `first_step`.
+    """
+
+    def __init__(
+        self,
+        fun,
+        t0,
+        y0,
+        t_bound,
+        max_step=np.inf,
+        rtol=1e-3,
+        atol=1e-6,
+        first_step=None,
+        vectorized=False,
+        **extraneous,
+    ):
+        y0 = np.array(y0, dtype=float)
+        y0[QUATERNION] /= np.linalg.norm(y0[QUATERNION])
+        super().__init__(fun, t0, y0, t_bound, vectorized)
+        self.max_step = max_step
+        self.rtol = rtol
+        self.atol = atol
+        self.f = self.fun(self.t, self.y)
+        self.h_abs = first_step if first_step is not None else self._initial_step()
+        self.K = np.empty((len(B) + 1, self.n))
+        self.y_old = None
+        self.f_old = None
+
+    def _initial_step(self) -> float:
+        scale = self.atol + self.rtol * np.abs(self.y)
+        d0 = np.linalg.norm(self.y / scale) / math.sqrt(self.n)
+        d1 = np.linalg.norm(self.f / scale) / math.sqrt(self.n)
+        h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        return min(h, self.max_step, abs(self.t_bound - self.t))
+
+    def _stage(self, t: float, h: float, coefficients: np.ndarray, omegas: np.ndarray):
+        """
+        State at an intermediate stage and the rotation vector taking the
+        orientation there from the start of the step.
+        """
+        y = self.y + h * (coefficients @ self.K[:len(coefficients)])
+        u = h * (coefficients @ omegas[:len(coefficients)])
+        y[QUATERNION] = quaternion_multiply(exp_map(u), self.y[QUATERNION])
+        return y, u
+
+    def _step_impl(self):
+        t = self.t
+        min_step = 10 * np.abs(np.nextafter(t, self.direction * np.inf) - t)
+        h_abs = min(max(self.h_abs, min_step), self.max_step)
+        omegas = np.empty((len(B) + 1, 3))
+
+        step_rejected = False
+        while True:
+            if h_abs < min_step:
+                return False, self.TOO_SMALL_STEP
+            h = h_abs * self.direction
+            t_new = t + h
+            if self.direction * (t_new - self.t_bound) > 0:
+                t_new = self.t_bound
+            h = t_new - t
+            h_abs = abs(h)
+
+            self.K[0] = self.f
+            omegas[0] = angular_velocity(self.f[QUATERNION], self.y[QUATERNION])
+            for i in range(1, len(B)):
+                y_stage, u = self._stage(t, h, A[i, :i], omegas)
+                self.K[i] = self.fun(t + C[i] * h, y_stage)
+                omegas[i] = dexp_inv(u, angular_velocity(self.K[i][QUATERNION], y_stage[QUATERNION]))
+
+            y_new, u = self._stage(t, h, B, omegas)
+            f_new = self.fun(t_new, y_new)
+            self.K[-1] = f_new
+            omegas[-1] = dexp_inv(u, angular_velocity(f_new[QUATERNION], y_new[QUATERNION]))
+
+            error = h * (E @ self.K)
+            # measure the orientation error on the group, as an angle
+            error[QUATERNION] = np.append(h * (E @ omegas), 0) / 2
+            scale = self.atol + self.rtol * np.maximum(np.abs(self.y), np.abs(y_new))
+            error_norm = np.linalg.norm(error / scale) / math.sqrt(self.n)
+
+            if error_norm < 1:
+                factor = 10.0 if error_norm == 0 else min(10.0, 0.9 * error_norm ** (-1 / (ORDER + 1)))
+                # as in scipy, do not grow the step right after a rejection
+                if step_rejected:
+                    factor = min(1.0, factor)
+                self.h_abs = h_abs * factor
+                break
+            h_abs *= max(0.2, 0.9 * error_norm ** (-1 / (ORDER + 1)))
+            step_rejected = True
+
+        self.y_old = self.y
+        self.f_old = self.f
+        self.h_previous = h
+        self.t = t_new
+        self.y = y_new
+        self.f = f_new
+        return True, None
+
+    def _dense_output_impl(self):
+        return HermiteDenseOutput(self.t_old, self.t, self.y_old, self.y, self.f_old, self.f)
+
+
+class HermiteDenseOutput(DenseOutput):
+    """
+    Cubic Hermite interpolation between the two ends of a step. This is
+    what :func:`scipy.integrate.solve_ivp` uses to locate events.
+    """
+
+    def __init__(self, t_old, t, y_old, y, f_old, f):
+        super().__init__(t_old, t)
+        self.h = t - t_old
+        self.y_old = y_old
+        self.y = y
+        self.f_old = f_old
+        self.f = f
+
+    def _call_impl(self, t):
+        s = (np.asarray(t) - self.t_old) / self.h
+        h00 = (1 + 2 * s) * (1 - s) ** 2
+        h10 = s * (1 - s) ** 2
+        h01 = s * s * (3 - 2 * s)
+        h11 = s * s * (s - 1)
+        return (np.multiply.outer(self.y_old, h00) + np.multiply.outer(self.y, h01)
+                + self.h * (np.multiply.outer(self.f_old, h10) + np.multiply.outer(self.f, h11)))
@@ -1,9 +1,12 @@
 """
 Physical model for the forces and torques on a disc.
 """
+import hashlib
+import json
 import math
 from pprint import pprint
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 import numpy as np
 
@@ -91,6 +94,48 @@ class Model:
         assert name in self.coefficients, f"invalid coefficient name {name}"
         return self.coefficients[name]
 
+    def with_coefficients(self, **values: float) -> "Model":
+        """
+        A new model with some coefficients replaced. Unlike
+        :meth:`set_value`, derived values such as `alpha_0` and `area` are
+        recomputed.
+
+        Args:
+            values: coefficient names and their new values
+
+        Returns:
+            (Model) the new model of the same class, this model is unchanged
+        """
+        coefficients = {
+            k: v for k, v in self.coefficients.items() if k not in Model.derived_coefficients
+        }
+        if "PD0" in values:
+            # CD0 would overwrite the new PD0
+            coefficients.pop("CD0", None)
+        coefficients.update(values)
+        return type(self)(**coefficients)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Hex digest of everything the model computes from, here the
+        coefficients, that unlike :func:`hash` is the same in every process.
+        """
+        return hashlib.sha256(json.dumps(sorted(self.coefficients.items()), default=float).encode()).hexdigest()
+
+    def freeze(self) -> "FrozenModel":
+        """
+        An immutable copy of this model, see :class:`FrozenModel`.
+        """
+        if isinstance(self, FrozenModel):
+            return self
+        return FrozenModel(**{
+            k: v for k, v in self.coefficients.items() if k not in Model.derived_coefficients
+        })
+
+    # values computed in __init__ from the other coefficients
+    derived_coefficients = ("area", "cavity_volume", "alpha_0")
+
     @property
     def coefficients(self) -> Dict[str, float]:
         return self._coefficients
@@ -354,3 +399,146 @@ class Model:
         #return math.copysign(0.1, wz) * advR * advR
 
         return 0
+
+    #####################################################################
+    # Array versions of the scale factors above with the same piecewise #
+    # definitions, for many angles of attack at once                    #
+    #####################################################################
+
+    @staticmethod
+    def normalizeAlpha_array(alpha: np.ndarray) -> np.ndarray:
+        alpha = np.asarray(alpha, dtype=float)
+        if np.any((alpha > math.pi) | (alpha < -math.pi)):
+            raise ValueError
+        return np.where(
+            alpha > math.pi / 2,
+            math.pi - alpha,
+            np.where(alpha < -math.pi / 2, -math.pi - alpha, alpha),
+        )
+
+    def C_lift_array(self, alpha: np.ndarray) -> np.ndarray:
+        """
+        :meth:`C_lift` of an array of angles of attack in radians.
+        """
+        alpha = Model.normalizeAlpha_array(alpha)
+
+        PL0 = self.get_value("PL0")
+        PLa = self.get_value("PLa")
+        a = -PLa / 2 / Model.neg_stall
+        scale = (self.get_value("alpha_0") - Model.neg_stall) / (Model.neg_stall + math.pi / 2)
+        x = np.where(alpha < Model.neg_stall, Model.neg_stall - (Model.neg_stall - alpha) * scale, alpha)
+        prestall = PL0 + PLa * Model.stall
+        return np.select(
+            [alpha < 0, alpha < Model.stall],
+            [a * x * x + PLa * x + PL0, PL0 + PLa * alpha],
+            (math.pi / 2 - alpha) * prestall / 2,
+        )
+
+    def C_drag_array(self, alpha: np.ndarray) -> np.ndarray:
+        """
+        :meth:`C_drag` of an array of angles of attack in radians.
+        """
+        alpha = Model.normalizeAlpha_array(alpha)
+
+        PD0 = self.get_value("PD0")
+        PDa = self.get_value("PDa")
+        alpha_0 = self.get_value("alpha_0")
+        delta = alpha - alpha_0
+        glide_coefficeint = 3 / 4
+        neg_PDa = PDa * glide_coefficeint
+
+        neg_range = Model.neg_stall + math.pi / 2
+        neg_prestall = (PD0 + neg_PDa * (alpha_0 - Model.neg_stall) ** 2) / (1.5 * glide_coefficeint)
+        full_nose_down = self.C_drag(glide_coefficeint * 40 * math.pi / 180) - neg_prestall
+
+        pos_range = math.pi / 2 - Model.stall
+        prestall = (PD0 + PDa * (Model.stall - alpha_0) ** 2) / 1.5
+        full_nose_up = self.C_drag(40 * math.pi / 180) - prestall
+        return np.select(
+            [alpha < Model.neg_stall, delta < 0.0, alpha <= Model.stall],
+            [
+                neg_prestall - (alpha - Model.neg_stall) / neg_range * full_nose_down,
+                PD0 + neg_PDa * delta ** 2,
+                PD0 + PDa * delta ** 2,
+            ],
+            prestall + (alpha - Model.stall) / pos_range * full_nose_up,
+        )
+
+    def C_y_array(self, alpha: np.ndarray) -> np.ndarray:
+        """
+        :meth:`C_y` of an array of angles of attack in radians.
+        """
+        alpha = Model.normalizeAlpha_array(alpha)
+
+        PTy0 = self.get_value("PTy0")
+        PTya = 0.007 * 180 / math.pi
+        deg_30_in_rad = 30 * math.pi / 180
+
+        # C_y of a negative alpha down to -30 degrees mirrors the positive one
+        mirrored = np.abs(alpha)
+        angle_of_cavity = 0.28
+        cavity_scale = Model.cavity_multiplier_from_speed(self.get_speed()) * 2 * angle_of_cavity / math.pi
+        cavity_pitch_adjust = np.where(
+            mirrored <= angle_of_cavity,
+            -np.sin(math.pi * mirrored / angle_of_cavity / 2) * PTya * cavity_scale,
+            -PTya * cavity_scale,
+        )
+        before_drop = self.C_y(15 * math.pi / 180)
+        positive = np.select(
+            [mirrored <= Model.stall, mirrored <= 80 * math.pi / 180],
+            [PTy0 + PTya * mirrored + cavity_pitch_adjust, before_drop],
+            ((math.pi / 2 - mirrored) * 180 / math.pi) * before_drop / 10,
+        )
+
+        percent = (alpha + math.pi / 2) / (math.pi / 2 - deg_30_in_rad)
+        return np.select(
+            [alpha < -deg_30_in_rad, alpha < 0],
+            [percent * (-self.C_y(deg_30_in_rad) + 2 * PTy0), -positive + 2 * PTy0],
+            positive,
+        )
+
+    def C_side_array(self, aoa: np.ndarray, v_norm: np.ndarray, wz: np.ndarray) -> np.ndarray:
+        """
+        :meth:`C_side` of arrays of angles of attack, speeds and spins,
+        broadcast against each other.
+        """
+        # the magnus side force is switched off in C_side
+        return np.zeros(np.broadcast(np.asarray(aoa), np.asarray(v_norm), np.asarray(wz)).shape)
+
+
+class FrozenModel(Model):
+    """
+    A :class:`Model` whose coefficients cannot be changed. Frozen models
+    compare equal and hash alike when their coefficients are equal, so one
+    instance can be shared between flights and used as a cache key. Use
+    :meth:`with_coefficients` for a changed copy.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._freeze(self._coefficients)
+
+    def _freeze(self, coefficients: Dict[str, float]) -> None:
+        self._coefficients = MappingProxyType(dict(coefficients))
+        self._key = tuple(sorted(coefficients.items()))
+
+    def set_value(self, name: str, value: float) -> None:
+        raise TypeError("a FrozenModel cannot be changed, use with_coefficients")
+
+    @property
+    def coefficients(self) -> Mapping[str, float]:
+        return self._coefficients
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenModel):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __getstate__(self) -> Dict[str, float]:
+        return dict(self._coefficients)
+
+    def __setstate__(self, state: Dict[str, float]) -> None:
+        self._freeze(state)
@@ -0,0 +1,194 @@
+"""
+Collision geometry of a course, e.g. trees, baskets, walls and ceilings,
+that ends a flight when the disc hits it.
+"""
+
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# x and y ranges of an obstacle: (x_min, y_min, x_max, y_max)
+Footprint = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class Cylinder:
+    """
+    Vertical cylinder, e.g. a tree trunk or a basket pole.
+
+    Args:
+        x (float): x of the axis in m
+        y (float): y of the axis in m
+        radius (float): m
+        bottom (float): height of the bottom in m
+        top (float): height of the top in m
+        name (str): reported when the disc hits it
+    """
+
+    x: float
+    y: float
+    radius: float
+    bottom: float = 0.0
+    top: float = 10.0
+    name: str = ""
+
+    def distance(self, x: float, y: float, z: float) -> float:
+        """
+        Signed distance in m from a point, negative inside.
+        """
+        radial = math.hypot(x - self.x, y - self.y) - self.radius
+        half = (self.top - self.bottom) / 2
+        vertical = abs(z - (self.top + self.bottom) / 2) - half
+        return min(max(radial, vertical), 0.0) + math.hypot(max(radial, 0.0), max(vertical, 0.0))
+
+    def footprint(self) -> Optional[Footprint]:
+        return (self.x - self.radius, self.y - self.radius, self.x + self.radius, self.y + self.radius)
+
+
+@dataclass(frozen=True)
+class Box:
+    """
+    Box aligned with the axes, e.g. a building or a bench.
+
+    Args:
+        low (Tuple[float, float, float]): corner with the smallest x, y, z
+        high (Tuple[float, float, float]): corner with the largest x, y, z
+        name (str): reported when the disc hits it
+    """
+
+    low: Tuple[float, float, float]
+    high: Tuple[float, float, float]
+    name: str = ""
+
+    def distance(self, x: float, y: float, z: float) -> float:
+        """
+        Signed distance in m from a point, negative inside.
+        """
+        q = [
+            abs(p - (low + high) / 2) - (high - low) / 2
+            for p, low, high in zip((x, y, z), self.low, self.high)
+        ]
+        return min(max(q), 0.0) + math.sqrt(sum(max(c, 0.0) ** 2 for c in q))
+
+    def footprint(self) -> Optional[Footprint]:
+        return (self.low[0], self.low[1], self.high[0], self.high[1])
+
+
+@dataclass(frozen=True)
+class Plane:
+    """
+    Boundary of a half space, e.g. a ceiling or the walls of a tunnel. The
+    disc may fly on the side `normal` points to.
+
+    Args:
+        point (Tuple[float, float, float]): any point on the plane
+        normal (Tuple[float, float, float]): towards the free side, need not
+            be a unit vector
+        name (str): reported when the disc hits it
+    """
+
+    point: Tuple[float, float, float]
+    normal: Tuple[float, float, float]
+    name: str = ""
+
+    def distance(self, x: float, y: float, z: float) -> float:
+        """
+        Signed distance in m from a point, negative behind the plane.
+        """
+        nx, ny, nz = self.normal
+        norm = math.sqrt(nx * nx + ny * ny + nz * nz)
+        px, py, pz = self.point
+        return ((x - px) * nx + (y - py) * ny + (z - pz) * nz) / norm
+
+    def footprint(self) -> Optional[Footprint]:
+        # unbounded, tested everywhere
+        return None
+
+
+class ObstacleSet:
+    """
+    Obstacles indexed by a spatial hash of square cells in the x-y plane,
+    so that a collision check only measures the distance to obstacles near
+    the disc instead of to all of them. Obstacles without a footprint
+    (planes) are checked everywhere.
+
+    Args:
+        obstacles (Sequence): :class:`Cylinder`, :class:`Box` and
+            :class:`Plane` objects, or anything with the same `distance`
+            and `footprint` methods
+        cell_size (float): side of a cell in m; the distance to an obstacle
+            is only measured within about this range
+    """
+
+    def __init__(self, obstacles: Sequence, cell_size: float = 5.0):
+        self.obstacles = list(obstacles)
+        self.cell_size = cell_size
+        self._everywhere: Tuple[int, ...] = tuple(
+            k for k, obstacle in enumerate(self.obstacles) if obstacle.footprint() is None
+        )
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for k, obstacle in enumerate(self.obstacles):
+            footprint = obstacle.footprint()
+            if footprint is None:
+                continue
+            x_min, y_min, x_max, y_max = footprint
+            for i in range(self._index(x_min), self._index(x_max) + 1):
+                for j in range(self._index(y_min), self._index(y_max) + 1):
+                    cells.setdefault((i, j), []).append(k)
+        # the obstacles of each cell and its 8 neighbours, so that any
+        # obstacle left out is at least cell_size away
+        near: Dict[Tuple[int, int], set] = {}
+        for (i, j), members in cells.items():
+            for di, dj in itertools.product((-1, 0, 1), repeat=2):
+                near.setdefault((i + di, j + dj), set()).update(members)
+        self._near: Dict[Tuple[int, int], Tuple[int, ...]] = {
+            cell: tuple(sorted(members)) + self._everywhere for cell, members in near.items()
+        }
+
+    def _index(self, value: float) -> int:
+        return int(math.floor(value / self.cell_size))
+
+    def __len__(self) -> int:
+        return len(self.obstacles)
+
+    def candidates(self, x: float, y: float) -> Tuple[int, ...]:
+        """
+        Indices of the obstacles that may be within `cell_size` of a point.
+        """
+        return self._near.get((self._index(x), self._index(y)), self._everywhere)
+
+    def distance(self, x: float, y: float, z: float) -> float:
+        """
+        Distance in m from a point to the nearest obstacle, capped at
+        `cell_size`. The cap keeps it continuous as the disc moves between
+        cells, which the event root finding relies on.
+        """
+        obstacles = self.obstacles
+        d = self.cell_size
+        for k in self.candidates(x, y):
+            d = min(d, obstacles[k].distance(x, y, z))
+        return d
+
+    def nearest(self, x: float, y: float, z: float):
+        """
+        The obstacle nearest to a point among the candidates, or None.
+        """
+        candidates = self.candidates(x, y)
+        if not candidates:
+            return None
+        return self.obstacles[min(candidates, key=lambda k: self.obstacles[k].distance(x, y, z))]
+
+    def collision_event(self, clearance: float = 0.0) -> Callable[[float, np.ndarray], float]:
+        """
+        Terminal `solve_ivp` event for the disc coming within `clearance`,
+        e.g. its radius, of an obstacle.
+        """
+        distance = self.distance
+
+        def hit_obstacle(t, y): return distance(y[0], y[1], y[2]) - clearance
+        hit_obstacle.terminal = True
+        hit_obstacle.direction = -1
+        return hit_obstacle
@@ -0,0 +1,72 @@
+"""
+Helpers for running many independent flights across worker processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+class WorkerPool:
+    """
+    Thin wrapper around :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    Each worker runs ``initializer(*initargs)`` once, so expensive objects
+    (models, discs, observed flights) are built per worker instead of being
+    pickled with every task. Tasks must therefore be module level functions
+    that read the state set up by the initializer.
+
+    With ``max_workers=1`` the tasks run inline in the calling process, which
+    avoids the process start up cost and is handy for debugging and tests.
+
+    Args:
+        max_workers (int, optional): number of worker processes, defaults to
+            the number of CPUs
+        initializer (Callable, optional): called once in every worker
+        initargs (Tuple): arguments for the initializer
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = (),
+    ):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._initializer = initializer
+        self._initargs = initargs
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def map(self, fn: Callable[[Any], Any], iterable: Iterable, chunksize: int = 1) -> Iterator:
+        """
+        Lazily apply `fn` to every item of `iterable`, preserving order.
+        """
+        if self._max_workers == 1:
+            # another inline pool may have replaced the worker state since
+            # the last call, so always set it up again
+            if self._initializer is not None:
+                self._initializer(*self._initargs)
+            return map(fn, iterable)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=self._initializer,
+                initargs=self._initargs,
+            )
+        return self._executor.map(fn, iterable, chunksize=chunksize)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,57 @@
+"""
+Named quality presets for :meth:`Disc.compute_trajectory`, from a fast
+preview to a reference solution, so that an app can draw a preview of a
+flight at once and replace it with a precise one.
+"""
+
+import math
+from typing import Dict, Tuple
+
+from frispy.integrators import DOP853, RK45, Integrator
+from frispy.reduced import REDUCED, WOBBLE_AVERAGED, ReducedIntegrator
+
+# Backend and tolerances of each preset. Errors are the distance from the
+# landing point of DOP853 at rtol=1e-10 and timings the wall time of
+# compute_trajectory over the cases of the benchmark matrix
+# (research/benchmark.py, run_presets), with the steps needed to draw the
+# spin, see quality_options. Those short steps make the full model accurate
+# to well under a millimeter without wobble.
+QUALITY_PRESETS: Dict[str, Tuple[Integrator, Dict]] = {
+    # at most 1 cm error, 6 cm with wobble; 10 to 115 ms, 55 ms with wobble
+    "preview": (WOBBLE_AVERAGED, {"rtol": 1e-3, "atol": 1e-6}),
+    # the settings of the service: under 1 um error, 8 mm with wobble; 50 ms
+    # to 1.3 s, 2.4 s with wobble
+    "standard": (RK45, {"rtol": 5e-4, "atol": 1e-7}),
+    # under 1 um error, 25 um with wobble; 80 ms to 2.6 s, 7 s with wobble
+    "reference": (DOP853, {"rtol": 1e-8, "atol": 1e-10}),
+}
+
+# longest step, and the most turns of the disc in a step, for drawing the
+# spin in the right direction
+MAX_STEP = 0.1
+MAX_TURNS_PER_STEP = 0.45
+
+
+def quality_options(quality: str, initial_conditions: Dict[str, float]) -> Tuple[Integrator, Dict]:
+    """
+    Backend and solver options of a preset in :data:`QUALITY_PRESETS` for
+    a throw. Every preset returns states at most `MAX_STEP` seconds and
+    `MAX_TURNS_PER_STEP` turns of the disc apart, so the spin can be drawn
+    from them. The full model takes steps that short, the reduced model of
+    the preview samples its dense output. The preview drops the wobble
+    instead of averaging it if the wobble is faster than the spin.
+    """
+    assert quality in QUALITY_PRESETS, f"invalid quality {quality}, use one of {list(QUALITY_PRESETS)}"
+    integrator, options = QUALITY_PRESETS[quality]
+    options = dict(options)
+    spin = abs(initial_conditions["dgamma"])
+    if integrator is WOBBLE_AVERAGED and math.hypot(initial_conditions["dphi"], initial_conditions["dtheta"]) >= spin:
+        integrator = REDUCED
+    hz = spin / math.pi / 2
+    step = min(MAX_STEP, MAX_TURNS_PER_STEP / hz) if hz > 0 else MAX_STEP
+    if isinstance(integrator, ReducedIntegrator):
+        # long steps, sampled from the dense output
+        options["sample_step"] = step
+    else:
+        options["max_step"] = step
+    return integrator, options
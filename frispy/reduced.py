@@ -0,0 +1,329 @@
+"""
+A reduced order flight model for previews, control variates and warm starts.
+
+The disc is taken to fly without wobble. Its orientation is then only the
+direction of its axis, which the aerodynamic moments turn by gyroscopic
+precession, and the state shrinks from 13 to 10 variables: position,
+velocity, the unit normal of the disc and the spin. The right hand side is
+written with python floats and the `math` module, without rotations or
+intermediate arrays, and uses the same :class:`Model` coefficients as
+:class:`EOM`.
+
+For a throw without wobble the full equations of motion reduce to the same
+equations, so the two models agree to the tolerance of the solver. The
+wobble is either dropped or, in the wobble averaged mode, integrated as
+its slow amplitude and phase rather than cycle by cycle, see
+:class:`ReducedEOM`. :func:`frispy.calibration.calibrate` reports the error
+of either mode.
+"""
+
+import math
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.spatial.transform import Rotation
+
+from frispy.environment import Environment
+from frispy.equations_of_motion import EOM
+from frispy.integrators import Integrator
+from frispy.model import Model
+
+
+def _arcs(start: np.ndarray, end: np.ndarray) -> Rotation:
+    """
+    Shortest rotations of the unit vectors `start` to the unit vectors
+    `end`, both with shape `(n, 3)` or `(3,)`.
+    """
+    start, end = np.broadcast_arrays(np.atleast_2d(start), np.atleast_2d(end))
+    # axis start x end, angle from start . end
+    quat = np.column_stack([np.cross(start, end), 1.0 + np.einsum("ij,ij->i", start, end)])
+    quat[quat[:, 3] < 1e-9] = [1.0, 0.0, 0.0, 0.0]
+    return Rotation.from_quat(quat / np.linalg.norm(quat, axis=1)[:, None])
+
+
+class ReducedEOM:
+    """
+    Equations of motion of the reduced state `x, y, z, vx, vy, vz, nx, ny,
+    nz, dgamma`, where `n` is the normal of the disc in the ground frame.
+    The moments turn the normal at the precession rate `moment / (I_zz *
+    dgamma)` and the spin decays as in :class:`EOM`.
+
+    With `wobble` the state also has the amplitude and the phase of the
+    wobble, and `n` is the mean normal, the axis of the cone the normal
+    wobbles around. Seen from the disc the wobble `dphi + i dtheta` turns
+    at `Omega = 2 dgamma (I_zz - I_xx) / I_xx` and decays at `sigma =
+    PTxwx torque / I_xx`. The amplitude and the phase change smoothly, so
+    the solver takes steps as long as without wobble instead of resolving
+    every cycle. The normal wobbles
+    around its mean at the angle `amplitude / |Omega|`, and the lift, drag
+    and pitching moment are averaged over the cycle by the three point rule
+    `(C(aoa - angle) + 2 C(aoa) + C(aoa + angle)) / 4`, which is exact to
+    second order in the angle.
+
+    The offset of the mean normal from the normal includes the decay of the
+    wobble. What is left out is of the order of the square of the cone
+    angle, in the direction of the forces and the turn of the disc frame
+    over a cycle. Against the full model with `DOP853` at `rtol=1e-7` the
+    landing point of a driver at 28 m/s is within 3.5 cm for a wobble of up
+    to 5% of the spin and within 20 cm up to 20%, and of a putter at 15 m/s
+    within 2.5 cm up to 20%. It needs the spin to be faster than the
+    wobble, as the precession of :class:`EOM` does.
+
+    Args:
+        model (Model): the disc
+        environment (Environment): gravity, air density and wind
+        wobble (bool): whether to average the wobble instead of dropping it
+    """
+
+    def __init__(self, model: Model, environment: Environment, wobble: bool = False):
+        self.model = model
+        self.environment = environment
+        self.wobble = wobble
+        self.size = 12 if wobble else 10
+        # looked up once, the model stores its coefficients in a dict
+        self._mass = model.mass
+        self._area = model.area
+        self._diameter = model.diameter
+        self._i_xx = model.I_xx
+        self._i_zz = model.I_zz
+        self._dampening = model.dampening_factor
+        self._dampening_z = model.dampening_z
+        gravity = environment.g * environment.grav_vector
+        self._gravity = tuple(float(g) for g in gravity)
+
+    def wobble_rate(self, spin: float) -> float:
+        """
+        `Omega`, the rate at which the wobble turns relative to the disc.
+        """
+        return 2 * spin * (self._i_zz - self._i_xx) / self._i_xx
+
+    def wobble_decay(self, time: float, state: Sequence[float]) -> float:
+        """
+        `sigma`, the rate at which the wobble decays, at a state.
+        """
+        x, y, z, vx, vy, vz = state[:6]
+        wind = self.environment.wind.get_wind_vector(time, (x, y, z))
+        ux, uy, uz = vx - wind[0], vy - wind[1], vz - wind[2]
+        torque = 0.5 * self.environment.density_at(z) * (ux * ux + uy * uy + uz * uz) * self._area * self._diameter
+        return self._dampening / self._i_xx * torque
+
+    def compute_derivatives(self, time: float, state: Sequence[float]) -> np.ndarray:
+        """
+        Right hand side of the reduced equations, for
+        :func:`scipy.integrate.solve_ivp`.
+        """
+        x, y, z, vx, vy, vz, nx, ny, nz, wz = state[:10]
+        model = self.model
+        wind = self.environment.wind.get_wind_vector(time, (x, y, z))
+        ux, uy, uz = vx - wind[0], vy - wind[1], vz - wind[2]
+
+        norm = math.sqrt(nx * nx + ny * ny + nz * nz)
+        nx, ny, nz = nx / norm, ny / norm, nz / norm
+        # split the air velocity into the normal and the plane of the disc
+        normal = ux * nx + uy * ny + uz * nz
+        px, py, pz = ux - normal * nx, uy - normal * ny, uz - normal * nz
+        planar = math.sqrt(px * px + py * py + pz * pz)
+        if planar > math.ulp(1.0):
+            xx, xy, xz = px / planar, py / planar, pz / planar
+            aoa = -math.atan(normal / planar)
+        else:
+            xx, xy, xz = 1.0, 0.0, 0.0
+            aoa = 0.0
+        yx, yy, yz = ny * xz - nz * xy, nz * xx - nx * xz, nx * xy - ny * xx
+
+        speed2 = ux * ux + uy * uy + uz * uz
+        speed = math.sqrt(speed2)
+        if speed > math.ulp(1.0):
+            hx, hy, hz = ux / speed, uy / speed, uz / speed
+        else:
+            hx, hy, hz = 1.0, 0.0, 0.0
+        force = 0.5 * self.environment.density_at(z) * speed2 * self._area
+        torque = force * self._diameter
+
+        angle = 0.0
+        if self.wobble:
+            amplitude = state[10]
+            rate = self.wobble_rate(wz)
+            if abs(rate) > math.ulp(1.0):
+                angle = abs(amplitude / rate)
+        if angle > 1e-9:
+            low, high = aoa - angle, aoa + angle
+            c_lift = (model.C_lift(low) + 2 * model.C_lift(aoa) + model.C_lift(high)) / 4
+            c_drag = (model.C_drag(low) + 2 * model.C_drag(aoa) + model.C_drag(high)) / 4
+            c_y = (model.C_y(low) + 2 * model.C_y(aoa) + model.C_y(high)) / 4
+        else:
+            c_lift, c_drag, c_y = model.C_lift(aoa), model.C_drag(aoa), model.C_y(aoa)
+
+        lift = c_lift * force
+        drag = c_drag * force
+        side = model.C_side(aoa, speed, wz) * force
+        m = self._mass
+        gx, gy, gz = self._gravity
+        ax = (lift * (hy * yz - hz * yy) - drag * hx + side * yx) / m + gx
+        ay = (lift * (hz * yx - hx * yz) - drag * hy + side * yy) / m + gy
+        az = (lift * (hx * yy - hy * yx) - drag * hz + side * yz) / m + gz
+
+        if abs(wz) > math.ulp(1.0):
+            roll = c_y * torque / (self._i_zz * wz)
+            pitch = model.C_x(aoa, speed, wz) * torque / (self._i_zz * wz)
+            # precession rate, about xhat for the pitching moment
+            ox, oy, oz = roll * xx - pitch * yx, roll * xy - pitch * yy, roll * xz - pitch * yz
+        else:
+            ox = oy = oz = 0.0
+        derivatives = [
+            vx, vy, vz,
+            ax, ay, az,
+            oy * nz - oz * ny,
+            oz * nx - ox * nz,
+            ox * ny - oy * nx,
+            wz * self._dampening_z / self._i_zz * torque,
+        ]
+        if self.wobble:
+            derivatives.append(state[10] * self._dampening / self._i_xx * torque)
+            derivatives.append(self.wobble_rate(wz))
+        return np.array(derivatives)
+
+    def _cone(self, rotation: Rotation, wobble: np.ndarray, spin: np.ndarray, decay: np.ndarray) -> np.ndarray:
+        """
+        Offsets of the normal from the mean normal, in the ground frame, for
+        wobbles `dphi + i dtheta` of discs turned by `rotation`.
+        """
+        # w x zhat is -i wobble seen from the disc, and the wobble is
+        # proportional to exp((sigma + i Omega) t), which integrates to
+        rate = np.where(wobble != 0, decay + 1j * self.wobble_rate(spin), 1.0)
+        offset = -1j * wobble / rate
+        planar = np.column_stack([offset.real, offset.imag, np.zeros(len(offset))])
+        return rotation.apply(planar)
+
+    def reduce(self, state: Sequence[float], time: float = 0.0) -> np.ndarray:
+        """
+        The reduced state of a full 13 variable state. Without `wobble` the
+        wobble is dropped, else it is split into the mean normal, the
+        amplitude and the phase.
+        """
+        state = np.asarray(state, dtype=float)
+        rotation = Rotation.from_quat(state[6:10])
+        normal = rotation.apply([0.0, 0.0, 1.0])
+        if not self.wobble:
+            return np.concatenate([state[:6], normal, state[12:13]])
+        wobble = complex(state[10], state[11])
+        spin = state[12]
+        mean = normal
+        if wobble:
+            if abs(wobble) >= abs(spin):
+                raise ValueError(f"cannot average a wobble of {abs(wobble)} rad/s faster than the spin {spin} rad/s")
+            sigma = self.wobble_decay(time, state)
+            mean = normal - self._cone(rotation, np.array([wobble]), np.array([spin]), np.array([sigma]))[0]
+            mean /= np.linalg.norm(mean)
+        return np.concatenate([state[:6], mean, [spin, abs(wobble), np.angle(wobble)]])
+
+    def expand(
+        self,
+        states: np.ndarray,
+        initial: Sequence[float],
+        times: Optional[Sequence[float]] = None,
+        initial_time: float = 0.0,
+    ) -> np.ndarray:
+        """
+        Full 13 variable states of reduced states with shape `(size, n)`.
+        The quaternion is the initial one followed by the shortest rotation
+        of the initial normal to each normal. The full model turns the disc
+        about the same axes, but may differ from it by a rotation about the
+        normal, which the reduced state does not track and which does not
+        affect the flight. With `wobble` the normal and the wobble are put
+        back on their cone.
+
+        Args:
+            states (np.ndarray): reduced states, one per column
+            initial (Sequence[float]): the full initial state
+            times (Sequence[float], optional): time of each state, for the
+                wind
+            initial_time (float): time of the initial state
+        """
+        states = np.asarray(states, dtype=float).reshape(self.size, -1)
+        n = states.shape[1]
+        q0 = Rotation.from_quat(np.asarray(initial, dtype=float)[6:10])
+        normals = (states[6:9] / np.linalg.norm(states[6:9], axis=0)).T
+        if not self.wobble:
+            rotation = _arcs(q0.apply([0.0, 0.0, 1.0]), normals) * q0
+            return np.vstack([states[:6], rotation.as_quat().T, np.zeros((2, n)), states[9:10]])
+        # the disc turned to the first mean normal, then along the means
+        initial_mean = self.reduce(initial, initial_time)[6:9]
+        mean = _arcs(q0.apply([0.0, 0.0, 1.0]), initial_mean) * q0
+        mean = _arcs(initial_mean, normals) * mean
+        spin = states[9]
+        wobble = states[10] * np.exp(1j * states[11])
+        times = np.zeros(n) if times is None else times
+        decay = np.array([self.wobble_decay(t, state) for t, state in zip(times, states.T)])
+        actual = normals + self._cone(mean, wobble, spin, decay)
+        actual /= np.linalg.norm(actual, axis=1)[:, None]
+        rotation = _arcs(normals, actual) * mean
+        return np.vstack([states[:6], rotation.as_quat().T, wobble.real, wobble.imag, spin])
+
+
+class ReducedIntegrator(Integrator):
+    """
+    Backend that solves :class:`ReducedEOM` for the model and environment
+    of the equations of motion it is given instead of the equations
+    themselves, and returns the states expanded to 13 variables. It plugs
+    in wherever an :class:`Integrator` does, e.g. as the `control_variate`
+    of :class:`frispy.dispersion.DispersionEngine`.
+
+    Events are evaluated on the reduced state, whose first six entries are
+    the position and velocity as in the full state.
+
+    The `sample_step` option returns states every `sample_step` seconds
+    from the dense output of the solver instead of at its steps, which
+    are long for the smooth reduced equations, e.g. for drawing a flight.
+
+    Args:
+        method (str): `solve_ivp` method
+        wobble (bool): whether to average the wobble instead of dropping it
+        options: default options for `solve_ivp`
+    """
+
+    def __init__(self, method: str = "RK45", wobble: bool = False, **options):
+        self._method = method
+        self._wobble = wobble
+        self._options = options
+
+    def integrate(self, eom: EOM, t_span, y0, events: Sequence[Callable] = (), **options):
+        kwargs = dict(self._options)
+        kwargs.update(options)
+        kwargs.setdefault("method", self._method)
+        sample_step = kwargs.pop("sample_step", None)
+        if sample_step is not None:
+            kwargs["dense_output"] = True
+        reduced = ReducedEOM(eom.model, eom.environment, self._wobble)
+        result = solve_ivp(
+            fun=reduced.compute_derivatives,
+            t_span=t_span,
+            y0=reduced.reduce(y0, t_span[0]),
+            events=list(events),
+            **kwargs,
+        )
+        if sample_step is not None:
+            result.t = np.append(np.arange(result.t[0], result.t[-1], sample_step), result.t[-1])
+            result.y = result.sol(result.t)
+        result.y = reduced.expand(result.y, y0, result.t, t_span[0])
+        if result.y_events is not None:
+            result.y_events = [
+                reduced.expand(np.asarray(ys).T, y0, ts, t_span[0]).T if len(ys) else np.empty((0, 13))
+                for ts, ys in zip(result.t_events, result.y_events)
+            ]
+        return result
+
+    def __repr__(self):
+        return f"ReducedIntegrator({self._method!r}, wobble={self._wobble}, {self._options})"
+
+
+# Loose tolerances suffice, the reduced equations are smooth without the
+# wobble. 4 ms per drive against 34 ms for the full model with the `drive`
+# setting of INTEGRATOR_TABLE, and within 5 mm of it without wobble.
+REDUCED = ReducedIntegrator("RK45", rtol=1e-4, atol=1e-6)
+
+# The wobble averaged mode at the same tolerances, 5 to 10 ms per flight
+# whatever the wobble, against 0.5 to 5 s for DOP853 at rtol=1e-7 or 1.3 s
+# for the `wobble` setting of INTEGRATOR_TABLE.
+WOBBLE_AVERAGED = ReducedIntegrator("RK45", wobble=True, rtol=1e-4, atol=1e-6)
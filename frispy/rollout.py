@@ -0,0 +1,182 @@
+"""
+Where a disc comes to rest after it lands: a reduced order model of the
+skips, the slide and the roll along the ground, in closed form.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from frispy.model import Model
+from frispy.terrain import Terrain
+
+if TYPE_CHECKING:
+    from frispy.disc import Landing
+
+
+@dataclass(frozen=True)
+class Ground:
+    """
+    Contact properties of the ground.
+
+    Args:
+        restitution (float): ratio of the normal speed after a skip to
+            before it
+        friction (float): coefficient of sliding friction
+        rolling_resistance (float): coefficient of rolling resistance
+        roll_angle (float): tilt of the disc from the ground in degrees
+            above which it lands on its edge and rolls
+        min_skip_speed (float): normal speed in m/s after an impact below
+            which the disc stays on the ground
+        max_roll_turn (float): largest change of heading in degrees of a
+            roll, a rolling disc falls over before it curls further
+    """
+
+    restitution: float = 0.3
+    friction: float = 0.5
+    rolling_resistance: float = 0.2
+    roll_angle: float = 60.0
+    min_skip_speed: float = 1.0
+    max_roll_turn: float = 180.0
+
+    def __post_init__(self):
+        assert 0 <= self.restitution < 1, "the restitution must be in [0, 1)"
+
+
+@dataclass
+class Rollout:
+    """
+    The rest position of a disc after it lands.
+
+    Args:
+        x (float): m
+        y (float): m
+        z (float): height of the ground there in m
+        time (float): seconds from the landing to the rest
+        mode (str): `slide` after zero or more skips, `roll` on the edge, or
+            `stop` if the flight ended on an obstacle
+        skips (int): bounces before the slide
+        landing (Landing): the landing the rollout continues from
+    """
+
+    x: float
+    y: float
+    z: float
+    time: float
+    mode: str
+    skips: int
+    landing: "Landing"
+
+    @property
+    def distance(self) -> float:
+        """
+        Straight line distance in m from the landing to the rest position.
+        """
+        return math.hypot(self.x - self.landing.x, self.y - self.landing.y)
+
+
+def _normalize(v: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(v)
+    return v / norm if norm > 1e-12 else np.zeros_like(v)
+
+
+def compute_rollout(
+    landing: "Landing",
+    model: Model,
+    ground: Ground = Ground(),
+    g: float = 9.80665,
+    terrain: Optional[Terrain] = None,
+) -> Rollout:
+    """
+    Continue a landing to the rest position. The ground is taken as level
+    around the landing point and the air is ignored.
+
+    A disc landing flatter than `roll_angle` skips: at each impact the
+    normal speed is scaled by the restitution and friction takes up to
+    `friction * (1 + restitution)` times the normal speed off the slip of
+    the lowest point of the rim, which includes the spin. It then flies a
+    ballistic hop. Once the disc no longer bounces it slides to a stop
+    against sliding friction.
+
+    A disc landing on its edge rolls. Friction first matches its speed
+    along the ground and the speed of the rim, so spin can make it roll on
+    or back, then it slows down against rolling resistance along a circle
+    that bends towards the side it leans to.
+
+    Args:
+        landing (Landing): from :meth:`Disc.compute_landing`
+        model (Model): the disc
+        ground (Ground): contact properties
+        g (float): gravitational acceleration in m/s^2
+        terrain (Terrain, optional): for the height of the rest position
+
+    Returns:
+        (Rollout) the rest position
+    """
+
+    def rest(position, time, mode, skips) -> Rollout:
+        x, y = float(position[0]), float(position[1])
+        z = terrain.height(x, y) if terrain is not None else 0.0
+        return Rollout(x=x, y=y, z=z, time=float(time), mode=mode, skips=skips, landing=landing)
+
+    position = np.array([landing.x, landing.y], dtype=float)
+    if landing.obstacle is not None:
+        return rest(position, 0.0, "stop", 0)
+
+    state = landing.state
+    velocity = np.array(state[3:6], dtype=float)
+    zhat = Rotation.from_quat(state[6:10]).apply([0.0, 0.0, 1.0])
+    spin = zhat * state[12]
+    radius = model.diameter / 2
+    # from the center to the lowest point of the rim
+    contact = radius * _normalize(np.array([0.0, 0.0, -1.0]) + zhat[2] * zhat)
+    tilt = math.degrees(math.acos(min(abs(zhat[2]), 1.0)))
+
+    if tilt >= ground.roll_angle:
+        direction = _normalize(np.cross(zhat, [0.0, 0.0, 1.0])[:2])
+        # speed of the center for rolling on the rim without slipping
+        rim = -np.cross(spin, contact)[:2]
+        k = model.I_zz / (model.mass * radius ** 2)
+        speed = (velocity[:2] @ direction + k * (rim @ direction)) / (1 + k)
+        if speed < 0:
+            direction, speed = -direction, -speed
+        if speed < 1e-6 or ground.rolling_resistance <= 0:
+            return rest(position, 0.0, "roll", 0)
+        distance = speed ** 2 / (2 * ground.rolling_resistance * g)
+        time = speed / (ground.rolling_resistance * g)
+        lean = math.radians(90.0 - tilt)
+        side = _normalize(-math.copysign(1.0, zhat[2]) * zhat[:2])
+        turn_radius = speed ** 2 / (g * math.tan(lean)) if lean > 1e-3 else math.inf
+        turn = min(distance / turn_radius, math.radians(ground.max_roll_turn))
+        if turn < 1e-9:
+            position = position + direction * distance
+        else:
+            # an arc of the turn radius, as long as the roll or the turn allows
+            position = position + turn_radius * (math.sin(turn) * direction + (1 - math.cos(turn)) * side)
+        return rest(position, time, "roll", 0)
+
+    normal = max(-velocity[2], 0.0)
+    tangential = velocity[:2].copy()
+    time = 0.0
+    skips = 0
+    while True:
+        restitution = ground.restitution if ground.restitution * normal >= ground.min_skip_speed else 0.0
+        slip = tangential + np.cross(spin, contact)[:2]
+        impulse = min(ground.friction * (1 + restitution) * normal, np.linalg.norm(slip))
+        tangential = tangential - impulse * _normalize(slip)
+        if restitution == 0.0:
+            break
+        normal *= restitution
+        hop = 2 * normal / g
+        position = position + tangential * hop
+        time += hop
+        skips += 1
+
+    speed = np.linalg.norm(tangential)
+    if speed > 1e-9 and ground.friction > 0:
+        position = position + tangential / speed * speed ** 2 / (2 * ground.friction * g)
+        time += speed / (ground.friction * g)
+    return rest(position, time, "slide", skips)
@@ -0,0 +1,135 @@
+"""
+Forward sensitivities of the landing point, found by integrating the
+variational equations alongside the equations of motion.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from frispy.equations_of_motion import EOM
+from frispy.terrain import hit_ground_event
+
+STATE_SIZE = 13
+
+
+@dataclass
+class LandingSensitivity:
+    """
+    The landing point of a flight and its derivatives. Row `i` of
+    `jacobian` is the derivative of `landing[i]` (x, y and time of landing)
+    with respect to each of `parameters`.
+    """
+
+    parameters: List[str]
+    landing: np.ndarray
+    jacobian: np.ndarray
+    state: np.ndarray
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Derivatives keyed by landing value (`x`, `y`, `t`) and parameter.
+        """
+        return {
+            name: dict(zip(self.parameters, row))
+            for name, row in zip(("x", "y", "t"), self.jacobian)
+        }
+
+
+def compute_landing_sensitivity(
+    eom: EOM,
+    y0: np.ndarray,
+    dy0: np.ndarray,
+    parameter_eoms: Sequence[EOM],
+    parameter_steps: Sequence[float],
+    parameters: Sequence[str],
+    t_span: Tuple[float, float],
+    **solver_kwargs,
+) -> LandingSensitivity:
+    """
+    Integrate the state `y` together with its sensitivity matrix
+    `S = dy/dp`, which obeys `S' = J S + df/dp` with `J = df/dy`.
+
+    Column `k` of the right hand side is the derivative of `f` along the
+    direction `(S_k, e_k)` in state and parameter space, so it is found
+    with one extra evaluation of the equations of motion per parameter:
+    `(f_k(y + h_k S_k) - f(y)) / h_k` where `f_k` uses the model with
+    parameter `k` stepped by `h_k`. A gradient therefore costs one
+    augmented flight instead of one flight per parameter.
+
+    Args:
+        eom (EOM): equations of motion at the nominal parameters
+        y0 (np.ndarray): initial state
+        dy0 (np.ndarray): initial sensitivities, shape (13, len(parameters))
+        parameter_eoms (Sequence[EOM]): for each parameter the equations of
+            motion with that parameter stepped by its `parameter_steps`
+            value; the nominal `eom` for initial condition parameters
+        parameter_steps (Sequence[float]): finite difference step of each
+            parameter
+        parameters (Sequence[str]): names of the parameters
+        t_span (Tuple[float, float]): start and maximum end time
+        solver_kwargs: passed to :func:`scipy.integrate.solve_ivp`
+
+    Returns:
+        (LandingSensitivity) landing point and its derivatives
+    """
+    n_params = len(parameters)
+
+    def derivatives(t: float, coordinates: np.ndarray) -> np.ndarray:
+        y = coordinates[:STATE_SIZE]
+        S = coordinates[STATE_SIZE:].reshape(STATE_SIZE, n_params)
+        f = eom.compute_derivatives(t, y)
+        dS = np.empty_like(S)
+        for k in range(n_params):
+            h = parameter_steps[k]
+            dS[:, k] = (parameter_eoms[k].compute_derivatives(t, y + h * S[:, k]) - f) / h
+        return np.concatenate([f, dS.ravel()])
+
+    terrain = eom.environment.terrain
+    result = solve_ivp(
+        fun=derivatives,
+        t_span=t_span,
+        y0=np.concatenate([np.asarray(y0, dtype=float), np.asarray(dy0, dtype=float).ravel()]),
+        events=hit_ground_event(terrain),
+        **solver_kwargs,
+    )
+
+    final = result.y[:, -1]
+    y = final[:STATE_SIZE]
+    S = final[STATE_SIZE:].reshape(STATE_SIZE, n_params)
+    t = result.t[-1]
+    f = eom.compute_derivatives(t, y)
+
+    # the landing time moves so that the height above the ground g stays
+    # zero: dg/dp + dg/dt dt/dp = 0 with g = z - h(x, y)
+    slope_x, slope_y = terrain.gradient(y[0], y[1]) if terrain is not None else (0.0, 0.0)
+    dg = S[2] - slope_x * S[0] - slope_y * S[1]
+    dg_dt = f[2] - slope_x * f[0] - slope_y * f[1]
+    dt = -dg / dg_dt if result.status == 1 else np.zeros(n_params)
+    jacobian = np.stack([S[0] + f[0] * dt, S[1] + f[1] * dt, dt])
+    return LandingSensitivity(
+        parameters=list(parameters),
+        landing=np.array([y[0], y[1], t]),
+        jacobian=jacobian,
+        state=y,
+    )
+
+
+def initial_condition_sensitivity(
+    to_initial_conditions: Callable[[Dict[str, float]], Sequence[float]],
+    release_conditions: Dict[str, float],
+    name: str,
+    step: float,
+) -> np.ndarray:
+    """
+    Central difference of the initial state with respect to one of the
+    release conditions, e.g. `hyzer`, which enters the state through the
+    orientation quaternion.
+    """
+    up = dict(release_conditions)
+    down = dict(release_conditions)
+    up[name] = release_conditions.get(name, 0) + step
+    down[name] = release_conditions.get(name, 0) - step
+    return (np.asarray(to_initial_conditions(up)) - np.asarray(to_initial_conditions(down))) / (2 * step)
@@ -0,0 +1,239 @@
+"""
+Shooting solver: release parameters that land a throw at a target point,
+optionally without going above a ceiling.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from frispy.disc import Landing
+from frispy.integrators import Integrator
+from frispy.model import Model
+from frispy.sweep import Sweep, SweepResult
+from frispy.throw import Throw
+
+
+@dataclass
+class ShootingResult:
+    """
+    Args:
+        throw (Throw): the best release found
+        landing (Landing): where it lands
+        error (float): distance from the landing point to the target in
+            meters
+        flights (int): flights flown by the solver, not counting the table
+        converged (bool): whether the landing is within the tolerance and
+            the flight stays below the ceiling
+    """
+
+    throw: Throw
+    landing: Landing
+    error: float
+    flights: int
+    converged: bool
+
+
+def shooting_table(
+    model: Model,
+    throw: Throw,
+    axes: Dict[str, Sequence[float]],
+    **sweep_kwargs,
+) -> SweepResult:
+    """
+    Coarse table of landing points over the solved parameters, used by
+    :func:`solve_release` for its first guess and Jacobian. It only depends
+    on the disc and the parameters that are not solved for, so one table
+    serves every target. `sweep_kwargs` are passed to :class:`Sweep`.
+    """
+    with Sweep(model, throw, axes, metrics=("distance", "lateral", "max_height"), **sweep_kwargs) as sweep:
+        return sweep.run()
+
+
+class _Residual:
+    """
+    Landing point minus the target, and the height above the ceiling if
+    there is one, of the throw with the solved parameters set to `p`. The
+    height residual is negative below the ceiling and only constrains the
+    solution while it is positive.
+    """
+
+    def __init__(self, model, throw, names, target, ceiling, air_density, integrator, solver_kwargs):
+        self.model = model
+        self.throw = throw
+        self.names = names
+        self.target = np.asarray(target, dtype=float)
+        self.ceiling = ceiling
+        self.air_density = air_density
+        self.integrator = integrator
+        self.solver_kwargs = solver_kwargs
+        self.flights = 0
+
+    def throw_at(self, p: np.ndarray) -> Throw:
+        return self.throw.replace(**dict(zip(self.names, map(float, p))))
+
+    def __call__(self, p: np.ndarray) -> Tuple[np.ndarray, Landing]:
+        self.flights += 1
+        landing = self.throw_at(p).disc(self.model, self.air_density).compute_landing(
+            integrator=self.integrator, **self.solver_kwargs
+        )
+        return self.from_metrics(np.array([landing.x, landing.y, landing.max_height])), landing
+
+    def from_metrics(self, metrics: np.ndarray) -> np.ndarray:
+        """
+        Residuals of (distance, lateral, max_height) along the last axis.
+        """
+        offset = np.append(self.target, self.ceiling if self.ceiling is not None else np.nan)
+        r = metrics - offset
+        return r if self.ceiling is not None else r[..., :2]
+
+    @staticmethod
+    def active(r: np.ndarray) -> np.ndarray:
+        return np.append([True, True], r[2:] > 0)
+
+    @classmethod
+    def norm(cls, r: np.ndarray) -> float:
+        return float(np.linalg.norm(r[cls.active(r)]))
+
+
+def _warm_start(table: SweepResult, residual: _Residual) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The table point closest to the target and the Jacobian of the residual
+    there from differences with its neighbours.
+    """
+    metrics = np.stack([table[m] for m in ("distance", "lateral", "max_height")], axis=-1)
+    grid = residual.from_metrics(metrics)
+    misses = np.linalg.norm(grid[..., :2], axis=-1)
+    if residual.ceiling is not None and np.any(grid[..., 2] <= 0):
+        # start below the ceiling, the height is the harder residual to fix
+        misses = np.where(grid[..., 2] <= 0, misses, np.nan)
+    index = np.unravel_index(np.nanargmin(misses), table.shape)
+    p = np.array([table.axes[name][i] for name, i in zip(residual.names, index)])
+
+    jacobian = np.zeros((grid.shape[-1], len(p)))
+    for k, name in enumerate(residual.names):
+        values = table.axes[name]
+        low, high = max(index[k] - 1, 0), min(index[k] + 1, len(values) - 1)
+        below = index[:k] + (low,) + index[k + 1:]
+        above = index[:k] + (high,) + index[k + 1:]
+        jacobian[:, k] = (grid[above] - grid[below]) / (values[high] - values[low])
+    return p, np.nan_to_num(jacobian)
+
+
+def _newton_step(jacobian, r, p, low, high) -> np.ndarray:
+    """
+    Least squares Newton step, holding parameters at a bound it pushes
+    against so that the others still make progress.
+    """
+    active = _Residual.active(r)
+    free = np.ones(len(p), dtype=bool)
+    step = np.zeros(len(p))
+    while free.any():
+        step[:] = 0
+        step[free] = -np.linalg.lstsq(jacobian[active][:, free], r[active], rcond=None)[0]
+        blocked = free & (((p <= low) & (step < 0)) | ((p >= high) & (step > 0)))
+        if not blocked.any():
+            break
+        free &= ~blocked
+    return step
+
+
+def solve_release(
+    model: Model,
+    throw: Throw,
+    target: Tuple[float, float],
+    parameters: Sequence[str] = ("hyzer", "nose_up"),
+    table: Optional[SweepResult] = None,
+    ceiling: Optional[float] = None,
+    tolerance: float = 0.1,
+    max_flights: int = 20,
+    max_step: float = 10.0,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    air_density: float = 1.225,
+    integrator: Union[Integrator, str] = "auto",
+    solver_kwargs: Optional[Dict] = None,
+) -> ShootingResult:
+    """
+    Find values of `parameters` for which `throw` lands at `target`.
+
+    The first guess and Jacobian come from `table` if given (see
+    :func:`shooting_table`), otherwise from `throw` and forward differences.
+    The solver then takes Newton steps with the Jacobian updated by
+    Broyden's method from the flights it has already flown, so every
+    iteration costs one landing-only flight. A step that does not reduce
+    the residual is rejected and the next one, from the updated Jacobian, is
+    limited to half its size.
+
+    With a `ceiling` the height above it is a third residual. Solving for a
+    third parameter, e.g. `("hyzer", "nose_up", "uphill")`, leaves room to
+    meet it; with two parameters the solver finds a least squares
+    compromise.
+
+    Args:
+        model (Model): the disc
+        throw (Throw): release with the values of the other parameters
+        target (Tuple[float, float]): landing x and y in meters
+        parameters (Sequence[str]): fields of :class:`Throw` to solve for
+        table (SweepResult, optional): coarse table over `parameters`
+        ceiling (float, optional): maximum height in meters
+        tolerance (float): distance to the target in meters to stop at
+        max_flights (int): flights the solver may fly
+        max_step (float): largest change of any parameter in one step, in
+            its units
+        bounds (Dict[str, Tuple[float, float]], optional): limits of each
+            parameter, by default the range of the table
+        air_density (float): kg/m^3
+        integrator (Union[Integrator, str]): backend for every flight
+        solver_kwargs (Dict, optional): passed to :meth:`Disc.compute_landing`
+
+    Returns:
+        ShootingResult
+    """
+    names = tuple(parameters)
+    residual = _Residual(model, throw, names, target, ceiling, air_density, integrator, solver_kwargs or {})
+    if bounds is None and table is not None:
+        bounds = {name: (table.axes[name].min(), table.axes[name].max()) for name in names}
+    bounds = bounds or {}
+    low = np.array([bounds.get(name, (-np.inf, np.inf))[0] for name in names])
+    high = np.array([bounds.get(name, (-np.inf, np.inf))[1] for name in names])
+
+    if table is not None:
+        assert list(table.axes) == list(names), "the table must be over the solved parameters"
+        p, jacobian = _warm_start(table, residual)
+        r, landing = residual(p)
+    else:
+        p = np.array([getattr(throw, name) for name in names], dtype=float)
+        r, landing = residual(p)
+        jacobian = np.empty((len(r), len(p)))
+        for k in range(len(p)):
+            step = np.zeros(len(p))
+            step[k] = 0.5  # degrees or m/s
+            jacobian[:, k] = (residual(p + step)[0] - r) / step[k]
+
+    def done(r: np.ndarray) -> bool:
+        return np.hypot(r[0], r[1]) < tolerance and (ceiling is None or r[2] <= 0)
+
+    radius = max_step
+    while not done(r) and residual.flights < max_flights and radius > 1e-3:
+        step = _newton_step(jacobian, r, p, low, high)
+        step *= min(1.0, radius / max(np.abs(step).max(), 1e-12))
+        p_new = np.clip(p + step, low, high)
+        r_new, landing_new = residual(p_new)
+        # Broyden's update with every flight, accepted or not
+        dp = p_new - p
+        if dp @ dp > 0:
+            jacobian += np.outer(r_new - r - jacobian @ dp, dp) / (dp @ dp)
+        if residual.norm(r_new) < residual.norm(r):
+            p, r, landing = p_new, r_new, landing_new
+            radius = min(2 * radius, max_step)
+        else:
+            radius = np.abs(dp).max() / 2
+
+    return ShootingResult(
+        throw=residual.throw_at(p),
+        landing=landing,
+        error=float(np.hypot(r[0], r[1])),
+        flights=residual.flights,
+        converged=bool(done(r)),
+    )
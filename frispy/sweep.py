@@ -0,0 +1,330 @@
+"""
+Evaluate landing metrics on an N-dimensional grid of release and model
+parameters, e.g. distance against hyzer and nose angle for a few masses.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import fields
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from frispy.disc import Disc
+from frispy.integrators import Integrator
+from frispy.model import Model
+from frispy.parallel import WorkerPool
+from frispy.throw import Throw
+
+# distance is along x and lateral along y, both in meters
+METRICS = ("distance", "lateral", "max_height", "flight_time")
+
+THROW_PARAMETERS = tuple(f.name for f in fields(Throw))
+
+
+class SweepResult:
+    """
+    Metrics on a grid, labeled by parameter and metric name. Points that
+    have not been computed, or whose flight failed, hold NaN.
+
+    Args:
+        axes (Dict[str, Sequence[float]]): grid values of each parameter, in
+            the order of the array dimensions
+        metrics (Sequence[str]): names of the metrics in the last dimension
+        values (np.ndarray, optional): the metrics, shape
+            `(len(axis) for each axis) + (len(metrics),)`
+        done (np.ndarray, optional): which points have been computed
+            successfully
+        inputs (str): digest of everything else the metrics depend on, see
+            :func:`inputs_hash`; a checkpoint only resumes a sweep with the
+            same digest
+    """
+
+    def __init__(
+        self,
+        axes: Dict[str, Sequence[float]],
+        metrics: Sequence[str] = METRICS,
+        values: Optional[np.ndarray] = None,
+        done: Optional[np.ndarray] = None,
+        inputs: str = "",
+    ):
+        self.inputs = inputs
+        self.axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+        self.metrics = tuple(metrics)
+        shape = self.shape
+        self.values = np.full(shape + (len(self.metrics),), np.nan) if values is None else values
+        self.done = np.zeros(shape, dtype=bool) if done is None else done
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(values) for values in self.axes.values())
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.done.all())
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        """
+        The grid of one metric.
+        """
+        return self.values[..., self.metrics.index(metric)]
+
+    def point(self, index: Tuple[int, ...]) -> Dict[str, float]:
+        """
+        Parameter values at a grid index.
+        """
+        return {name: float(values[i]) for (name, values), i in zip(self.axes.items(), index)}
+
+    def sel(self, **coordinates: float) -> "SweepResult":
+        """
+        The sub grid at the given values of some parameters, which are
+        dropped from the axes.
+        """
+        index = []
+        axes = {}
+        for name, values in self.axes.items():
+            if name in coordinates:
+                matches = np.flatnonzero(np.isclose(values, coordinates[name]))
+                assert len(matches), f"{name}={coordinates[name]} is not on the grid"
+                index.append(matches[0])
+            else:
+                index.append(slice(None))
+                axes[name] = values
+        index = tuple(index)
+        return SweepResult(axes, self.metrics, self.values[index], self.done[index], self.inputs)
+
+    def argmax(self, metric: str) -> Dict[str, float]:
+        """
+        Parameter values of the grid point with the largest `metric`.
+        """
+        grid = self[metric]
+        return self.point(np.unravel_index(np.nanargmax(grid), grid.shape))
+
+    def save(self, path: str) -> None:
+        """
+        Write to an `.npz` file, atomically so that an interrupted save
+        leaves the previous checkpoint intact.
+        """
+        arrays = {f"axis_{i}": values for i, values in enumerate(self.axes.values())}
+        temporary = f"{path}.tmp.npz"
+        np.savez(
+            temporary,
+            names=np.array(list(self.axes)),
+            metrics=np.array(self.metrics),
+            values=self.values,
+            done=self.done,
+            inputs=np.array(self.inputs),
+            **arrays,
+        )
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SweepResult":
+        with np.load(path) as data:
+            axes = {str(name): data[f"axis_{i}"] for i, name in enumerate(data["names"])}
+            metrics = [str(m) for m in data["metrics"]]
+            inputs = str(data["inputs"]) if "inputs" in data.files else ""
+            return cls(axes, metrics, data["values"], data["done"], inputs)
+
+    def matches(self, other: "SweepResult") -> bool:
+        return (
+            self.inputs == other.inputs
+            and list(self.axes) == list(other.axes)
+            and self.metrics == other.metrics
+            and all(np.array_equal(self.axes[k], other.axes[k]) for k in self.axes)
+        )
+
+
+def inputs_hash(
+    model: Model,
+    throw: Throw,
+    air_density: float,
+    integrator: Union[Integrator, str],
+    solver_kwargs: Dict,
+) -> str:
+    """
+    Hex digest of the inputs of a sweep other than its grid: the content
+    hash of the model, the base throw, the air density and the integrator
+    with its options.
+    """
+    inputs = {
+        "model": [type(model).__name__, model.content_hash],
+        "throw": throw.as_dict(),
+        "air_density": air_density,
+        "integrator": repr(integrator),
+        "solver_kwargs": solver_kwargs,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+_worker = None
+
+
+def _init_worker(model, throw, axes, metrics, air_density, integrator, solver_kwargs) -> None:
+    global _worker
+    _worker = {
+        "model": model,
+        "throw": throw,
+        "axes": axes,
+        "metrics": metrics,
+        "air_density": air_density,
+        "integrator": integrator,
+        "solver_kwargs": solver_kwargs,
+        # the disc of the last point; its model and wind are reused while
+        # only release parameters change, which is every point for sweeps
+        # with the model axes first
+        "key": None,
+        "disc": None,
+    }
+
+
+def _disc(model_values: Dict[str, float], throw: Throw) -> Disc:
+    worker = _worker
+    key = (tuple(model_values.items()), throw.wind_speed, throw.wind_angle)
+    if key != worker["key"]:
+        model = worker["model"]
+        if model_values:
+            model = model.with_coefficients(**model_values)
+        worker["disc"] = throw.disc(model, worker["air_density"])
+        worker["key"] = key
+    else:
+        worker["disc"].set_default_initial_conditions(throw.initial_conditions())
+        worker["disc"].reset_initial_conditions()
+    return worker["disc"]
+
+
+def _evaluate(indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    worker = _worker
+    names = list(worker["axes"])
+    shape = tuple(len(v) for v in worker["axes"].values())
+    values = np.full((len(indices), len(worker["metrics"])), np.nan)
+    ok = np.zeros(len(indices), dtype=bool)
+    for row, flat in enumerate(indices):
+        point = {
+            name: float(worker["axes"][name][i])
+            for name, i in zip(names, np.unravel_index(flat, shape))
+        }
+        release = {k: v for k, v in point.items() if k in THROW_PARAMETERS}
+        model_values = {k: v for k, v in point.items() if k not in THROW_PARAMETERS}
+        try:
+            disc = _disc(model_values, worker["throw"].replace(**release))
+            landing = disc.compute_landing(integrator=worker["integrator"], **worker["solver_kwargs"])
+        except Exception as e:
+            logging.error("flight failed at %s: %s", point, e)
+            continue
+        metrics = {
+            "distance": landing.x,
+            "lateral": landing.y,
+            "max_height": landing.max_height,
+            "flight_time": landing.time,
+        }
+        values[row] = [metrics[m] for m in worker["metrics"]]
+        ok[row] = True
+    return indices, values, ok
+
+
+class Sweep:
+    """
+    Landing metrics on the grid spanned by `axes` around a base throw.
+
+    Each axis is either a field of :class:`Throw` (`v`, `spin`, `hyzer`,
+    `nose_up`, `uphill`, `wx`, `wy`, `z`, `wind_speed`, `wind_angle`) or a
+    coefficient of the model (e.g. `mass`, `I_zz`, `PD0`). Points are
+    flown landing-only in chunks in a process pool. Each worker keeps the
+    disc of its last point and only resets the initial conditions while
+    the model and wind stay the same, so put model axes first.
+
+    Args:
+        model (Model): the disc
+        throw (Throw): values of the parameters that are not swept
+        axes (Dict[str, Sequence[float]]): grid values of each parameter
+        metrics (Sequence[str]): any of :data:`METRICS`
+        air_density (float): kg/m^3
+        integrator (Union[Integrator, str]): backend for every flight
+        solver_kwargs (Dict, optional): passed to :meth:`Disc.compute_landing`
+        max_workers (int, optional): size of the process pool
+        chunk_size (int): points per task
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        throw: Throw,
+        axes: Dict[str, Sequence[float]],
+        metrics: Sequence[str] = METRICS,
+        air_density: float = 1.225,
+        integrator: Union[Integrator, str] = "auto",
+        solver_kwargs: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16,
+    ):
+        for name in axes:
+            assert name in THROW_PARAMETERS or name in model.coefficients, f"invalid parameter name {name}"
+        for metric in metrics:
+            assert metric in METRICS, f"invalid metric {metric}"
+        self._axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+        self._metrics = tuple(metrics)
+        self._inputs = inputs_hash(model, throw, air_density, integrator, solver_kwargs or {})
+        self._chunk_size = chunk_size
+        self._pool = WorkerPool(
+            max_workers,
+            initializer=_init_worker,
+            initargs=(model, throw, self._axes, self._metrics, air_density, integrator, solver_kwargs or {}),
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> "Sweep":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def stream(
+        self, checkpoint: Optional[str] = None, checkpoint_every: int = 8
+    ) -> Iterator[SweepResult]:
+        """
+        Compute the missing points, yielding the partial result after every
+        window of chunks. The same :class:`SweepResult` is updated in place.
+
+        Args:
+            checkpoint (str, optional): `.npz` file to resume from if it
+                holds a sweep over the same grid and inputs, and to save
+                progress to
+            checkpoint_every (int): chunks between saves
+        """
+        result = SweepResult(self._axes, self._metrics, inputs=self._inputs)
+        if checkpoint and os.path.exists(checkpoint):
+            saved = SweepResult.load(checkpoint)
+            if saved.matches(result):
+                result = saved
+            else:
+                logging.warning("ignoring checkpoint %s of a different sweep", checkpoint)
+
+        todo = np.flatnonzero(~result.done.ravel())
+        tasks = [todo[i:i + self._chunk_size] for i in range(0, len(todo), self._chunk_size)]
+        if not tasks:
+            yield result
+            return
+        values = result.values.reshape(-1, len(self._metrics))
+        done = result.done.reshape(-1)
+        window = max(checkpoint_every, self._pool.max_workers)
+        for start in range(0, len(tasks), window):
+            for indices, chunk, ok in self._pool.map(_evaluate, tasks[start:start + window]):
+                values[indices] = chunk
+                # failed flights stay to do, so a resumed sweep tries them again
+                done[indices[ok]] = True
+            if checkpoint:
+                result.save(checkpoint)
+            yield result
+
+    def run(self, checkpoint: Optional[str] = None, checkpoint_every: int = 8) -> SweepResult:
+        """
+        Compute every point of the grid, see :meth:`stream`.
+        """
+        for result in self.stream(checkpoint, checkpoint_every):
+            pass
+        return result
@@ -0,0 +1,151 @@
+"""
+A ``Model`` with measured lift, drag and pitching moment polars in place of
+the fitted formulas.
+"""
+
+import hashlib
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from frispy.model import FrozenModel, Model
+
+# polar column in a CSV file and the scale factor it replaces
+POLARS = {"lift": "C_lift", "drag": "C_drag", "pitch": "C_y"}
+
+
+class _Table:
+    """
+    A polar interpolated with a monotone cubic (PCHIP) through the measured
+    points and sampled once on a uniform grid over [-pi/2, pi/2], so that
+    every lookup is a linear interpolation between two neighbours. Outside
+    the measured angles the polar keeps its value at the nearest one.
+    """
+
+    def __init__(self, alpha: np.ndarray, values: np.ndarray, samples: int):
+        order = np.argsort(alpha)
+        alpha, values = alpha[order], values[order]
+        assert len(alpha) >= 2 and np.all(np.diff(alpha) > 0), "a polar needs two or more distinct angles"
+        self.grid = np.linspace(-math.pi / 2, math.pi / 2, samples)
+        self.values = PchipInterpolator(alpha, values)(np.clip(self.grid, alpha[0], alpha[-1]))
+        self._start = self.grid[0]
+        self._step = self.grid[1] - self.grid[0]
+        self._last = samples - 2
+        # python floats are faster to index and add than numpy scalars
+        self._list: List[float] = self.values.tolist()
+
+    def __call__(self, alpha: float) -> float:
+        x = (alpha - self._start) / self._step
+        i = min(max(int(x), 0), self._last)
+        low = self._list[i]
+        return low + (self._list[i + 1] - low) * (x - i)
+
+    def array(self, alpha: np.ndarray) -> np.ndarray:
+        return np.interp(alpha, self.grid, self.values)
+
+
+class TabulatedModel(Model):
+    """
+    Model whose lift (`C_lift`), drag (`C_drag`) and pitching moment
+    (`C_y`) come from measured polars. Scale factors without a polar use the
+    formulas of :class:`Model` and its coefficients, as do the mass,
+    inertia and dimensions.
+
+    Args:
+        polars (Dict[str, Tuple[Sequence[float], Sequence[float]]]): angles
+            of attack in radians and the measured values, keyed by `lift`,
+            `drag` or `pitch`
+        samples (int): size of the lookup table of each polar
+        kwargs: coefficients of :class:`Model`
+    """
+
+    def __init__(
+        self,
+        polars: Optional[Dict[str, Tuple[Sequence[float], Sequence[float]]]] = None,
+        samples: int = 3601,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._tables: Dict[str, _Table] = {}
+        for name, (alpha, values) in (polars or {}).items():
+            assert name in POLARS, f"invalid polar {name}, use one of {list(POLARS)}"
+            self._tables[POLARS[name]] = _Table(
+                np.asarray(alpha, dtype=float), np.asarray(values, dtype=float), samples
+            )
+
+    @classmethod
+    def from_csv(cls, path: str, degrees: bool = True, samples: int = 3601, **kwargs) -> "TabulatedModel":
+        """
+        Load polars from a CSV file with a header row, an `alpha` column and
+        any of the `lift`, `drag` and `pitch` columns. Empty cells are
+        skipped, so the polars may be measured at different angles.
+
+        Args:
+            path (str): the CSV file
+            degrees (bool): whether `alpha` is in degrees, else radians
+            samples (int): size of the lookup table of each polar
+            kwargs: coefficients of :class:`Model`
+        """
+        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, ndmin=1)
+        assert "alpha" in data.dtype.names, f"{path} has no alpha column"
+        alpha = np.radians(data["alpha"]) if degrees else data["alpha"]
+        polars = {}
+        for name in POLARS:
+            if name in data.dtype.names:
+                measured = ~np.isnan(data[name]) & ~np.isnan(alpha)
+                polars[name] = (alpha[measured], data[name][measured])
+        return cls(polars, samples, **kwargs)
+
+    @property
+    def polars(self) -> List[str]:
+        """
+        The scale factors that come from polars.
+        """
+        return list(self._tables)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Hex digest of the coefficients and the lookup tables of the polars.
+        """
+        digest = hashlib.sha256(super().content_hash.encode())
+        for name in sorted(self._tables):
+            digest.update(name.encode())
+            digest.update(self._tables[name].values.tobytes())
+        return digest.hexdigest()
+
+    def freeze(self) -> FrozenModel:
+        # a FrozenModel holds coefficients only and would drop the polars
+        raise TypeError("a TabulatedModel cannot be frozen, its polars are not coefficients")
+
+    def with_coefficients(self, **values: float) -> "TabulatedModel":
+        model = super().with_coefficients(**values)
+        # the polars are measured and do not depend on the coefficients
+        model._tables = self._tables
+        return model
+
+    def C_lift(self, alpha: float) -> float:
+        table = self._tables.get("C_lift")
+        return table(Model.normalizeAlpha(alpha)) if table else super().C_lift(alpha)
+
+    def C_drag(self, alpha: float) -> float:
+        table = self._tables.get("C_drag")
+        return table(Model.normalizeAlpha(alpha)) if table else super().C_drag(alpha)
+
+    def C_y(self, alpha: float) -> float:
+        table = self._tables.get("C_y")
+        return table(Model.normalizeAlpha(alpha)) if table else super().C_y(alpha)
+
+    def C_lift_array(self, alpha: np.ndarray) -> np.ndarray:
+        table = self._tables.get("C_lift")
+        return table.array(Model.normalizeAlpha_array(alpha)) if table else super().C_lift_array(alpha)
+
+    def C_drag_array(self, alpha: np.ndarray) -> np.ndarray:
+        table = self._tables.get("C_drag")
+        return table.array(Model.normalizeAlpha_array(alpha)) if table else super().C_drag_array(alpha)
+
+    def C_y_array(self, alpha: np.ndarray) -> np.ndarray:
+        table = self._tables.get("C_y")
+        return table.array(Model.normalizeAlpha_array(alpha)) if table else super().C_y_array(alpha)
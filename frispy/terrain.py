@@ -0,0 +1,119 @@
+"""
+The ground under a flight as a heightmap, e.g. from a digital elevation
+model of a course.
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from frispy._memmap import MemoryMapped
+
+
+class Terrain(MemoryMapped):
+    """
+    Heights of the ground on a regular grid, interpolated bilinearly. The
+    heights are in the frame of the flight, so a terrain that is 0 at the
+    release point keeps `z` the release height above the ground. Outside
+    the grid the height of the nearest edge is used.
+
+    The heightmap can be saved with :meth:`save` and memory mapped with
+    :meth:`load`, see :class:`MemoryMapped`.
+
+    Args:
+        heights (np.ndarray): heights in m with shape `(nx, ny)`
+        origin (Sequence[float]): x and y of `heights[0, 0]` in m
+        spacing (Sequence[float]): distance between grid points along x and
+            y in m
+    """
+
+    _array = "_heights"
+
+    def __init__(
+        self,
+        heights: np.ndarray,
+        origin: Sequence[float] = (0.0, 0.0),
+        spacing: Sequence[float] = (1.0, 1.0),
+    ):
+        assert heights.ndim == 2 and min(heights.shape) >= 2, \
+            f"expected a grid of heights of at least 2 x 2, got shape {heights.shape}"
+        self._heights = heights
+        self.origin = tuple(float(o) for o in origin)
+        self.spacing = tuple(float(s) for s in spacing)
+        self._last = (heights.shape[0] - 1, heights.shape[1] - 1)
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self._heights
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int, float, float]:
+        u = min(max((x - self.origin[0]) / self.spacing[0], 0.0), self._last[0])
+        v = min(max((y - self.origin[1]) / self.spacing[1], 0.0), self._last[1])
+        i = min(int(u), self._last[0] - 1)
+        j = min(int(v), self._last[1] - 1)
+        return i, j, u - i, v - j
+
+    def height(self, x: float, y: float) -> float:
+        """
+        Height of the ground at one point.
+        """
+        i, j, fx, fy = self._cell(x, y)
+        h = self._heights
+        low = h[i, j] + (h[i + 1, j] - h[i, j]) * fx
+        high = h[i, j + 1] + (h[i + 1, j + 1] - h[i, j + 1]) * fx
+        return float(low + (high - low) * fy)
+
+    def gradient(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Slope of the ground, dh/dx and dh/dy, at one point. It is zero
+        across the edges of the grid, where the height is held constant.
+        """
+        i, j, fx, fy = self._cell(x, y)
+        h = self._heights
+        dx = ((h[i + 1, j] - h[i, j]) * (1 - fy) + (h[i + 1, j + 1] - h[i, j + 1]) * fy) / self.spacing[0]
+        dy = ((h[i, j + 1] - h[i, j]) * (1 - fx) + (h[i + 1, j + 1] - h[i + 1, j]) * fx) / self.spacing[1]
+        inside_x = self.origin[0] <= x <= self.origin[0] + self._last[0] * self.spacing[0]
+        inside_y = self.origin[1] <= y <= self.origin[1] + self._last[1] * self.spacing[1]
+        return float(dx) if inside_x else 0.0, float(dy) if inside_y else 0.0
+
+    def heights_at(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Heights of the ground at many points at once.
+        """
+        u = np.clip((np.asarray(x, dtype=float) - self.origin[0]) / self.spacing[0], 0, self._last[0])
+        v = np.clip((np.asarray(y, dtype=float) - self.origin[1]) / self.spacing[1], 0, self._last[1])
+        i = np.minimum(u.astype(int), self._last[0] - 1)
+        j = np.minimum(v.astype(int), self._last[1] - 1)
+        fx, fy = u - i, v - j
+        h = self._heights
+        low = h[i, j] + (h[i + 1, j] - h[i, j]) * fx
+        high = h[i, j + 1] + (h[i + 1, j + 1] - h[i, j + 1]) * fx
+        return low + (high - low) * fy
+
+    @classmethod
+    def plane(cls, slope_x: float = 0.0, slope_y: float = 0.0, size: float = 1000.0) -> "Terrain":
+        """
+        A flat slope through the origin, rising `slope_x` meters per meter
+        along x and `slope_y` along y, over a square of `size` meters.
+        """
+        corners = np.array([-size / 2, size / 2])
+        return cls(slope_x * corners[:, None] + slope_y * corners[None, :], (-size / 2, -size / 2), (size, size))
+
+    def _geometry(self) -> Dict:
+        return {"origin": list(self.origin), "spacing": list(self.spacing)}
+
+
+def hit_ground_event(terrain: Optional[Terrain] = None) -> Callable[[float, np.ndarray], float]:
+    """
+    Terminal `solve_ivp` event for the disc reaching the ground, the height
+    above `terrain` or above `z = 0` without one. The solvers locate it by
+    root finding on their dense output.
+    """
+    if terrain is None:
+        def hit_ground(t, y): return y[2]
+    else:
+        height = terrain.height
+
+        def hit_ground(t, y): return y[2] - height(y[0], y[1])
+    hit_ground.terminal = True
+    return hit_ground
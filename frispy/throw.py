@@ -0,0 +1,76 @@
+"""
+The release of a throw in the units it is measured in, converted to the
+initial conditions and environment of a :class:`Disc`.
+"""
+
+import math
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Optional
+
+import numpy as np
+
+from frispy.atmosphere import Atmosphere
+from frispy.disc import Disc
+from frispy.environment import Environment
+from frispy.model import Model
+from frispy.wind import ConstantWind
+
+
+@dataclass(frozen=True)
+class Throw:
+    """
+    Release parameters of a throw. The disc moves in the `x` direction with
+    `z` up, so `y` points to the left.
+
+    Args:
+        v (float): release speed in m/s
+        spin (float): spin in rad/s, negative is clockwise from above (RHBH)
+        hyzer (float): hyzer angle in degrees
+        nose_up (float): nose angle in degrees
+        uphill (float): angle of the velocity above the horizon in degrees
+        wx (float): wobble angular velocity about the x axis in rad/s
+        wy (float): wobble angular velocity about the y axis in rad/s
+        z (float): release height in meters
+        wind_speed (float): wind speed in m/s
+        wind_angle (float): direction the wind blows towards in radians, 0
+            is a tailwind and pi/2 blows from right to left
+    """
+
+    v: float
+    spin: float
+    hyzer: float = 0.0
+    nose_up: float = 0.0
+    uphill: float = 0.0
+    wx: float = 0.0
+    wy: float = 0.0
+    z: float = 1.0
+    wind_speed: float = 0.0
+    wind_angle: float = 0.0
+
+    def initial_conditions(self) -> Dict[str, float]:
+        a = self.uphill * math.pi / 180
+        return {
+            "vx": math.cos(a) * self.v,
+            "vz": math.sin(a) * self.v,
+            "dgamma": self.spin,
+            "dphi": self.wx,
+            "dtheta": self.wy,
+            "z": self.z,
+            "nose_up": self.nose_up,
+            "hyzer": self.hyzer,
+        }
+
+    def wind_vector(self) -> np.ndarray:
+        return np.array([math.cos(self.wind_angle), math.sin(self.wind_angle), 0]) * self.wind_speed
+
+    def environment(self, air_density: float = 1.225, atmosphere: Optional[Atmosphere] = None) -> Environment:
+        return Environment(wind=ConstantWind(self.wind_vector()), air_density=air_density, atmosphere=atmosphere)
+
+    def disc(self, model: Model, air_density: float = 1.225, atmosphere: Optional[Atmosphere] = None) -> Disc:
+        return Disc(model, self.initial_conditions(), environment=self.environment(air_density, atmosphere))
+
+    def replace(self, **values: float) -> "Throw":
+        return replace(self, **values)
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
@@ -3,11 +3,15 @@ The ``Wind`` class handles the wind, which is a real-valued time-dependent
 vector field that influences the flight of the disc.
 """
 
+import copy
+import itertools
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 import numpy as np
 
+from frispy._memmap import MemoryMapped
+
 
 class Wind(ABC):
     """
@@ -16,6 +20,10 @@ class Wind(ABC):
     dependence to mimic "gusts".
     """
 
+    # True if the wind is the same at every position, which lets the
+    # equations of motion skip derivatives with respect to position
+    uniform: bool = False
+
     @abstractmethod
     def get_wind_vector(
         self,
@@ -33,6 +41,8 @@ class NoWind(Wind):
     No wind.
     """
 
+    uniform = True
+
     def get_wind_vector(self, *args) -> np.ndarray:
         """
         All components are zero.
@@ -45,6 +55,8 @@ class ConstantWind(Wind):
     The wind is uniform in position and constant in time.
     """
 
+    uniform = True
+
     def __init__(
         self,
         wind_vector: np.ndarray,
@@ -54,3 +66,250 @@ class ConstantWind(Wind):
 
     def get_wind_vector(self, *args) -> np.ndarray:
         return self._wind_vector
+
+
+class GridWind(Wind, MemoryMapped):
+    """
+    Wind sampled on a regular grid of positions, optionally at regular
+    times, and interpolated (tri)linearly in between. Outside the grid the
+    wind of the nearest edge is used. Any axis may have a single point, e.g.
+    a vertical profile has shape `(1, 1, nz, 3)`.
+
+    The grid can be saved with :meth:`save` and memory mapped with
+    :meth:`load`, see :class:`MemoryMapped`.
+
+    Args:
+        vectors (np.ndarray): wind vectors in m/s with shape
+            `(nx, ny, nz, 3)`, or `(nt, nx, ny, nz, 3)` if time indexed
+        origin (Sequence[float]): position of the first grid point in m
+        spacing (Sequence[float]): distance between grid points along x, y
+            and z in m
+        time_step (float, optional): time between the grids in seconds if
+            time indexed
+        time_origin (float): time of the first grid in seconds
+    """
+
+    _array = "_vectors"
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        origin: Sequence[float] = (0.0, 0.0, 0.0),
+        spacing: Sequence[float] = (1.0, 1.0, 1.0),
+        time_step: Optional[float] = None,
+        time_origin: float = 0.0,
+    ):
+        super().__init__()
+        dimensions = 5 if time_step is not None else 4
+        assert vectors.ndim == dimensions and vectors.shape[-1] == 3, \
+            f"expected wind vectors of {dimensions} dimensions with 3 components, got shape {vectors.shape}"
+        self._vectors = vectors
+        self.origin = np.asarray(origin, dtype=float)
+        self.spacing = np.asarray(spacing, dtype=float)
+        self.time_step = time_step
+        self.time_origin = time_origin
+        if time_step is not None:
+            self._start = np.concatenate([[time_origin], self.origin])
+            self._step = np.concatenate([[time_step], self.spacing])
+        else:
+            self._start = self.origin
+            self._step = self.spacing
+        self._last = np.array(vectors.shape[:-1]) - 1
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors
+
+    def _coordinates(self, t, position) -> np.ndarray:
+        position = np.asarray(position, dtype=float)
+        if self.time_step is None:
+            return position
+        t = np.broadcast_to(np.asarray(t, dtype=float), position.shape[:-1])
+        return np.concatenate([t[..., None], position], axis=-1)
+
+    def get_wind_vector(
+        self,
+        t: Optional[Union[float, int, np.ndarray]],
+        position: Optional[Union[List, np.ndarray]],
+    ) -> np.ndarray:
+        x = np.clip((self._coordinates(t, position) - self._start) / self._step, 0, self._last)
+        i = np.minimum(x.astype(int), np.maximum(self._last - 1, 0))
+        f = x - i
+        # the 2 x 2 x 2 (x 2) block around the point, reduced one axis at a time
+        block = self._vectors[tuple(slice(k, k + 2) for k in i)]
+        for weight in f:
+            block = block[0] * (1 - weight) + block[1] * weight if len(block) == 2 else block[0]
+        return np.asarray(block, dtype=float)
+
+    def get_wind_vectors(self, t: Union[float, np.ndarray], positions: np.ndarray) -> np.ndarray:
+        """
+        The wind at many points at once.
+
+        Args:
+            t (Union[float, np.ndarray]): one time or a time for each point
+            positions (np.ndarray): positions with shape `(n, 3)`
+
+        Returns:
+            (np.ndarray) wind vectors with shape `(n, 3)`
+        """
+        x = np.clip((self._coordinates(t, positions) - self._start) / self._step, 0, self._last)
+        i = np.minimum(x.astype(int), np.maximum(self._last - 1, 0))
+        f = x - i
+        result = np.zeros(x.shape[:-1] + (3,))
+        for corner in itertools.product((0, 1), repeat=len(self._last)):
+            corner = np.array(corner)
+            index = np.minimum(i + corner, self._last)
+            weight = np.prod(np.where(corner, f, 1 - f), axis=-1)
+            result += weight[..., None] * self._vectors[tuple(index.T)]
+        return result
+
+    def _geometry(self) -> Dict:
+        return {
+            "origin": self.origin.tolist(),
+            "spacing": self.spacing.tolist(),
+            "time_step": self.time_step,
+            "time_origin": self.time_origin,
+        }
+
+
+class GustWind(Wind):
+    """
+    Turbulent gusts on top of a mean wind. The gusts along the mean wind
+    (u), across it (v) and vertically (w) are Gaussian time series with a
+    Dryden or von Karman spectrum, synthesized once by shaping white noise
+    with an FFT. The series is periodic and is looked up with linear
+    interpolation, so the wind costs the same as :class:`ConstantWind` to
+    evaluate. It is the same at every position, i.e. the disc flies
+    through the gusts as they pass.
+
+    By default the intensities and length scales are those of the low
+    altitude model of MIL-F-8785C at `height`, with the mean wind speed as
+    the speed at 20 ft.
+
+    Args:
+        mean (np.ndarray): mean wind vector in m/s
+        intensity (Union[float, Sequence[float]], optional): standard
+            deviations of u, v and w in m/s
+        length_scale (Union[float, Sequence[float]], optional): turbulence
+            length scales of u, v and w in m
+        spectrum (str): `dryden` or `von_karman`
+        height (float): height above the ground in m for the defaults
+        duration (float): period of the series in seconds
+        time_step (float): time between samples of the series in seconds
+        reference_speed (float, optional): speed in m/s that turns length
+            scales into time scales, by default the mean wind speed
+        seed: for :func:`numpy.random.default_rng`
+    """
+
+    uniform = True
+
+    def __init__(
+        self,
+        mean: np.ndarray,
+        intensity: Optional[Union[float, Sequence[float]]] = None,
+        length_scale: Optional[Union[float, Sequence[float]]] = None,
+        spectrum: str = "dryden",
+        height: float = 2.0,
+        duration: float = 20.0,
+        time_step: float = 0.01,
+        reference_speed: Optional[float] = None,
+        seed=None,
+    ):
+        super().__init__()
+        assert spectrum in ("dryden", "von_karman"), f"invalid spectrum {spectrum}"
+        self.mean = np.asarray(mean, dtype=float)
+        speed = float(np.linalg.norm(self.mean))
+        # MIL-F-8785C low altitude model, in feet
+        h = max(height, 0.1) / 0.3048
+        if intensity is None:
+            sigma_w = 0.1 * speed
+            sigma_u = sigma_w / (0.177 + 0.000823 * h) ** 0.4
+            intensity = (sigma_u, sigma_u, sigma_w)
+        if length_scale is None:
+            length_u = h / (0.177 + 0.000823 * h) ** 1.2 * 0.3048
+            length_scale = (length_u, length_u, h * 0.3048)
+        self.intensity = np.broadcast_to(np.asarray(intensity, dtype=float), (3,))
+        self.length_scale = np.broadcast_to(np.asarray(length_scale, dtype=float), (3,))
+        self.spectrum = spectrum
+        self.time_step = time_step
+        self._samples = int(round(duration / time_step))
+        self.reference_speed = reference_speed or max(speed, 1.0)
+
+        # u along the horizontal mean wind, v to its left, w up
+        direction = np.array([self.mean[0], self.mean[1], 0.0])
+        u = direction / np.linalg.norm(direction) if np.linalg.norm(direction) > 0 else np.array([1.0, 0, 0])
+        self._frame = np.stack([u, np.cross([0, 0, 1.0], u), [0, 0, 1.0]])
+        self._series = self._synthesize(np.random.default_rng(seed), 1)[0]
+
+    @property
+    def duration(self) -> float:
+        return self._samples * self.time_step
+
+    def _filters(self) -> np.ndarray:
+        """
+        Amplitude of each rfft frequency for u, v and w, scaled so that the
+        series has the standard deviations of `intensity`.
+        """
+        n = self._samples
+        omega = 2 * np.pi * np.fft.rfftfreq(n, self.time_step)
+        x = self.length_scale[:, None] * omega / self.reference_speed
+        if self.spectrum == "dryden":
+            shapes = [1 / (1 + x[0] ** 2)] + [(1 + 3 * x[k] ** 2) / (1 + x[k] ** 2) ** 2 for k in (1, 2)]
+        else:
+            x = 1.339 * x
+            shapes = [1 / (1 + x[0] ** 2) ** (5 / 6)]
+            shapes += [(1 + 8 / 3 * x[k] ** 2) / (1 + x[k] ** 2) ** (11 / 6) for k in (1, 2)]
+        shapes = np.array(shapes)
+        shapes[:, 0] = 0  # no change of the mean
+        # each frequency but 0 and Nyquist stands for two of the full FFT
+        counts = np.full(omega.shape, 2.0)
+        counts[0] = 1
+        if n % 2 == 0:
+            counts[-1] = 1
+        variance = (shapes * counts).sum(axis=1) / n
+        scale = np.divide(self.intensity ** 2, variance, out=np.zeros(3), where=variance > 0)
+        return np.sqrt(shapes * scale[:, None])
+
+    def _synthesize(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """
+        `count` independent series of the wind vector, shape
+        `(count, samples, 3)`, including the mean.
+        """
+        noise = np.fft.rfft(rng.standard_normal((count, 3, self._samples)), axis=-1)
+        gusts = np.fft.irfft(noise * self._filters(), n=self._samples, axis=-1)
+        return self.mean + np.einsum("cks,kj->csj", gusts, self._frame)
+
+    @classmethod
+    def realizations(cls, count: int, seed=None, **kwargs) -> List["GustWind"]:
+        """
+        `count` independent gust winds with the same parameters, synthesized
+        in one batch. `kwargs` are passed to :class:`GustWind`.
+        """
+        rng = np.random.default_rng(seed)
+        template = cls(seed=rng, **kwargs)
+        winds = []
+        for series in template._synthesize(rng, count):
+            wind = copy.copy(template)
+            wind._series = series
+            winds.append(wind)
+        return winds
+
+    def get_wind_vector(
+        self,
+        t: Optional[Union[float, int, np.ndarray]],
+        position: Optional[Union[List, np.ndarray]] = None,
+    ) -> np.ndarray:
+        x = ((t or 0.0) / self.time_step) % self._samples
+        i = int(x) % self._samples
+        f = x - int(x)
+        series = self._series
+        return series[i] + (series[(i + 1) % self._samples] - series[i]) * f
+
+    def get_wind_vectors(self, t: np.ndarray, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        The wind at many times at once, shape `(len(t), 3)`.
+        """
+        x = (np.asarray(t, dtype=float) / self.time_step) % self._samples
+        f = (x - np.floor(x))[..., None]
+        i = x.astype(int) % self._samples
+        return self._series[i] * (1 - f) + self._series[(i + 1) % self._samples] * f
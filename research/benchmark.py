@@ -0,0 +1,124 @@
+"""
+Benchmark matrix: cost and landing error of each integrator setting for a
+few representative throws. The reference landing point for each throw is
+computed with DOP853 at very tight tolerances.
+
+Run with `python research/benchmark.py`.
+"""
+import math
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.integrators import DOP853, LIE_GROUP, LSODA, RK45, FixedStepRK4, Integrator
+from frispy.quality import QUALITY_PRESETS
+from frispy.wind import ConstantWind
+
+mph_to_mps = 0.44704
+
+
+def throw(model, v, uphill, hyzer, nose_up, spin_factor=1.0, wobble=0.0, wind=None) -> Disc:
+    rot = -v / model.diameter * spin_factor
+    a = uphill * math.pi / 180
+    return Disc(model, {"vx": math.cos(a) * v, "vz": math.sin(a) * v, "dgamma": rot,
+                        "hyzer": hyzer, "nose_up": nose_up,
+                        "dphi": rot * wobble, "dtheta": -rot * wobble},
+                environment=Environment(wind=wind or ConstantWind(np.zeros(3))))
+
+
+destroyer = Discs.destroyer
+putter = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0, "fade": 1})
+
+CASES = {
+    "putt": lambda: throw(putter, 12, 3, 0, 0),
+    "drive": lambda: throw(destroyer, 60 * mph_to_mps, 10, 10, 0),
+    "high_spin": lambda: throw(destroyer, 60 * mph_to_mps, 10, 10, 0, spin_factor=2.0),
+    "wobble": lambda: throw(destroyer, 25, 10, 10, 0, wobble=0.2),
+    "windy": lambda: throw(destroyer, 60 * mph_to_mps, 10, 10, 0, wind=ConstantWind(np.array([-6, 3, 0]))),
+}
+
+METHODS = {
+    "RK45 rtol=1e-3": (RK45, {"rtol": 1e-3, "atol": 1e-6}),
+    "RK45 rtol=1e-4": (RK45, {"rtol": 1e-4, "atol": 1e-7}),
+    "RK45 rtol=1e-6": (RK45, {"rtol": 1e-6, "atol": 1e-9}),
+    "DOP853 rtol=1e-4": (DOP853, {"rtol": 1e-4, "atol": 1e-7}),
+    "DOP853 rtol=1e-6": (DOP853, {"rtol": 1e-6, "atol": 1e-9}),
+    "LSODA rtol=1e-4": (LSODA, {"rtol": 1e-4, "atol": 1e-7}),
+    "RKMK45 rtol=1e-3": (LIE_GROUP, {"rtol": 1e-3, "atol": 1e-6}),
+    "RKMK45 rtol=1e-4": (LIE_GROUP, {"rtol": 1e-4, "atol": 1e-7}),
+    "RKMK45 rtol=1e-6": (LIE_GROUP, {"rtol": 1e-6, "atol": 1e-9}),
+    "RK4 h=0.2": (FixedStepRK4(0.2), {}),
+    "RK4 h=0.1": (FixedStepRK4(0.1), {}),
+    "RK4 h=0.05": (FixedStepRK4(0.05), {}),
+    "RK4 h=0.01": (FixedStepRK4(0.01), {}),
+}
+
+REFERENCE = (DOP853, {"rtol": 1e-10, "atol": 1e-12})
+
+
+def landing(disc: Disc, integrator: Integrator, options: Dict) -> Tuple[np.ndarray, int]:
+    """
+    Landing x, y and the number of right hand side evaluations.
+    """
+    def hit_ground(t, y): return y[2]
+    hit_ground.terminal = True
+    result = integrator.integrate(disc.eom, (0, 15), disc.initial_conditions_as_ordered_list,
+                                  events=[hit_ground], **options)
+    return result.y[:2, -1], result.nfev
+
+
+def run_matrix(cases=CASES, methods=METHODS, repeats: int = 3) -> Dict[Tuple[str, str], Dict[str, float]]:
+    table = {}
+    for case, make_disc in cases.items():
+        reference, _ = landing(make_disc(), *REFERENCE)
+        for label, method in methods.items():
+            timings = []
+            for _ in range(repeats):
+                disc = make_disc()
+                start = time.perf_counter()
+                point, nfev = landing(disc, *method)
+                timings.append(time.perf_counter() - start)
+            table[(case, label)] = {
+                "ms": 1000 * float(np.median(timings)),
+                "nfev": nfev,
+                "error_m": float(np.linalg.norm(point - reference)),
+            }
+    return table
+
+
+def run_presets(cases=CASES, repeats: int = 3) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """
+    Cost and landing error of each quality preset for a whole trajectory,
+    as the service computes it.
+    """
+    table = {}
+    for case, make_disc in cases.items():
+        reference, _ = landing(make_disc(), *REFERENCE)
+        for quality in QUALITY_PRESETS:
+            timings = []
+            for _ in range(repeats):
+                disc = make_disc()
+                start = time.perf_counter()
+                result = disc.compute_trajectory(quality=quality)
+                timings.append(time.perf_counter() - start)
+            point = np.array([result.x[-1], result.y[-1]])
+            table[(case, quality)] = {
+                "ms": 1000 * float(np.median(timings)),
+                "points": len(result.times),
+                "error_m": float(np.linalg.norm(point - reference)),
+            }
+    return table
+
+
+if __name__ == "__main__":
+    table = run_matrix()
+    print(f"{'case':<10} {'method':<20} {'ms':>8} {'nfev':>7} {'error m':>10}")
+    for (case, label), row in table.items():
+        print(f"{case:<10} {label:<20} {row['ms']:8.1f} {row['nfev']:7d} {row['error_m']:10.2e}")
+
+    table = run_presets()
+    print(f"{'case':<10} {'quality':<20} {'ms':>8} {'points':>7} {'error m':>10}")
+    for (case, quality), row in table.items():
+        print(f"{case:<10} {quality:<20} {row['ms']:8.1f} {row['points']:7d} {row['error_m']:10.2e}")
@@ -3,27 +3,43 @@ import json
 import math
 import os
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 import numpy as np
 from flask import Flask, request
 from scipy.spatial.transform import Rotation
 
-from frispy import Disc, Discs, Environment
-from frispy.wind import ConstantWind
+from frispy import Disc, Discs, Model
+from frispy.atmosphere import Atmosphere
 from flask_cors import CORS
 from flask_sock import Sock
 from frispy.disc import FrisPyResults
+from frispy.dispersion import (LandingStatistics, Normal, fly_landings, landing_density, random_dimensions,
+                               sample_throws, uniform_source)
+from frispy.parallel import WorkerPool
+from frispy.quality import QUALITY_PRESETS
+from frispy.recommend import Profile, Recommender
+from frispy.throw import Throw
 
 # import google.cloud.logging
 # client = google.cloud.logging.Client()
 # client.setup_logging()
 
+# a mold catalog other than the one shipped with frispy
+if os.environ.get("FRISPY_MOLDS"):
+    Discs.load(os.environ["FRISPY_MOLDS"])
+
 app = Flask(__name__)
 CORS(app)
 sock = Sock(app)
 
 
+# a request with a missing or invalid field, answered with a 400. Errors
+# raised while computing a flight stay server errors.
+class InvalidRequest(Exception):
+    pass
+
+
 @sock.route('/api/ws/flight_path')
 def ws_flight_path(s):
     try:
@@ -34,7 +50,7 @@ def ws_flight_path(s):
         content = json.loads(data)
         gamma = content.get('gamma', 0)
         disc = create_disc(content)
-        inc_send_over_websocket(disc, gamma, s)
+        inc_send_over_websocket(disc, gamma, s, to_quality(content), content.get('progressive', False))
     finally:
         s.close()
 
@@ -47,23 +63,31 @@ def ws_flight_path_from_summary(s):
             return
 
         content = json.loads(data)
+        quality = to_quality(content)
+        progressive = content.get('progressive', False)
         content = to_flight_path_request(content)
 
         disc = create_disc(content)
-        inc_send_over_websocket(disc, 0, s)
+        inc_send_over_websocket(disc, 0, s, quality, progressive)
     finally:
         s.close()
 
 
-def inc_send_over_websocket(disc, gamma, s) -> bool:
-    results = compute_trajectory(disc, 1.0)
+# Sends the flight in chunks of 1 second, then an empty object. With
+# "progressive" it first sends the whole flight at the preview quality,
+# marked with "preview": true, which the chunks replace as they arrive.
+def inc_send_over_websocket(disc, gamma, s, quality: str = "standard", progressive: bool = False) -> bool:
+    if progressive and quality != "preview":
+        preview = compute_trajectory(disc, quality="preview")
+        s.send(json.dumps(dict(to_result(gamma, preview), preview=True)))
+    results = compute_trajectory(disc, 1.0, quality=quality)
     s.send(json.dumps(to_result(gamma, results)))
     disc.set_initial_conditions_from_prev_results(results)
     while results.z[-1] > 1e-6:
         # bail early if socket is closed
         if not s.connected:
             return False
-        results = compute_trajectory(disc, 1.0, results.times[-1])
+        results = compute_trajectory(disc, 1.0, results.times[-1], quality)
         s.send(json.dumps(to_result(gamma, results)))
         disc.set_initial_conditions_from_prev_results(results)
     # send empty object to signal end of flight
@@ -75,20 +99,21 @@ def inc_send_over_websocket(disc, gamma, s) -> bool:
 @app.route('/api/flight_paths', methods=['POST'])
 def flight_paths():
     content = request.json
+    quality = to_quality(content)
     discs = content.get('disc_names')
     res = {}
     if discs:
         for discName in discs:
             content['disc_name'] = discName
             disc = create_disc(content)
-            result = compute_trajectory(disc)
+            result = compute_trajectory(disc, quality=quality)
             res[discName] = to_result(content.get('gamma', 0), result)
     else:
         discs = content.get('disc_numbers')
         for index, discNumbers in enumerate(discs):
             content['flight_numbers'] = discNumbers
             disc = create_disc(content)
-            result = compute_trajectory(disc)
+            result = compute_trajectory(disc, quality=quality)
             res[index] = to_result(content.get('gamma', 0), result)
 
     return res
@@ -103,7 +128,7 @@ def flight_paths():
 def flight_path():
     content = request.json
     disc = create_disc(content)
-    result = compute_trajectory(disc)
+    result = compute_trajectory(disc, quality=to_quality(content))
     return to_result(content.get('gamma', 0), result)
 
 
@@ -112,69 +137,189 @@ def flight_path():
 @app.route('/api/flight_path_from_summary', methods=['POST'])
 def flight_path_from_summary():
     content = request.json
+    quality = to_quality(content)
     content = to_flight_path_request(content)
     disc = create_disc(content)
-    result = compute_trajectory(disc)
+    result = compute_trajectory(disc, quality=quality)
     return to_result(0, result)
 
 
 def create_disc(content) -> Disc:
-    model = Discs.from_string(content.get('disc_name'))
+    # measured in kg/m^3
+    air_density = content.get("air_density", 1.225)  # 15C / 59F
+    return to_throw(content).disc(to_model(content), air_density, to_atmosphere(content))
+
+
+# the air of the course, which replaces air_density if any of
+# "elevation" (m above sea level), "temperature" (C) and "humidity"
+# (relative, 0 to 1) is given. The density then varies with height.
+def to_atmosphere(content) -> Optional[Atmosphere]:
+    if not any(k in content for k in ('elevation', 'temperature', 'humidity')):
+        return None
+    return Atmosphere(
+        elevation=float(content.get('elevation', 0)),
+        temperature=float(content.get('temperature', 15)),
+        humidity=float(content.get('humidity', 0)),
+    )
+
+
+# "quality" of a flight path: "preview" for a fast draft, "standard" or
+# "reference", see frispy.quality for the error and cost of each
+def to_quality(content) -> str:
+    quality = content.get('quality', 'standard')
+    if quality not in QUALITY_PRESETS:
+        raise InvalidRequest(f"Unknown quality {quality}, use one of {list(QUALITY_PRESETS)}")
+    return quality
+
+
+def to_model(content) -> Model:
+    model = None
+    if content.get('disc_name'):
+        reload_catalog()
+        model = Discs.from_string(content['disc_name'])
     if not model:
+        if 'flight_numbers' not in content:
+            raise InvalidRequest(f"Unknown disc {content.get('disc_name')} and no flight_numbers")
         model = Discs.from_flight_numbers(content['flight_numbers'])
-    v = content['v']
-    spin = content['spin']
-    wx = 0
-    if "wx" in content:
-        wx = content["wx"]
-
-    wy = 0
-    if "wy" in content:
-        wy = content["wy"]
-    z = 1
-    if "z" in content:
-        z = content["z"]
-
-    # m/s
-    wind_speed = 0
-    if "wind_speed" in content:
-        wind_speed = content["wind_speed"]
-
-    # 0 wind angle means tailwind, 90 deg is right to left
-    # radians
-    wind_angle = 0
-    if "wind_angle" in content:
-        wind_angle = content["wind_angle"]
-
-    wind = ConstantWind(np.array([math.cos(wind_angle), math.sin(wind_angle), 0]) * wind_speed)
+    return model
+
+
+# pick up edits to the mold catalog without a restart. The recommender holds
+# a copy of the catalog and ratings of its molds, so it is built again.
+def reload_catalog() -> None:
+    global recommender
+    if Discs.reload_if_changed() and recommender is not None:
+        recommender.close()
+        recommender = None
+
+
+def to_throw(content) -> Throw:
+    for field in ('v', 'spin', 'hyzer_degrees', 'nose_up_degrees', 'uphill_degrees'):
+        if field not in content:
+            raise InvalidRequest(f"Missing {field}")
+    return Throw(
+        v=content['v'],
+        spin=content['spin'],
+        hyzer=content['hyzer_degrees'],
+        nose_up=content['nose_up_degrees'],
+        uphill=content['uphill_degrees'],
+        wx=content.get('wx', 0),
+        wy=content.get('wy', 0),
+        z=content.get('z', 1),
+        # m/s
+        wind_speed=content.get('wind_speed', 0),
+        # 0 wind angle means tailwind, 90 deg is right to left
+        # radians
+        wind_angle=content.get('wind_angle', 0),
+    )
+
+
+# request field for each release parameter that can have a spread
+THROW_FIELDS = {
+    "v": "v",
+    "spin": "spin",
+    "hyzer_degrees": "hyzer",
+    "nose_up_degrees": "nose_up",
+    "uphill_degrees": "uphill",
+    "wx": "wx",
+    "wy": "wy",
+    "z": "z",
+    "wind_speed": "wind_speed",
+    "wind_angle": "wind_angle",
+}
+MAX_LANDING_SAMPLES = 2048
+
+# long lived so requests do not pay for starting processes; the model is
+# sent with every chunk. Set LANDING_WORKERS to share the CPUs between
+# several gunicorn workers.
+landing_pool = WorkerPool(int(os.environ.get("LANDING_WORKERS", 0)) or None)
+
+
+# landing points of many throws around the requested one. "spreads" holds
+# the standard deviation of any of the THROW_FIELDS, e.g.
+# {"v": 1.0, "hyzer_degrees": 5}. Only the landing points are computed, and
+# the response is a density grid with the density levels of the contours
+# holding each of "probabilities" of the throws.
+@app.route('/api/landing_distribution', methods=['POST'])
+def landing_distribution():
+    content = request.json
+    model = to_model(content)
+    release = to_release(to_throw(content), content.get('spreads', {}))
+    samples = to_samples(content, 256, MAX_LANDING_SAMPLES)
+    dimensions = random_dimensions(release)
+    u = uniform_source("halton", dimensions, content.get('seed', 0))(samples) if dimensions else np.empty((1, 0))
+
+    start_time = time.time()
+    landings = fly_landings(model, sample_throws(release, u), content.get("air_density", 1.225), pool=landing_pool,
+                            atmosphere=to_atmosphere(content))
+    logging.info("computed %s landings in %s seconds", len(landings), time.time() - start_time)
+
+    statistics = LandingStatistics()
+    statistics.update(landings)
+    density = landing_density(landings[:, :2], grid_size=int(content.get('grid_size', 40)),
+                              probabilities=content.get('probabilities', [0.5, 0.9]))
+    return {
+        'statistics': statistics.as_dict(),
+        'density': density.as_dict(),
+    }
 
-    # measured in kg/m^3
-    air_density = 1.225  # 15C / 59F
-    if "air_density" in content:
-        air_density = content["air_density"]
-
-    a = content['uphill_degrees'] * math.pi / 180
-    hyzer = content['hyzer_degrees']
-    nose_up = content['nose_up_degrees']
-    disc = Disc(model, {"vx": math.cos(a) * v,
-                        "dgamma": spin,
-                        "dphi": wx,
-                        "dtheta": wy,
-                        "vz": math.sin(a) * v,
-                        "z": z,
-                        "nose_up": nose_up,
-                        "hyzer": hyzer
-                },
-                environment=Environment(wind=wind, air_density=air_density))
-
-    return disc
-
-
-def compute_trajectory(disc: Disc, flight_max_seconds: float = 15.0, startTime: float = 0.0) -> FrisPyResults:
+
+# rank the discs of the catalog for a typical throw. "by" is "distance",
+# "fade" (closest to "target_fade" meters) or "spread", the latter needs
+# "spreads" like /api/landing_distribution. Ratings are cached per throw.
+@app.route('/api/recommend', methods=['POST'])
+def recommend():
+    global recommender
+    content = request.json
+    reload_catalog()
+    if recommender is None:
+        recommender = Recommender(max_workers=int(os.environ.get("LANDING_WORKERS", 0)) or None)
+    profile = Profile(to_throw(content), to_spreads(content.get('spreads', {})),
+                      samples=to_samples(content, 16, 64))
+    ratings = recommender.rank(profile, by=content.get('by', 'distance'),
+                               target_fade=content.get('target_fade', 0), limit=content.get('limit', 20))
+    return {'discs': [r.as_dict() for r in ratings]}
+
+
+# built on the first request, it holds the catalog and its process pool
+recommender = None
+
+
+# number of sampled throws, capped at maximum
+def to_samples(content, default: int, maximum: int) -> int:
+    try:
+        samples = int(content.get('samples', default))
+    except (TypeError, ValueError):
+        raise InvalidRequest(f"samples must be an integer, got {content.get('samples')!r}")
+    if samples <= 0:
+        raise InvalidRequest(f"samples must be positive, got {samples}")
+    return min(samples, maximum)
+
+
+def to_spreads(spreads: Dict) -> Dict[str, float]:
+    """
+    Spreads keyed by request field to spreads keyed by Throw field.
+    """
+    for field in spreads:
+        if field not in THROW_FIELDS:
+            raise InvalidRequest(f"Unknown spread {field}, use one of {list(THROW_FIELDS)}")
+    return {THROW_FIELDS[field]: spread for field, spread in spreads.items()}
+
+
+def to_release(throw: Throw, spreads: Dict) -> Dict:
+    release = throw.as_dict()
+    for name, spread in to_spreads(spreads).items():
+        if spread > 0:
+            release[name] = Normal(release[name], spread)
+    return release
+
+
+def compute_trajectory(disc: Disc, flight_max_seconds: float = 15.0, startTime: float = 0.0,
+                       quality: str = "standard") -> FrisPyResults:
     try:
         # time request and log
         start_time = time.time()
-        result = compute_trajectory_internal(disc, flight_max_seconds, startTime)
+        result = compute_trajectory_internal(disc, flight_max_seconds, startTime, quality)
         end_time = time.time()
 
         computed_seconds = result.times[-1] - result.times[0]
@@ -185,19 +330,15 @@ def compute_trajectory(disc: Disc, flight_max_seconds: float = 15.0, startTime:
         logging.error("failed to process flight e: %s, content: %s", e, disc)
 
         # add retry on exception
-        result = compute_trajectory_internal(disc, flight_max_seconds, startTime)
+        result = compute_trajectory_internal(disc, flight_max_seconds, startTime, quality)
         return result
 
 
-def compute_trajectory_internal(disc: Disc, flight_max_seconds: float, startTime: float) -> FrisPyResults:
-    hz = abs(disc.initial_conditions['dgamma']) / math.pi / 2
-    # In order to get a smooth output for the rotation of the disc
-    # we need to have enough samples to spin in the correct direction
-    max_step = 0.1
-    if hz > 4.5:
-        max_step = 0.45 / hz
-    return disc.compute_trajectory(**{"max_step": max_step, "rtol": 5e-4, "atol": 1e-7,
-                                      "t_span": (startTime, startTime + flight_max_seconds)})
+def compute_trajectory_internal(disc: Disc, flight_max_seconds: float, startTime: float,
+                                quality: str = "standard") -> FrisPyResults:
+    # the presets sample the flight often enough for the rotation of the
+    # disc to be drawn spinning in the correct direction
+    return disc.compute_trajectory(quality=quality, t_span=(startTime, startTime + flight_max_seconds))
 
 
 def to_result(gamma, result):
@@ -245,11 +386,16 @@ def to_flight_path_request(throw_summary: Dict) -> Dict:
     if flight_numbers:
         flight_path_request["flight_numbers"] = flight_numbers
     else:
-        raise ValueError("Must specify flight numbers")
+        raise InvalidRequest("Must specify flight numbers")
 
     return flight_path_request
 
 
+@app.errorhandler(InvalidRequest)
+def bad_request(e):
+    return {'error': str(e)}, 400
+
+
 @app.route("/")
 def hello_world():
     return "Frispy service!"
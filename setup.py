@@ -18,6 +18,7 @@ setup(
     long_description_content_type="text/x-rst",
     url="https://github.com/carrino/FrisPy",
     packages=["frispy"],
+    package_data={"frispy": ["data/*.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
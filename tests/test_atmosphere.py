@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.atmosphere import Atmosphere, density_table
+from frispy.integrators import ScipyIntegrator
+
+
+class TestAtmosphere(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+
+    def test_density(self):
+        # the standard atmosphere
+        assert abs(Atmosphere().density() - 1.225) < 1e-3
+        assert abs(Atmosphere(elevation=1000, temperature=8.5).density() - 1.112) < 2e-3
+        assert Atmosphere(humidity=1).density() < Atmosphere().density()
+        assert Atmosphere(temperature=35).density() < Atmosphere().density()
+        assert Atmosphere().density(50) < Atmosphere().density()
+
+        atmosphere = Atmosphere(elevation=1600, temperature=30, humidity=0.5)
+        table = density_table(atmosphere)
+        assert density_table(Atmosphere(elevation=1600, temperature=30, humidity=0.5)) is table
+        z = np.linspace(-5, 120, 51)
+        expected = [atmosphere.density(h) for h in z]
+        np.testing.assert_allclose([table(h) for h in z], expected, rtol=1e-6)
+        np.testing.assert_allclose(table.array(z), expected, rtol=1e-6)
+
+    def test_flight(self):
+        sea_level = Disc(Discs.wraith, self.ics, environment=Environment(atmosphere=Atmosphere())).compute_landing()
+        expected = Disc(Discs.wraith, self.ics).compute_landing()
+        assert abs(sea_level.x - expected.x) < 0.1
+
+        environment = Environment(atmosphere=Atmosphere(elevation=1600))
+        assert abs(environment.air_density - environment.density_at(0)) < 1e-12
+        high = Disc(Discs.wraith, self.ics, environment=environment).compute_landing()
+        assert high.x > expected.x + 5
+        # the Jacobian of the implicit solvers probes the height
+        radau = Disc(Discs.wraith, self.ics, environment=environment).compute_landing(
+            integrator=ScipyIntegrator("Radau"), rtol=1e-6, atol=1e-9
+        )
+        assert abs(radau.x - high.x) < 0.1
@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from frispy import Discs
+from frispy.calibration import DISC_CLASSES, calibrate
+from frispy.integrators import RK45
+from frispy.throw import Throw
+
+
+class TestCalibration(TestCase):
+    def test_calibrate(self):
+        def throws(model):
+            return [Throw(v=20, spin=-90, hyzer=5), Throw(v=20, spin=-90, hyzer=5, wx=-3, wy=3)]
+
+        report = calibrate({"putter": Discs.from_flight_numbers(DISC_CLASSES["putter"])},
+                           throws, reference=RK45, reference_options={"rtol": 1e-6, "atol": 1e-9})
+        calibration = report["putter"]
+        assert calibration.throws == 2
+        assert calibration.max_error < 1e-2
+        assert calibration.wobble_max_error > calibration.max_error
+        assert calibration.speedup > 1
+        assert set(calibration.as_dict()) == {
+            "throws", "mean_error", "max_error", "wobble_mean_error", "wobble_max_error", "speedup"
+        }
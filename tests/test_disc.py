@@ -1,8 +1,10 @@
 from unittest import TestCase
 
+import numpy as np
 import pytest
+from scipy.spatial.transform import Rotation
 
-from frispy import Disc
+from frispy import EOM, Disc
 
 
 class TestDisc(TestCase):
@@ -124,3 +126,20 @@ class TestDisc(TestCase):
         assert all(result.times == result2.times)
         for x in d.ordered_coordinate_names:
             assert len(getattr(result, x)) == len(getattr(result2, x))
+
+    def test_compute_trajectory_angles(self):
+        d = Disc(initial_conditions=dict(self.ics, dphi=2.0, vz=2.0))
+        result = d.compute_trajectory(flight_time=None, t_span=(0.5, 2))
+        gamma = 0
+        last_t = 0
+        for i, t in enumerate(result.times):
+            gamma += result.dgamma[i] * (t - last_t)
+            last_t = t
+            r = Rotation.from_quat([result.qx[i], result.qy[i], result.qz[i], result.qw[i]])
+            r = r * Rotation.from_euler("Z", gamma)
+            velocity = np.array([result.vx[i], result.vy[i], result.vz[i]])
+            assert abs(result.gamma[i] - gamma) < 1e-9
+            np.testing.assert_allclose(result.rot[i].as_quat(), r.as_quat(), atol=1e-12)
+            assert abs(result.phi[i] - r.as_euler("zyx")[2]) < 1e-12
+            aoa = EOM.calculate_intermediate_quantities(r, velocity, [0, 0])["angle_of_attack"]
+            assert abs(result.aoa[i] - aoa) < 1e-12
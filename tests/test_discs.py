@@ -1,7 +1,12 @@
 #  Copyright (c) 2022 John Carrino
+import json
+import os
+import pickle
+import tempfile
 from pprint import pprint
 from unittest import TestCase
 from frispy.discs import Discs
+from frispy.model import FrozenModel
 
 class TestRotations(TestCase):
     def test_flight_nums(self):
@@ -15,3 +20,65 @@ class TestRotations(TestCase):
         should_be_destroyer = Discs.from_flight_numbers(flight_nums)
         destroyer = Discs.stable_destroyer
         pprint(should_be_destroyer)
+
+    def test_registry(self):
+        assert "destroyer" in Discs.names()
+        assert Discs.from_string("destroyer") is Discs.destroyer
+        assert Discs.get("destroyer") is Discs.get("destroyer")
+        assert Discs.from_string("no_such_disc") is None
+        assert Discs.from_string(None) is None
+        with self.assertRaises(AttributeError):
+            Discs.no_such_disc
+        # molds given by flight numbers
+        buzzz = Discs.from_string("buzzz")
+        assert buzzz.coefficients["speed"] == 5
+        assert Discs.wraith.coefficients["PL0"] == 0.143
+
+    def test_reload(self):
+        original = Discs.catalog_path
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "molds.json")
+            with open(path, "w") as f:
+                json.dump({"test_mold": {"flight_numbers": {"speed": 7, "glide": 5, "turn": 0}}}, f)
+            try:
+                Discs.load(path)
+                first = Discs.test_mold
+                assert Discs.names() == ["test_mold"]
+                assert not Discs.reload_if_changed()
+                with open(path, "w") as f:
+                    json.dump({"test_mold": {"flight_numbers": {"speed": 9, "glide": 5, "turn": 0}}}, f)
+                os.utime(path, (0, os.path.getmtime(path) + 1))
+                assert Discs.reload_if_changed()
+                assert Discs.test_mold is not first
+                assert Discs.test_mold.coefficients["speed"] == 9
+                # a half saved file keeps the molds loaded before
+                with open(path, "w") as f:
+                    f.write('{"test_mold": {"flight_numbers": ')
+                os.utime(path, (0, os.path.getmtime(path) + 2))
+                with self.assertLogs(level="ERROR"):
+                    assert not Discs.reload_if_changed()
+                assert not Discs.reload_if_changed()
+                assert Discs.test_mold.coefficients["speed"] == 9
+            finally:
+                Discs.load(original)
+        assert Discs.get("test_mold") is None
+
+    def test_flight_numbers_cached(self):
+        model = Discs.from_flight_numbers({"speed": 9, "glide": 5, "turn": -1})
+        assert Discs.from_flight_numbers({"speed": 9.0, "glide": 5, "turn": -1}) is model
+        # clamped to the same numbers
+        assert Discs.from_flight_numbers({"speed": 20, "glide": 5, "turn": -1}) is \
+            Discs.from_flight_numbers({"speed": 14, "glide": 5, "turn": -1})
+        with self.assertRaises(TypeError):
+            model.set_value("mass", 0.2)
+        with self.assertRaises(TypeError):
+            model.coefficients["mass"] = 0.2
+        assert model.coefficients["speed"] == 9
+
+        copy = pickle.loads(pickle.dumps(model))
+        assert copy == model and hash(copy) == hash(model)
+        assert copy.content_hash == model.content_hash
+        heavier = model.with_coefficients(mass=0.2)
+        assert isinstance(heavier, FrozenModel) and heavier != model
+        assert heavier.content_hash != model.content_hash
+        assert Discs.wraith.freeze() == Discs.wraith.freeze()
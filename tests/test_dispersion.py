@@ -0,0 +1,122 @@
+import json
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Discs
+from frispy.atmosphere import Atmosphere
+from frispy.dispersion import (DispersionEngine, LandingStatistics, Normal, P2Quantile, Uniform, fly_landings,
+                               landing_density, sample_throws, uniform_source)
+from frispy.integrators import ScipyIntegrator
+from frispy.parallel import WorkerPool
+
+
+class TestDispersion(TestCase):
+    def setUp(self):
+        self.release = {"v": 12, "spin": -60, "hyzer": Normal(0, 5), "nose_up": Uniform(-2, 2), "uphill": 3}
+
+    def test_p2_quantile(self):
+        values = np.random.default_rng(0).normal(size=5000)
+        estimator = P2Quantile(0.9)
+        for v in values:
+            estimator.add(v)
+        assert abs(estimator.value() - np.percentile(values, 90)) < 0.05
+
+    def test_statistics_merge(self):
+        landings = np.random.default_rng(1).normal(size=(100, 3))
+        statistics = LandingStatistics()
+        for chunk in np.array_split(landings, 7):
+            statistics.update(chunk)
+        np.testing.assert_allclose(statistics.mean, landings[:, :2].mean(axis=0))
+        np.testing.assert_allclose(statistics.covariance, np.cov(landings[:, :2].T))
+        center, axes, angle = statistics.ellipse(0.9)
+        assert axes[0] >= axes[1] > 0
+
+        single = LandingStatistics()
+        single.update(landings[:1])
+        assert single.as_dict()["covariance"] is None
+        assert single.as_dict()["ellipse_90"] is None
+        json.dumps(single.as_dict(), allow_nan=False)
+
+    def test_engine(self):
+        with DispersionEngine(Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0}), self.release,
+                              max_workers=1, chunk_size=5) as engine:
+            snapshots = [s.count for s in engine.stream(12, seed=3)]
+            statistics = engine.run(12, seed=3)
+        assert snapshots == [5, 10, 12]
+        assert statistics.count == 12
+        assert 5 < statistics.mean[0] < 30
+        assert statistics.covariance[1, 1] > 0
+        assert statistics.distance_percentiles[10] <= statistics.distance_percentiles[90]
+
+    def test_seed(self):
+        model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        with DispersionEngine(model, self.release, max_workers=1, chunk_size=4) as engine:
+            first = engine.run(8, seed=5)
+            again = engine.run(8, seed=5)
+            other = engine.run(8, seed=6)
+        np.testing.assert_array_equal(first.mean, again.mean)
+        np.testing.assert_array_equal(first.covariance, again.covariance)
+        assert not np.array_equal(first.mean, other.mean)
+
+    def test_uniform_source(self):
+        for sampler in ("random", "sobol", "halton"):
+            u = uniform_source(sampler, 3, seed=0)(64)
+            assert u.shape == (64, 3)
+            assert np.all((u >= 0) & (u < 1))
+        with self.assertRaises(ValueError):
+            uniform_source("grid", 3)
+
+    def test_estimate(self):
+        model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        with DispersionEngine(model, self.release, max_workers=1) as engine:
+            random = engine.estimate(max_flights=256, sampler="random", seed=1)
+            sobol = engine.estimate(max_flights=256, sampler="sobol", antithetic=True, seed=1)
+            early = engine.estimate(target_precision=0.5, max_flights=1024, sampler="sobol", seed=1)
+        assert random.flights == sobol.flights == 256
+        assert not random.converged
+        # low discrepancy points pin the mean down far better
+        assert sobol.half_widths["x"] < random.half_widths["x"] / 3
+        assert abs(sobol.values["x"] - random.values["x"]) < random.half_widths["x"] + sobol.half_widths["x"]
+        low, high = sobol.interval("p50")
+        assert low < sobol.values["p50"] < high
+        assert early.converged and early.flights < 1024
+        assert early.precision <= 0.5
+
+    def test_control_variate(self):
+        model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        release = dict(self.release, v=Normal(12, 0.5))
+        with DispersionEngine(model, release, max_workers=1) as engine:
+            plain = engine.estimate(max_flights=64, sampler="random", seed=2)
+        with DispersionEngine(model, release, max_workers=1,
+                              control_variate=ScipyIntegrator("RK45", rtol=1e-2, atol=1e-4)) as engine:
+            controlled = engine.estimate(max_flights=64, sampler="random", seed=2)
+        assert controlled.control_flights == 5 * controlled.flights
+        assert controlled.half_widths["x"] < plain.half_widths["x"]
+
+    def test_landing_density(self):
+        points = np.random.default_rng(3).normal([50, 0], [5, 2], size=(2000, 2))
+        density = landing_density(points, grid_size=40, probabilities=(0.5, 0.9))
+        assert density.density.shape == (40, 40)
+        cell_area = (density.x[1] - density.x[0]) * (density.y[1] - density.y[0])
+        assert abs(density.density.sum() * cell_area - 1) < 1e-9
+        assert density.levels[0.5] > density.levels[0.9] > 0
+        # the 90% region holds about 90% of the points
+        i = np.clip(np.searchsorted(density.x, points[:, 0]), 0, 39)
+        j = np.clip(np.searchsorted(density.y, points[:, 1]), 0, 39)
+        inside = np.mean(density.density[j, i] >= density.levels[0.9])
+        assert 0.85 < inside < 0.95
+        # identical landings still make a grid
+        single = landing_density(np.zeros((3, 2)), grid_size=8)
+        assert np.all(np.isfinite(single.density))
+
+    def test_fly_landings(self):
+        model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        throws = sample_throws(self.release, uniform_source("halton", 2, seed=0)(5))
+        with WorkerPool(2) as pool:
+            parallel = fly_landings(model, throws, pool=pool, chunk_size=2)
+        np.testing.assert_allclose(parallel, fly_landings(model, throws))
+        assert parallel.shape == (5, 3)
+        # thinner air at altitude gives the slow throws less lift
+        high = fly_landings(model, throws, atmosphere=Atmosphere(elevation=2000))
+        assert np.all(high[:, 2] < parallel[:, 2])
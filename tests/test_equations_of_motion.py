@@ -0,0 +1,38 @@
+from unittest import TestCase, mock
+
+import numpy as np
+
+from frispy import Disc, Discs
+
+
+def central_difference(f, y: np.ndarray, step: float = 1e-6) -> np.ndarray:
+    columns = []
+    for j in range(len(y)):
+        h = step * max(abs(y[j]), 1.0)
+        dy = np.zeros(len(y))
+        dy[j] = h
+        columns.append((f(y + dy) - f(y - dy)) / (2 * h))
+    return np.column_stack(columns)
+
+
+class TestEOM(TestCase):
+    def setUp(self):
+        self.disc = Disc(Discs.destroyer, {
+            "vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1, "dphi": 5, "dtheta": -7,
+        })
+        self.y = np.array(self.disc.initial_conditions_as_ordered_list, dtype=float)
+
+    def test_jacobian_matches_numerical(self):
+        eom = self.disc.eom
+        jac = eom.jacobian(0.3, self.y)
+        expected = central_difference(lambda y: eom.compute_derivatives(0.3, y), self.y)
+        np.testing.assert_allclose(jac, expected, atol=1e-4)
+
+    def test_implicit_method_uses_jacobian(self):
+        disc = Disc(Discs.destroyer, {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8})
+        with mock.patch.object(disc.eom, "jacobian", wraps=disc.eom.jacobian) as jacobian:
+            result = disc.compute_trajectory(method="BDF", rtol=1e-4, atol=1e-7)
+        assert jacobian.called
+        reference = disc.compute_trajectory(rtol=1e-4, atol=1e-7)
+        assert abs(result.x[-1] - reference.x[-1]) < 0.5
+        assert abs(result.y[-1] - reference.y[-1]) < 0.5
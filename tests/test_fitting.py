@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Model
+from frispy.fitting import FlightObservation, ModelFitter
+
+
+def observe(model: Model, ics) -> FlightObservation:
+    result = Disc(model, dict(ics)).compute_trajectory(max_step=0.2)
+    times = np.linspace(0, result.times[-1] * 0.9, 20)
+    positions = np.stack(
+        [np.interp(times, result.times, getattr(result, k)) for k in ("x", "y", "z")], axis=1
+    )
+    return FlightObservation(times, positions, dict(ics))
+
+
+class TestFitting(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 20, "vz": 3, "dgamma": -100, "hyzer": 5, "nose_up": 0}
+        self.observation = observe(Model(PD0=0.1), self.ics)
+
+    def test_recovers_drag(self):
+        with ModelFitter([self.observation], ["PD0"], max_workers=1) as fitter:
+            fit = fitter.fit([[0.06], [0.14]], bounds=[(0.0, 0.3)])
+        assert abs(fit.values["PD0"] - 0.1) < 2e-3
+        assert fit.error < 1e-2
+        assert len(fit.runs) == 2
+
+    def test_cache_is_shared(self):
+        with ModelFitter([self.observation], ["PD0", "PL0"], max_workers=1) as fitter:
+            fitter.objective_and_gradient([0.08, 0.13])
+            assert fitter.evaluations == 3
+            fitter.objective([0.08, 0.13])
+            assert fitter.evaluations == 3
+
+    def test_evaluate_many(self):
+        points = [[0.08], [0.1], [0.12], [0.1]]
+        with ModelFitter([self.observation], ["PD0"], max_workers=1) as fitter:
+            values = fitter.evaluate_many(points)
+            # the repeated point is flown once
+            assert fitter.evaluations == 3
+            assert values[1] == values[3] == fitter.objective([0.1])
+        assert np.argmin(values) == 1
+
+    def test_flight_numbers(self):
+        nums = {"speed": 9, "glide": 5, "turn": -1, "fade": 2}
+        with ModelFitter([self.observation], ["speed"], flight_numbers=nums, max_workers=1) as fitter:
+            assert fitter.objective([9]) > 0
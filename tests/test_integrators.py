@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.integrators import DOP853, RK45, FixedStepRK4, classify_throw, select_integrator
+from frispy.throw import Throw
+from frispy.wind import ConstantWind
+
+
+class TestIntegrators(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10}
+
+    def test_fixed_step_matches_adaptive(self):
+        d = Disc(Discs.destroyer, self.ics)
+        result = d.compute_trajectory(integrator=FixedStepRK4(0.05))
+        reference = d.compute_trajectory(integrator=DOP853, rtol=1e-8, atol=1e-10)
+        assert abs(result.x[-1] - reference.x[-1]) < 1e-2
+        assert abs(result.y[-1] - reference.y[-1]) < 1e-2
+        assert abs(result.z[-1]) < 1e-9
+        np.testing.assert_allclose(np.diff(result.times[:-1]), 0.05)
+        with self.assertRaises(ValueError):
+            d.compute_trajectory(integrator=FixedStepRK4(0.05), rtol=1e-6)
+
+    def test_classify(self):
+        d = Disc(Discs.destroyer, self.ics)
+        assert classify_throw(d.initial_conditions, d.environment) == "drive"
+        d = Disc(Discs.destroyer, dict(self.ics, vx=10, vz=1))
+        assert classify_throw(d.initial_conditions, d.environment) == "putt"
+        d = Disc(Discs.destroyer, dict(self.ics, dphi=10))
+        assert classify_throw(d.initial_conditions, d.environment) == "wobble"
+        windy = Environment(wind=ConstantWind(np.array([-5, 0, 0])))
+        d = Disc(Discs.destroyer, self.ics, environment=windy)
+        assert classify_throw(d.initial_conditions, d.environment) == "windy"
+
+    def test_auto(self):
+        d = Disc(Discs.destroyer, dict(self.ics, vx=10, vz=1))
+        integrator, options = select_integrator(d.initial_conditions, d.environment)
+        assert isinstance(integrator, FixedStepRK4)
+        result = d.compute_trajectory(integrator="auto")
+        reference = d.compute_trajectory(rtol=1e-8, atol=1e-10)
+        assert abs(result.x[-1] - reference.x[-1]) < 1e-2
+        # tolerances for a putt switch to a backend with error control
+        integrator, options = select_integrator(d.initial_conditions, d.environment, {"rtol": 1e-6})
+        assert integrator is RK45 and options == {"rtol": 1e-6}
+        landing = Throw(v=10, spin=-60).disc(Discs.destroyer).compute_landing(integrator="auto", rtol=1e-6)
+        assert landing.x > 0
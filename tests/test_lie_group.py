@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from frispy import Disc, Discs
+from frispy.lie_group import RKMK45, angular_velocity, dexp_inv, exp_map, quaternion_multiply
+
+
+class TestLieGroup(TestCase):
+    def test_quaternion_helpers(self):
+        p = Rotation.random(random_state=1)
+        q = Rotation.random(random_state=2)
+        product = quaternion_multiply(p.as_quat(), q.as_quat())
+        np.testing.assert_almost_equal(abs(product @ (p * q).as_quat()), 1)
+
+        u = np.array([0.3, -0.2, 0.5])
+        np.testing.assert_almost_equal(exp_map(u), Rotation.from_rotvec(u).as_quat())
+
+        # exp(u + t dexp_inv(u, w)) rotates with angular velocity w at t = 0
+        w = np.array([0.1, 0.7, -0.4])
+        du = dexp_inv(u, w)
+        h = 1e-6
+        dq = (exp_map(u + h * du) - exp_map(u - h * du)) / (2 * h)
+        np.testing.assert_allclose(angular_velocity(dq, exp_map(u)), w, atol=1e-8)
+
+    def test_stays_on_rotation_group(self):
+        d = Disc(Discs.destroyer, {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10, "dphi": -20, "dtheta": 20})
+        result = d.compute_trajectory(5, method=RKMK45, rtol=1e-3, atol=1e-6)
+        norm = np.sqrt(result.qx ** 2 + result.qy ** 2 + result.qz ** 2 + result.qw ** 2)
+        np.testing.assert_allclose(norm, 1, atol=1e-12)
+
+    def test_matches_rk45(self):
+        d = Disc(Discs.destroyer, {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10})
+        result = d.compute_trajectory(method=RKMK45, rtol=1e-6, atol=1e-9)
+        reference = d.compute_trajectory(rtol=1e-6, atol=1e-9)
+        assert abs(result.x[-1] - reference.x[-1]) < 1e-3
+        assert abs(result.y[-1] - reference.y[-1]) < 1e-3
+        assert abs(result.times[-1] - reference.times[-1]) < 1e-4
+
+    def test_no_growth_after_rejection(self):
+        d = Disc(Discs.destroyer, {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10})
+        solver = RKMK45(d.eom.compute_derivatives, 0, d.initial_conditions_as_ordered_list, 5,
+                        rtol=1e-3, atol=1e-6, first_step=0.5)
+        solver.step()
+        assert solver.step_size < 0.5
+        assert solver.h_abs <= solver.step_size
@@ -0,0 +1,50 @@
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Discs, Model
+
+
+class TestModel(TestCase):
+    def setUp(self):
+        self.models = [
+            Model(),
+            Discs.wraith,
+            Discs.destroyer,
+            Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0}),
+            Discs.from_flight_numbers({"speed": 12, "glide": 5, "turn": -2}),
+        ]
+        # every branch boundary of the piecewise definitions and a dense grid
+        edges = [0, 0.28, 0.3, 0.4, Model.stall, Model.neg_stall, math.pi / 2, 80 * math.pi / 180]
+        edges += [math.pi / 6, -math.pi / 6]
+        self.alpha = np.concatenate([
+            np.linspace(-math.pi, math.pi, 2001),
+            edges,
+            -np.array(edges),
+            np.nextafter(edges, 1),
+            np.nextafter(edges, -1),
+        ])
+        self.alpha = self.alpha[np.abs(self.alpha) <= math.pi]
+
+    def test_array_coefficients_match_scalar(self):
+        for model in self.models:
+            alpha0 = model.get_value("alpha_0")
+            alpha = np.concatenate([self.alpha, [alpha0, alpha0 + 0.4]])
+            for name in ("C_lift", "C_drag", "C_y"):
+                scalar = [getattr(model, name)(float(a)) for a in alpha]
+                np.testing.assert_allclose(getattr(model, f"{name}_array")(alpha), scalar, rtol=1e-12, atol=1e-15)
+            np.testing.assert_array_equal(
+                Model.normalizeAlpha_array(alpha), [Model.normalizeAlpha(float(a)) for a in alpha]
+            )
+
+    def test_array_shapes(self):
+        model = self.models[0]
+        alpha = np.linspace(-1, 1, 12).reshape(3, 4)
+        assert model.C_lift_array(alpha).shape == (3, 4)
+        assert model.C_drag_array(0.1).shape == ()
+        assert model.C_drag_array(0.1) == model.C_drag(0.1)
+        side = model.C_side_array(alpha, 20.0, np.full(4, -100.0))
+        np.testing.assert_array_equal(side, [[model.C_side(a, 20.0, -100.0) for a in row] for row in alpha])
+        with self.assertRaises(ValueError):
+            Model.normalizeAlpha_array([0.0, 4.0])
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.integrators import FixedStepRK4
+from frispy.obstacles import Box, Cylinder, ObstacleSet, Plane
+
+
+class TestObstacles(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        self.flight = Disc(Discs.wraith, self.ics).compute_trajectory()
+
+    def fly(self, obstacles, **kwargs):
+        return Disc(Discs.wraith, self.ics, environment=Environment(obstacles=obstacles)).compute_landing(**kwargs)
+
+    def test_distance(self):
+        assert abs(Cylinder(0, 0, 1, top=5).distance(3, 0, 2) - 2) < 1e-12
+        assert abs(Cylinder(0, 0, 1, top=5).distance(0, 0, 8) - 3) < 1e-12
+        assert Cylinder(0, 0, 1, top=5).distance(0.5, 0, 2) < 0
+        assert abs(Box((0, 0, 0), (2, 2, 2)).distance(3, 3, 1) - np.sqrt(2)) < 1e-12
+        assert abs(Plane((0, 0, 4), (0, 0, -2)).distance(5, 5, 1) - 3) < 1e-12
+
+        trees = [Cylinder(x, y, 0.3) for x in range(0, 100, 10) for y in range(-50, 50, 10)]
+        obstacles = ObstacleSet(trees, cell_size=5)
+        rng = np.random.default_rng(0)
+        for x, y, z in rng.uniform([-10, -60, 0], [110, 60, 12], (200, 3)):
+            exact = min(min(tree.distance(x, y, z) for tree in trees), 5)
+            assert abs(obstacles.distance(x, y, z) - exact) < 1e-12
+            assert len(obstacles.candidates(x, y)) <= 9
+
+    def test_collision(self):
+        # a tree in the way half way down the fairway
+        i = np.argmin(np.abs(np.asarray(self.flight.x) - 40))
+        tree = Cylinder(self.flight.x[i], self.flight.y[i], 0.5, top=15, name="oak")
+        away = Cylinder(self.flight.x[i], self.flight.y[i] + 30, 0.5, top=15, name="pine")
+        obstacles = ObstacleSet([away, tree])
+        for kwargs in ({}, {"integrator": FixedStepRK4(0.01)}):
+            landing = self.fly(obstacles, **kwargs)
+            assert landing.obstacle is tree
+            assert abs(tree.distance(*landing.state[:3]) - Discs.wraith.diameter / 2) < 1e-6
+            assert landing.x < self.flight.x[i]
+
+        ceiling = Plane((0, 0, 4), (0, 0, -1), name="ceiling")
+        assert self.fly(ObstacleSet([ceiling])).obstacle is ceiling
+        result = Disc(Discs.wraith, self.ics, environment=Environment(obstacles=ObstacleSet([away]))).compute_trajectory()
+        assert result.obstacle is None
+        assert abs(result.x[-1] - self.flight.x[-1]) < 1e-6
+
+    def test_many_obstacles(self):
+        # hundreds of trees along the fairway, only a few are checked per step
+        forest = ObstacleSet([Cylinder(x, y, 0.3) for x in np.linspace(0, 100, 200) for y in (-40, -30, 30, 40)])
+        assert self.fly(forest).obstacle is None
+        candidates = [len(forest.candidates(x, y)) for x, y in zip(self.flight.x, self.flight.y)]
+        assert max(candidates) < 0.05 * len(forest)
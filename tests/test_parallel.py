@@ -0,0 +1,33 @@
+import os
+from unittest import TestCase
+
+from frispy.parallel import WorkerPool
+
+_offset = None
+
+
+def _init_worker(offset: int) -> None:
+    global _offset
+    _offset = offset
+
+
+def _task(x: int):
+    return x + _offset, os.getpid()
+
+
+class TestWorkerPool(TestCase):
+    def test_inline(self):
+        with WorkerPool(1, initializer=_init_worker, initargs=(10,)) as pool:
+            results = list(pool.map(_task, range(5)))
+        assert [r for r, _ in results] == [10, 11, 12, 13, 14]
+        assert {pid for _, pid in results} == {os.getpid()}
+
+    def test_processes_match_inline(self):
+        with WorkerPool(1, initializer=_init_worker, initargs=(10,)) as pool:
+            inline = [r for r, _ in pool.map(_task, range(20))]
+        with WorkerPool(2, initializer=_init_worker, initargs=(10,)) as pool:
+            results = list(pool.map(_task, range(20), chunksize=3))
+            # the pool is kept between calls
+            assert [r for r, _ in pool.map(_task, range(3))] == [10, 11, 12]
+        assert [r for r, _ in results] == inline
+        assert os.getpid() not in {pid for _, pid in results}
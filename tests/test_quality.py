@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs
+from frispy.integrators import RK45
+from frispy.quality import QUALITY_PRESETS, quality_options
+from frispy.reduced import REDUCED, WOBBLE_AVERAGED
+
+
+class TestQuality(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10}
+
+    def test_standard_is_the_service_setting(self):
+        d = Disc(Discs.destroyer, self.ics)
+        integrator, options = quality_options("standard", d.initial_conditions)
+        assert integrator is RK45
+        assert options == {"rtol": 5e-4, "atol": 1e-7, "max_step": 0.45 / (118 / np.pi / 2)}
+        _, options = quality_options("standard", dict(d.initial_conditions, dgamma=20))
+        assert options["max_step"] == 0.1
+
+    def test_presets(self):
+        d = Disc(Discs.destroyer, self.ics)
+        reference = d.compute_trajectory(quality="reference")
+        hz = 118 / np.pi / 2
+        for quality in QUALITY_PRESETS:
+            result = d.compute_trajectory(quality=quality)
+            assert np.max(np.diff(result.times)) <= 0.45 / hz + 1e-12
+            assert abs(result.z[-1]) < 1e-9
+            assert np.hypot(result.x[-1] - reference.x[-1], result.y[-1] - reference.y[-1]) < 0.05
+
+    def test_preview_with_fast_wobble(self):
+        ics = dict(self.ics, dphi=100, dtheta=100)
+        integrator, _ = quality_options("preview", ics)
+        assert integrator is REDUCED
+        integrator, _ = quality_options("preview", dict(ics, dphi=10, dtheta=0))
+        assert integrator is WOBBLE_AVERAGED
+
+    def test_invalid(self):
+        d = Disc(Discs.destroyer, self.ics)
+        with self.assertRaises(AssertionError):
+            d.compute_trajectory(quality="best")
+        with self.assertRaises(AssertionError):
+            d.compute_trajectory(integrator=RK45, quality="preview")
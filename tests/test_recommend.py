@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from frispy import Discs
+from frispy.recommend import Profile, Recommender, flight_number_catalog
+from frispy.reduced import WOBBLE_AVERAGED
+from frispy.throw import Throw
+
+
+class TestRecommend(TestCase):
+    def setUp(self):
+        self.catalog = {"destroyer": Discs.destroyer, **flight_number_catalog(speeds=[2, 9], glides=[5], turns=[-3, 1])}
+        self.profile = Profile(Throw(v=22, spin=-100, uphill=8), {"hyzer": 5}, samples=4)
+
+    def test_profile(self):
+        same = Profile(Throw(v=22, spin=-100, uphill=8), {"hyzer": 5}, samples=4)
+        assert hash(same) == hash(self.profile) and same == self.profile
+        throws = self.profile.throws()
+        assert len(throws) == 5
+        assert throws[0] == self.profile.throw
+        assert len(Profile(self.profile.throw).throws()) == 1
+
+    def test_rank(self):
+        with Recommender(self.catalog, max_workers=1) as recommender:
+            ratings = recommender.evaluate(self.profile)
+            assert recommender.evaluate(self.profile) is ratings
+            by_distance = recommender.rank(self.profile, limit=2)
+            by_fade = recommender.rank(self.profile, by="fade", target_fade=20)
+        assert [r.name for r in ratings] == list(self.catalog)
+        assert len(by_distance) == 2
+        assert by_distance[0].distance >= by_distance[1].distance
+        assert all(r.spread > 0 for r in ratings)
+        # the overstable disc fades, the understable one turns over
+        stable = next(r for r in ratings if r.name == "9/5/1")
+        flippy = next(r for r in ratings if r.name == "9/5/-3")
+        assert stable.fade > 0 > flippy.fade
+        # the fade is the movement after the apex, not the whole lateral
+        landing = self.profile.throw.disc(self.catalog["9/5/1"]).compute_landing(integrator=WOBBLE_AVERAGED)
+        assert abs(stable.lateral - landing.y) < 1e-9
+        assert abs(stable.fade - (landing.y - landing.apex[1])) < 1e-9
+        assert by_fade[0].fade >= by_fade[-1].fade
+
+    def test_cache(self):
+        other = Profile(self.profile.throw, {"hyzer": 10}, samples=4)
+        with Recommender(self.catalog, max_workers=1, cache_size=1) as recommender:
+            ratings = recommender.evaluate(self.profile)
+            wider = recommender.evaluate(other)
+            # only the last profile is kept
+            again = recommender.evaluate(self.profile)
+            by_spread = recommender.rank(other, by="spread")
+        assert again is not ratings and again == ratings
+        assert all(w.spread > r.spread for w, r in zip(wider, ratings))
+        assert [r.spread for r in by_spread] == sorted(r.spread for r in wider)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.integrators import DOP853
+from frispy.reduced import REDUCED, WOBBLE_AVERAGED, ReducedEOM, ReducedIntegrator
+from frispy.wind import ConstantWind
+
+
+class TestReduced(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 25, "vz": 4, "dgamma": -118, "hyzer": 10, "nose_up": -1}
+
+    def test_derivatives_match_without_wobble(self):
+        d = Disc(Discs.destroyer, self.ics, environment=Environment(wind=ConstantWind(np.array([-3, 2, 0]))))
+        y = np.array(d.initial_conditions_as_ordered_list, dtype=float)
+        full = d.eom.compute_derivatives(0.0, y)
+        eom = ReducedEOM(d.model, d.environment)
+        reduced = eom.compute_derivatives(0.0, eom.reduce(y))
+        np.testing.assert_allclose(reduced[:6], full[:6], atol=1e-12)
+        assert abs(reduced[9] - full[12]) < 1e-12
+
+    def test_landing_matches_without_wobble(self):
+        d = Disc(Discs.destroyer, self.ics)
+        reference = d.compute_landing(integrator=DOP853, rtol=1e-9, atol=1e-11)
+        landing = d.compute_landing(integrator=ReducedIntegrator(rtol=1e-9, atol=1e-11))
+        assert abs(landing.x - reference.x) < 1e-4
+        assert abs(landing.y - reference.y) < 1e-4
+        assert abs(landing.max_height - reference.max_height) < 1e-4
+        # the heading of the quaternion is not tracked, only the normal
+        eom = ReducedEOM(d.model, d.environment)
+        np.testing.assert_allclose(eom.reduce(landing.state), eom.reduce(reference.state), atol=1e-4)
+
+        landing = d.compute_landing(integrator=REDUCED)
+        assert np.hypot(landing.x - reference.x, landing.y - reference.y) < 1e-2
+
+    def test_expand(self):
+        for wobble in (False, True):
+            d = Disc(Discs.destroyer, dict(self.ics, dphi=3 * wobble, dtheta=-2 * wobble))
+            y = np.array(d.initial_conditions_as_ordered_list, dtype=float)
+            eom = ReducedEOM(d.model, d.environment, wobble)
+            expanded = eom.expand(eom.reduce(y)[:, None], y)[:, 0]
+            np.testing.assert_allclose(expanded, y, atol=1e-12)
+
+    def test_wobble_averaged(self):
+        d = Disc(Discs.destroyer, dict(self.ics, dphi=-6, dtheta=6))
+        reference = d.compute_landing(integrator=DOP853, rtol=1e-7, atol=1e-9)
+        averaged = d.compute_landing(integrator=WOBBLE_AVERAGED)
+        dropped = d.compute_landing(integrator=REDUCED)
+        assert np.hypot(averaged.x - reference.x, averaged.y - reference.y) < 0.05
+        assert np.hypot(dropped.x - reference.x, dropped.y - reference.y) > 1
+        # the wobble decays from 8.5 rad/s as in the full model
+        assert abs(np.hypot(*averaged.state[10:12]) - np.hypot(*reference.state[10:12])) < 1e-4
+
+    def test_wobble_faster_than_spin(self):
+        d = Disc(Discs.destroyer, dict(self.ics, dphi=100, dtheta=100))
+        with self.assertRaises(ValueError):
+            d.compute_landing(integrator=WOBBLE_AVERAGED)
+
+    def test_trajectory(self):
+        result = Disc(Discs.destroyer, self.ics).compute_trajectory(integrator=REDUCED)
+        assert abs(result.z[-1]) < 1e-9
+        assert result.x[-1] > 50
+        np.testing.assert_allclose(result.dphi, 0)
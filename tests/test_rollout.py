@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from frispy import Disc, Discs
+from frispy.disc import Landing
+from frispy.obstacles import Cylinder
+from frispy.rollout import Ground, compute_rollout
+
+
+class TestRollout(TestCase):
+    def setUp(self):
+        self.model = Discs.wraith
+
+    def landing(self, velocity, rotation, spin, obstacle=None):
+        state = np.concatenate([[10.0, 2.0, 0.0], velocity, rotation.as_quat(), [0.0, 0.0, spin]])
+        return Landing(x=10.0, y=2.0, time=3.0, state=state, obstacle=obstacle)
+
+    def test_slide(self):
+        landing = self.landing([8.0, 0.0, -2.0], Rotation.identity(), 0.0)
+        rollout = compute_rollout(landing, self.model, Ground(restitution=0.0, friction=0.5))
+        # the impact takes 0.5 * 2 m/s, the slide the rest
+        expected = 7.0 ** 2 / (2 * 0.5 * 9.80665)
+        assert rollout.mode == "slide" and rollout.skips == 0
+        assert abs(rollout.x - 10.0 - expected) < 1e-9 and abs(rollout.y - 2.0) < 1e-9
+        assert abs(rollout.time - 7.0 / (0.5 * 9.80665)) < 1e-9
+
+        bouncy = compute_rollout(landing, self.model, Ground(restitution=0.6, min_skip_speed=0.5))
+        assert bouncy.skips == 2 and bouncy.x > 10.0
+
+        # the spinning rim drags a disc landing nose down sideways
+        tilted = self.landing([8.0, 0.0, -2.0], Rotation.from_euler("Y", 20, degrees=True), -110.0)
+        assert abs(compute_rollout(tilted, self.model).y - 2.0) > 0.1
+
+    def test_roll(self):
+        # on edge with the axis along y, rolling along x
+        edge = Rotation.from_euler("X", 90, degrees=True)
+        k = self.model.I_zz / (self.model.mass * (self.model.diameter / 2) ** 2)
+        ground = Ground(rolling_resistance=0.2)
+        rollout = compute_rollout(self.landing([10.0, 0.0, -1.0], edge, 0.0), self.model, ground)
+        speed = 10.0 / (1 + k)
+        assert rollout.mode == "roll"
+        assert abs(rollout.x - 10.0 - speed ** 2 / (2 * 0.2 * 9.80665)) < 1e-6
+        assert abs(rollout.y - 2.0) < 1e-6
+
+        # spin that matches the speed keeps all of it, the opposite spin brakes
+        spin = 10.0 / (self.model.diameter / 2)
+        rolls = sorted(
+            compute_rollout(self.landing([10.0, 0.0, -1.0], edge, s), self.model, ground).x - 10.0
+            for s in (spin, -spin)
+        )
+        np.testing.assert_allclose(rolls, np.array([(1 - k) / (1 + k), 1.0]) ** 2 * 100 / (2 * 0.2 * 9.80665))
+
+        # a leaning roller curves
+        leaning = compute_rollout(
+            self.landing([10.0, 0.0, -1.0], Rotation.from_euler("X", 75, degrees=True), 0.0), self.model, ground
+        )
+        assert abs(leaning.y - 2.0) > 1.0
+
+    def test_disc(self):
+        disc = Disc(self.model, {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1})
+        rollout = disc.compute_rest()
+        landing = disc.compute_landing()
+        assert rollout.landing.x == landing.x
+        assert 0 < rollout.distance < 30
+
+        stopped = self.landing([8.0, 0.0, -2.0], Rotation.identity(), 0.0, obstacle=Cylinder(11, 2, 0.5))
+        rollout = compute_rollout(stopped, self.model)
+        assert rollout.mode == "stop" and rollout.distance == 0
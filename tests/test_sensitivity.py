@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs
+
+
+class TestSensitivity(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        self.model = Discs.destroyer
+        self.solver_kwargs = {"rtol": 1e-6, "atol": 1e-9}
+
+    def landing(self, ics, model):
+        r = Disc(model, ics).compute_trajectory(**self.solver_kwargs)
+        return np.array([r.x[-1], r.y[-1], r.times[-1]])
+
+    def test_matches_finite_differences(self):
+        d = Disc(self.model, self.ics)
+        s = d.compute_landing_sensitivity(["hyzer", "PD0"], **self.solver_kwargs)
+        np.testing.assert_allclose(s.landing, self.landing(self.ics, self.model), rtol=1e-4)
+
+        up = dict(self.ics, hyzer=8.01)
+        down = dict(self.ics, hyzer=7.99)
+        expected = (self.landing(up, self.model) - self.landing(down, self.model)) / 0.02
+        np.testing.assert_allclose(s.jacobian[:, 0], expected, rtol=1e-2, atol=1e-3)
+
+        pd0 = self.model.get_value("PD0")
+        up = self.model.with_coefficients(PD0=pd0 + 1e-4)
+        down = self.model.with_coefficients(PD0=pd0 - 1e-4)
+        expected = (self.landing(self.ics, up) - self.landing(self.ics, down)) / 2e-4
+        np.testing.assert_allclose(s.jacobian[:, 1], expected, rtol=1e-2)
+
+    def test_as_dict(self):
+        s = Disc(self.model, self.ics).compute_landing_sensitivity(["vx"])
+        sens = s.as_dict()
+        assert set(sens) == {"x", "y", "t"}
+        # throwing faster goes further
+        assert sens["x"]["vx"] > 0
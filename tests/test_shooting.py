@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Discs
+from frispy.shooting import shooting_table, solve_release
+from frispy.throw import Throw
+
+
+class TestShooting(TestCase):
+    def setUp(self):
+        self.model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        self.throw = Throw(v=12, spin=-60, uphill=3)
+
+    def test_solve_with_table(self):
+        table = shooting_table(self.model, self.throw, {"hyzer": np.linspace(-20, 20, 5),
+                                                        "nose_up": np.linspace(-6, 6, 4)}, max_workers=1)
+        landing = self.throw.replace(hyzer=7, nose_up=2).disc(self.model).compute_landing(integrator="auto")
+        result = solve_release(self.model, self.throw, (landing.x, landing.y), table=table, tolerance=0.05)
+        assert result.converged
+        assert result.flights <= 8
+        assert result.error < 0.05
+        assert np.hypot(result.landing.x - landing.x, result.landing.y - landing.y) == result.error
+
+    def test_solve_without_table(self):
+        landing = self.throw.replace(hyzer=5).disc(self.model).compute_landing(integrator="auto")
+        result = solve_release(self.model, self.throw, (landing.x, landing.y))
+        assert result.converged
+        assert result.error < 0.1
+
+    def test_ceiling(self):
+        axes = {"hyzer": np.linspace(-20, 20, 3), "nose_up": np.linspace(-6, 6, 3), "uphill": np.linspace(0, 10, 3)}
+        table = shooting_table(self.model, self.throw, axes, max_workers=1)
+        low = self.throw.replace(hyzer=5, uphill=1).disc(self.model).compute_landing(integrator="auto")
+        result = solve_release(self.model, self.throw, (low.x, low.y), parameters=tuple(axes), table=table,
+                               ceiling=low.max_height + 0.2)
+        assert result.converged
+        assert result.landing.max_height <= low.max_height + 0.2
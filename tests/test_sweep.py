@@ -0,0 +1,80 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Discs
+from frispy.integrators import FixedStepRK4
+from frispy.sweep import Sweep, SweepResult
+from frispy.throw import Throw
+
+
+class TestSweep(TestCase):
+    def setUp(self):
+        self.model = Discs.from_flight_numbers({"speed": 2, "glide": 3, "turn": 0})
+        self.throw = Throw(v=12, spin=-60, uphill=3)
+        self.axes = {"mass": [0.165, 0.175], "hyzer": [-10, 0, 10]}
+
+    def test_run(self):
+        with Sweep(self.model, self.throw, self.axes, max_workers=1, chunk_size=2) as sweep:
+            result = sweep.run()
+        assert result.complete
+        assert result.values.shape == (2, 3, 4)
+        landing = self.throw.replace(hyzer=10).disc(self.model.with_coefficients(mass=0.175)).compute_landing(
+            integrator="auto")
+        assert result["distance"][1, 2] == landing.x
+        assert result["max_height"][1, 2] == landing.max_height
+        heavy = result.sel(mass=0.175)
+        assert list(heavy.axes) == ["hyzer"]
+        np.testing.assert_array_equal(heavy["lateral"], result["lateral"][1])
+        assert result.argmax("distance")["mass"] in (0.165, 0.175)
+
+    def test_reused_disc_matches_single_flights(self):
+        # the worker keeps its disc while only release parameters change
+        axes = {"wind_speed": [0, 3], "hyzer": [-10, 10], "v": [11, 13]}
+        with Sweep(self.model, self.throw, axes, metrics=["distance"], max_workers=1, chunk_size=8) as sweep:
+            result = sweep.run()
+        for index in np.ndindex(result.shape):
+            throw = self.throw.replace(**result.point(index))
+            landing = throw.disc(self.model).compute_landing(integrator="auto")
+            assert result["distance"][index] == landing.x
+
+    def test_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweep.npz")
+            with Sweep(self.model, self.throw, self.axes, max_workers=1, chunk_size=2) as sweep:
+                partial = next(sweep.stream(checkpoint=path, checkpoint_every=1))
+                assert not partial.complete
+                saved = SweepResult.load(path)
+                assert saved.done.sum() == 2
+                result = sweep.run(checkpoint=path)
+            assert result.complete
+            with Sweep(self.model, self.throw, self.axes, max_workers=1) as sweep:
+                np.testing.assert_array_equal(sweep.run().values, result.values)
+
+    def test_failed_points_are_not_done(self):
+        # without a step the fixed step backend fails every flight
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweep.npz")
+            with Sweep(self.model, self.throw, self.axes, integrator=FixedStepRK4(), max_workers=1) as sweep:
+                with self.assertLogs(level="ERROR"):
+                    result = sweep.run(checkpoint=path)
+            assert not result.done.any()
+            assert np.isnan(result.values).all()
+            assert not SweepResult.load(path).done.any()
+
+    def test_checkpoint_of_other_throw(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweep.npz")
+            with Sweep(self.model, self.throw, self.axes, max_workers=1) as sweep:
+                sweep.run(checkpoint=path)
+            faster = self.throw.replace(v=14)
+            with Sweep(self.model, faster, self.axes, max_workers=1, chunk_size=2) as sweep:
+                with self.assertLogs(level="WARNING"):
+                    partial = next(sweep.stream(checkpoint=path, checkpoint_every=1))
+                assert partial.done.sum() == 2
+                result = sweep.run(checkpoint=path)
+            landing = faster.replace(hyzer=10).disc(self.model.with_coefficients(mass=0.175)).compute_landing(
+                integrator="auto")
+            assert result["distance"][1, 2] == landing.x
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs
+from frispy.tabulated import TabulatedModel
+
+
+class TestTabulatedModel(TestCase):
+    def setUp(self):
+        self.model = Discs.wraith
+        self.coefficients = {
+            k: v for k, v in self.model.coefficients.items() if k not in self.model.derived_coefficients
+        }
+        # the fitted formulas sampled every degree, as a wind tunnel would
+        self.alpha = np.arange(-90, 91, 1.0)
+        a = np.radians(self.alpha)
+        self.polars = {
+            "lift": (a, self.model.C_lift_array(a)),
+            "drag": (a, self.model.C_drag_array(a)),
+            "pitch": (a, self.model.C_y_array(a)),
+        }
+
+    def test_matches_polars(self):
+        tabulated = TabulatedModel(self.polars, **self.coefficients)
+        assert tabulated.polars == ["C_lift", "C_drag", "C_y"]
+        # away from the jumps of the formulas at stall
+        alpha = np.radians(np.linspace(-35, 35, 301))
+        for name in ("C_lift", "C_drag", "C_y"):
+            expected = getattr(self.model, f"{name}_array")(alpha)
+            np.testing.assert_allclose(getattr(tabulated, f"{name}_array")(alpha), expected, atol=2e-3)
+            np.testing.assert_allclose([getattr(tabulated, name)(a) for a in alpha], expected, atol=2e-3)
+
+        ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        expected = Disc(self.model, ics).compute_landing()
+        landing = Disc(tabulated, ics).compute_landing()
+        assert abs(landing.x - expected.x) < 0.1 and abs(landing.y - expected.y) < 0.1
+
+    def test_content_hash(self):
+        tabulated = TabulatedModel(self.polars, **self.coefficients)
+        lift = self.polars["lift"]
+        steeper = TabulatedModel(dict(self.polars, lift=(lift[0], 1.1 * lift[1])), **self.coefficients)
+        assert tabulated.content_hash == TabulatedModel(self.polars, **self.coefficients).content_hash
+        assert tabulated.content_hash != steeper.content_hash
+        assert tabulated.content_hash != self.model.content_hash
+        # a frozen copy would drop the polars
+        with self.assertRaises(TypeError):
+            tabulated.freeze()
+
+    def test_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "polars.csv")
+            with open(path, "w") as f:
+                f.write("alpha,lift,drag\n")
+                for a, lift, drag in zip(self.alpha, self.polars["lift"][1], self.polars["drag"][1]):
+                    # drag measured every other degree only
+                    f.write(f"{a},{lift},{drag if a % 2 == 0 else ''}\n")
+            tabulated = TabulatedModel.from_csv(path, **self.coefficients)
+
+        assert tabulated.polars == ["C_lift", "C_drag"]
+        assert tabulated.C_y(0.1) == self.model.C_y(0.1)
+        assert abs(tabulated.C_lift(0.1) - self.model.C_lift(0.1)) < 1e-3
+        assert abs(tabulated.C_drag(0.1) - self.model.C_drag(0.1)) < 1e-3
+        heavier = tabulated.with_coefficients(mass=0.2)
+        assert heavier.mass == 0.2 and heavier.C_lift(0.1) == tabulated.C_lift(0.1)
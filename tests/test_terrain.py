@@ -0,0 +1,61 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.terrain import Terrain
+
+
+class TestTerrain(TestCase):
+    def setUp(self):
+        self.ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        x, y = np.meshgrid(np.arange(-20, 200, 2.0), np.arange(-60, 60, 3.0), indexing="ij")
+        self.terrain = Terrain(-0.1 * x + 0.02 * y, origin=(-20, -60), spacing=(2, 3))
+
+    def test_bilinear(self):
+        rng = np.random.default_rng(0)
+        x, y = rng.uniform(-20, 196, 40), rng.uniform(-60, 55, 40)
+        expected = -0.1 * x + 0.02 * y
+        np.testing.assert_allclose([self.terrain.height(a, b) for a, b in zip(x, y)], expected, atol=1e-12)
+        np.testing.assert_allclose(self.terrain.heights_at(x, y), expected, atol=1e-12)
+        np.testing.assert_allclose(self.terrain.gradient(50.3, 7.1), (-0.1, 0.02), atol=1e-12)
+        assert self.terrain.height(-100, 0) == self.terrain.height(-20, 0)
+
+    def test_landing(self):
+        flat = Disc(Discs.wraith, self.ics).compute_landing()
+        disc = Disc(Discs.wraith, self.ics, environment=Environment(terrain=self.terrain))
+        downhill = disc.compute_landing()
+        assert downhill.x > flat.x + 2
+        assert abs(downhill.state[2] - self.terrain.height(downhill.x, downhill.y)) < 1e-6
+        assert Terrain.plane().height(30, 4) == 0
+        plane = Disc(Discs.wraith, self.ics, environment=Environment(terrain=Terrain.plane(-0.1, 0.02)))
+        assert abs(plane.compute_landing().x - downhill.x) < 1e-6
+
+    def test_sensitivity(self):
+        parameters = ["vx", "hyzer"]
+        disc = Disc(Discs.wraith, self.ics, environment=Environment(terrain=self.terrain))
+        s = disc.compute_landing_sensitivity(parameters, rtol=1e-9, atol=1e-12)
+        for k, name in enumerate(parameters):
+            up, down = dict(self.ics), dict(self.ics)
+            up[name] += 1e-3
+            down[name] -= 1e-3
+            landings = [
+                Disc(Discs.wraith, ics, environment=Environment(terrain=self.terrain)).compute_landing(
+                    rtol=1e-9, atol=1e-12
+                )
+                for ics in (up, down)
+            ]
+            dx = (landings[0].x - landings[1].x) / 2e-3
+            assert abs(s.jacobian[0, k] - dx) < 1e-2 * max(abs(dx), 1)
+
+    def test_memory_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "course.npy")
+            self.terrain.save(path)
+            terrain = pickle.loads(pickle.dumps(Terrain.load(path)))
+            assert isinstance(terrain.heights, np.memmap)
+            assert abs(terrain.height(10, 10) - self.terrain.height(10, 10)) < 1e-12
+            del terrain
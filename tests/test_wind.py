@@ -0,0 +1,104 @@
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from frispy import Disc, Discs, Environment
+from frispy.wind import ConstantWind, GridWind, GustWind
+
+
+class TestGridWind(TestCase):
+    def setUp(self):
+        # a linear field, which trilinear interpolation reproduces exactly
+        self.origin = np.array([-10.0, -20.0, 0.0])
+        self.spacing = np.array([5.0, 4.0, 0.5])
+        x, y, z = np.meshgrid(
+            *(self.origin[k] + self.spacing[k] * np.arange(n) for k, n in enumerate((30, 11, 41))),
+            indexing="ij",
+        )
+        self.vectors = np.stack([1 + 0.02 * x + 0.3 * z, -0.1 * y, 0.01 * x - 0.02 * y], axis=-1)
+        self.wind = GridWind(self.vectors, self.origin, self.spacing)
+
+    def field(self, p):
+        x, y, z = p
+        return np.array([1 + 0.02 * x + 0.3 * z, -0.1 * y, 0.01 * x - 0.02 * y])
+
+    def test_interpolation(self):
+        rng = np.random.default_rng(0)
+        points = rng.uniform([-10, -20, 0], [135, 20, 20], (50, 3))
+        expected = np.array([self.field(p) for p in points])
+        np.testing.assert_allclose([self.wind.get_wind_vector(0, p) for p in points], expected, atol=1e-12)
+        np.testing.assert_allclose(self.wind.get_wind_vectors(0, points), expected, atol=1e-12)
+        # the nearest edge outside the grid
+        np.testing.assert_allclose(self.wind.get_wind_vector(0, [-50, 0, -1]), self.field([-10, 0, 0]))
+
+    def test_profile_and_time(self):
+        # vertical profile, doubling between the two times
+        heights = np.linspace(0, 10, 11)
+        profile = np.zeros((2, 1, 1, 11, 3))
+        profile[0, 0, 0, :, 0] = heights
+        profile[1, 0, 0, :, 0] = 2 * heights
+        wind = GridWind(profile, spacing=(1, 1, 1), time_step=2.0)
+        np.testing.assert_allclose(wind.get_wind_vector(1.0, [30, -4, 2.5]), [3.75, 0, 0])
+        np.testing.assert_allclose(
+            wind.get_wind_vectors(np.array([0.0, 2.0]), np.array([[0, 0, 2.5], [5, 5, 2.5]])),
+            [[2.5, 0, 0], [5, 0, 0]],
+        )
+
+    def test_memory_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "wind.npy")
+            self.wind.save(path)
+            wind = GridWind.load(path)
+            assert isinstance(wind.vectors, np.memmap)
+            copy = pickle.loads(pickle.dumps(wind))
+            assert isinstance(copy.vectors, np.memmap)
+            np.testing.assert_allclose(copy.get_wind_vector(0, [3, 2, 1]), self.field([3, 2, 1]))
+            del wind, copy
+
+    def test_flight(self):
+        ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        vector = np.array([-3.0, 1.0, 0.0])
+        grid = GridWind(np.broadcast_to(vector, (2, 2, 2, 3)), origin=(0, -50, 0), spacing=(200, 100, 50))
+        expected = Disc(Discs.wraith, ics, environment=Environment(wind=ConstantWind(vector))).compute_landing()
+        landing = Disc(Discs.wraith, ics, environment=Environment(wind=grid)).compute_landing()
+        assert abs(landing.x - expected.x) < 1e-6 and abs(landing.y - expected.y) < 1e-6
+
+
+class TestGustWind(TestCase):
+    def setUp(self):
+        self.mean = np.array([-5.0, 3.0, 0.0])
+
+    def test_statistics(self):
+        winds = GustWind.realizations(100, seed=1, mean=self.mean, duration=60)
+        wind = winds[0]
+        gusts = np.stack([w.get_wind_vectors(np.arange(0, 60, 0.01)) for w in winds]) - self.mean
+        components = gusts @ wind._frame.T
+        np.testing.assert_allclose(components.std(axis=(0, 1)), wind.intensity, rtol=0.05)
+        np.testing.assert_allclose(components.mean(axis=(0, 1)), 0, atol=0.05)
+        # Dryden u gusts decorrelate as exp(-V t / L)
+        lag = int(round(wind.length_scale[0] / wind.reference_speed / wind.time_step))
+        u = components[..., 0]
+        assert abs((u * np.roll(u, -lag, axis=1)).mean() / u.var() - np.exp(-1)) < 0.08
+        assert not np.allclose(winds[0].get_wind_vector(1.0), winds[1].get_wind_vector(1.0))
+
+    def test_lookup(self):
+        wind = GustWind(self.mean, intensity=1.0, length_scale=10.0, spectrum="von_karman", seed=3)
+        same = GustWind(self.mean, intensity=1.0, length_scale=10.0, spectrum="von_karman", seed=3)
+        t = np.array([0.0, 0.004, 1.2345, 19.999, 25.0, -1.0])
+        expected = [wind.get_wind_vector(x, None) for x in t]
+        np.testing.assert_allclose(wind.get_wind_vectors(t), expected)
+        np.testing.assert_allclose(same.get_wind_vectors(t), expected)
+        # periodic
+        np.testing.assert_allclose(wind.get_wind_vector(25.0), wind.get_wind_vector(5.0))
+
+    def test_flight(self):
+        ics = {"vx": 24, "vz": 4, "dgamma": -110, "hyzer": 8, "nose_up": -1}
+        calm = GustWind(self.mean, intensity=0.0, seed=0)
+        expected = Disc(Discs.wraith, ics, environment=Environment(wind=ConstantWind(self.mean))).compute_landing()
+        landing = Disc(Discs.wraith, ics, environment=Environment(wind=calm)).compute_landing()
+        assert abs(landing.x - expected.x) < 1e-6 and abs(landing.y - expected.y) < 1e-6
+        gusty = Disc(Discs.wraith, ics, environment=Environment(wind=GustWind(self.mean, seed=0))).compute_landing()
+        assert abs(gusty.x - expected.x) + abs(gusty.y - expected.y) > 0.01